@@ -13,7 +13,7 @@ import subprocess
 import re
 import time
 import os
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import threading
 import queue
 from collections import defaultdict, deque
@@ -310,11 +310,14 @@ class AudioDeviceManager:
         with self.device_lock:
             return self.output_devices.get(channel)
     
-    def create_input_stream(self, stream_id: Optional[str] = None) -> Optional[pyaudio.Stream]:
+    def create_input_stream(self, stream_id: Optional[str] = None,
+                            callback: Optional[Callable] = None) -> Optional[pyaudio.Stream]:
         """Create audio input stream for recording with enhanced error handling.
         
         Args:
             stream_id: Optional stream identifier for tracking
+            callback: Optional PyAudio stream callback; opens the stream in
+                callback mode instead of blocking mode
             
         Returns:
             PyAudio stream for recording, or None if not available
@@ -346,6 +349,10 @@ class AudioDeviceManager:
                     'stream_callback': None  # Use blocking mode for more reliable operation
                 })
             
+            # Callback mode: PortAudio hands each buffer to the callback
+            if callback is not None:
+                stream_params['stream_callback'] = callback
+            
             stream = self.pyaudio_instance.open(**stream_params)
             
             # Test the stream briefly
@@ -14,18 +14,107 @@ Multi-level filtering system with:
 """
 
 import logging
+import logging.handlers
+import queue
 import re
 import json
+import functools
+import hashlib
+import pickle
 import time
 import threading
-from typing import List, Dict, Optional, Set, Callable, Tuple
+from typing import List, Dict, Optional, Set, FrozenSet, Callable, Tuple, Union, Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 import os
-import shutil
+import stat
 import statistics
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+from utils.file_manager import claim_unique_path
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import marisa_trie
+    MARISA_TRIE_AVAILABLE = True
+except ImportError:
+    MARISA_TRIE_AVAILABLE = False
+
+def _json_dumps_pretty(data):
+    """Serialize data as indented JSON (bytes with orjson, str otherwise)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2)
+
+
+def _json_dumps_line(data) -> str:
+    """Serialize data as single-line JSON text."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data)
+
+
+# Sentence boundaries used by the coherence assessment
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Maximal runs of word characters; a word made only of word characters
+# matches \bword\b exactly when it is one of these tokens
+_WORD_TOKEN_RE = re.compile(r'\w+')
+
+# Word lists at least this long are stored in a marisa-trie when available;
+# smaller ones stay frozensets, where hashing beats the trie walk
+_TRIE_MIN_WORDS = 1000
+
+# Term automatons over at least this many terms are cached in a private
+# directory under temp; smaller ones build faster than they load
+_AUTOMATON_CACHE_MIN_TERMS = 128
+
+# Escapes and anchors whose meaning differs between RE2 (ASCII, $ only at
+# the very end) and re (Unicode, $ also before a trailing newline)
+_PERL_CLASS_RE = re.compile(r'\\[wWdDsSbB]|\$')
+
+# Punctuation counted by the intelligibility assessment
+_PUNCTUATION_TABLE = str.maketrans('', '', '.,!?;:-')
+
+# Common function words used as a basic grammar indicator
+_FUNCTION_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with'})
+
+# Overall score penalty per content filter hit, by category
+_CATEGORY_WEIGHTS = {'profanity': 0.3, 'sensitive': 0.2, 'custom': 0.25}
+
+# Quality below this fails every mode that does not accept everything
+_VERY_POOR_QUALITY_SCORE = 0.3
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if char matches \\w in a str pattern."""
+    return char.isalnum() or char == '_'
+
 
 class FilterMode(Enum):
     """Content filter modes."""
@@ -47,6 +136,84 @@ class FilterCategory(Enum):
     CONFIDENCE = "confidence"
 
 
+class BufferedAuditHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler for the audit log that defers flushing.
+    
+    Records are written into a large userspace buffer and flushed once
+    flush_records entries are pending or flush_interval seconds have passed
+    since the last flush, instead of once per record. The file size is
+    tracked as records are written, so rollover checks never force a flush.
+    """
+    
+    def __init__(self, filename: str, flush_interval: float = 0.5, flush_records: int = 100,
+                 buffer_size: int = 64 * 1024, max_bytes: int = 0, backup_count: int = 0):
+        """
+        Initialize buffered audit handler.
+        
+        Args:
+            filename: Audit log file path
+            flush_interval: Maximum seconds a record may stay buffered
+            flush_records: Number of pending records that forces a flush
+            buffer_size: Size of the file write buffer in bytes
+            max_bytes: Approximate size at which the log is rotated (0 disables rotation)
+            backup_count: Number of rotated logs to keep
+        """
+        self.flush_interval = flush_interval
+        self.flush_records = flush_records
+        self.buffer_size = buffer_size
+        self.pending_records = 0
+        self.stream_size = 0
+        self.last_flush = time.monotonic()
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    
+    def _open(self):
+        """Open the audit log with a large write buffer."""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+        try:
+            self.stream_size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self.stream_size = 0
+        return stream
+    
+    def emit(self, record: logging.LogRecord):
+        """Write a record to the buffer, flushing only when due."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            
+            # Character count approximates bytes for the mostly-ASCII audit log
+            if self.maxBytes > 0 and self.stream_size and self.stream_size + len(msg) > self.maxBytes:
+                self.doRollover()
+                self.pending_records = 0
+                self.last_flush = time.monotonic()
+            
+            self.stream.write(msg)
+            self.stream_size += len(msg)
+            self.pending_records += 1
+            if self.pending_records >= self.flush_records:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Flush buffered records to disk."""
+        self.acquire()
+        try:
+            if self.stream and self.pending_records:
+                self.stream.flush()
+            self.pending_records = 0
+            self.last_flush = time.monotonic()
+        finally:
+            self.release()
+    
+    def flush_if_due(self):
+        """Flush if records have been buffered longer than flush_interval."""
+        if self.pending_records and time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+
 class ContentFilter:
     """
     Content filter for speech transcript processing.
@@ -70,26 +237,35 @@ class ContentFilter:
         
         # Filter modes and settings
         self.filter_mode = FilterMode(self.filter_config.get('mode', 'strict'))
+        self._build_acceptability()
         self.case_sensitive = self.filter_config.get('case_sensitive', False)
         self.emergency_bypass = False
         self.maintenance_mode = False
         
         # Load filtered content by category
-        self.filtered_content: Dict[FilterCategory, Set[str]] = {
-            FilterCategory.PROFANITY: set(),
-            FilterCategory.SENSITIVE: set(), 
-            FilterCategory.CUSTOM: set()
+        self.filtered_content: Dict[FilterCategory, FrozenSet[str]] = {
+            FilterCategory.PROFANITY: frozenset(),
+            FilterCategory.SENSITIVE: frozenset(), 
+            FilterCategory.CUSTOM: frozenset()
         }
-        self.filtered_phrases: Dict[FilterCategory, Set[str]] = {
-            FilterCategory.PROFANITY: set(),
-            FilterCategory.SENSITIVE: set(),
-            FilterCategory.CUSTOM: set()
+        self.filtered_phrases: Dict[FilterCategory, FrozenSet[str]] = {
+            FilterCategory.PROFANITY: frozenset(),
+            FilterCategory.SENSITIVE: frozenset(),
+            FilterCategory.CUSTOM: frozenset()
         }
         self.regex_patterns: Dict[FilterCategory, List[re.Pattern]] = {
             FilterCategory.PROFANITY: [],
             FilterCategory.SENSITIVE: [],
             FilterCategory.CUSTOM: []
         }
+        self._token_words: Dict[FilterCategory, Union[FrozenSet[str], 'marisa_trie.Trie']] = {}
+        self._complex_words: Dict[FilterCategory, List[Tuple[str, re.Pattern]]] = {}
+        self._term_unions: Dict[FilterCategory, re.Pattern] = {}
+        self._phrase_buckets: Dict[FilterCategory, List[Tuple[str, List[str]]]] = {}
+        self._term_anchors: FrozenSet[str] = frozenset()
+        self._unanchored_terms: Optional[re.Pattern] = None
+        self._min_term_len = 0
+        self._filter_content_hash: Optional[str] = None
         
         # Quality assessment settings
         self.quality_config = self.filter_config.get('quality_assessment', {})
@@ -98,31 +274,37 @@ class ContentFilter:
         self.min_confidence_threshold = self.quality_config.get('min_confidence', 0.5)
         self.intelligibility_threshold = self.quality_config.get('intelligibility_threshold', 0.6)
         
+        # Skip content matching for transcripts that fail on quality alone
+        self.early_reject = self.filter_config.get('early_reject', False)
+        
         # Channel-specific overrides
         self.channel_overrides = self.filter_config.get('channel_overrides', {})
-        
-        # Load filtered content
-        self._load_filtered_content()
+        self._build_channel_rules()
         
         # File paths
         self.bin_dir = config.get('paths', {}).get('bin', './bin')
         self.playable_dir = config.get('paths', {}).get('playable', './playable')
         self.recordings_dir = config.get('paths', {}).get('recordings', './recordings')
         self.transcripts_dir = config.get('paths', {}).get('transcripts', './transcripts')
+        self.temp_dir = config.get('paths', {}).get('temp', './temp')
         
-        # Statistics and audit trail
-        self.filter_stats = {
-            'total_processed': 0,
-            'total_filtered': 0,
-            'total_accepted': 0,
-            'by_channel': {f'channel_{i}': {'processed': 0, 'filtered': 0, 'accepted': 0} for i in range(1, 6)},
-            'by_category': {cat.value: 0 for cat in FilterCategory},
-            'start_time': datetime.now()
-        }
+        # Load filtered content (the term automaton cache lives in temp_dir)
+        self._load_filtered_content()
         
         # Threading and performance
+        # processing_lock only serializes emergency/maintenance processing;
+        # normal filtering runs concurrently and claims file names atomically
         self.processing_lock = threading.Lock()
         self.stats_lock = threading.Lock()
+        self._thread_local = threading.local()
+        
+        # Statistics: each thread counts into its own shard without locking;
+        # shards are summed when statistics are read
+        self._stats_shards: List[Dict] = []
+        self._stats_start_time = datetime.now()
+        self.filter_workers = self.filter_config.get('filter_workers', os.cpu_count() or 1)
+        self._filter_pool = ThreadPoolExecutor(max_workers=self.filter_workers, thread_name_prefix="ContentFilter",
+                                               initializer=self._mark_filter_worker)
         
         # Callbacks
         self.filter_callback: Optional[Callable] = None
@@ -130,24 +312,144 @@ class ContentFilter:
         
         # Ensure directories exist
         self._create_directories()
+        self._check_route_filesystems()
+        
+        # basename -> (status, channel, location) for routed audio files
+        self._file_index: Dict[str, Tuple[str, int, str]] = {}
+        self._file_index_lock = threading.Lock()
+        self._build_file_index()
         
         # Create audit log
         self._setup_audit_logging()
+        
+        # Background writer for transcript and JSON sidecar files; queued
+        # contents stay readable by path until they are on disk
+        self._pending_writes: Dict[str, object] = {}
+        self._pending_writes_lock = threading.Lock()
+        self._io_queue: queue.Queue = queue.Queue(maxsize=self.filter_config.get('io_queue_size', 64))
+        self._io_thread = threading.Thread(target=self._io_worker, name="ContentFilterIO", daemon=True)
+        self._io_thread.start()
+    
+    def _io_worker(self):
+        """Run queued file jobs until a None sentinel is received."""
+        while True:
+            job = self._io_queue.get()
+            try:
+                if job is None:
+                    break
+                
+                func, args = job
+                func(*args)
+                    
+            except Exception as e:
+                self.logger.error(f"Background file job failed for {job[1][0]}: {e}")
+            finally:
+                self._io_queue.task_done()
+    
+    def _write_file(self, path: str, data):
+        """
+        Write a transcript or sidecar file.
+        
+        Uses the raw file descriptor API, so each file costs an open, a write
+        and a close without building a buffered text stream.
+        
+        Args:
+            path: Destination file path
+            data: File contents (str or bytes)
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    def _write_files(self, writes: List[Tuple[str, object]]):
+        """
+        Write all sidecar files for one transcript.
+        
+        Args:
+            writes: List of (path, data) pairs
+        """
+        for path, data in writes:
+            try:
+                self._write_file(path, data)
+            except Exception as e:
+                self.logger.error(f"Failed to write {path}: {e}")
+            finally:
+                with self._pending_writes_lock:
+                    # A later job may have queued new contents for the path
+                    if self._pending_writes.get(path) is data:
+                        del self._pending_writes[path]
+    
+    def _queue_writes(self, writes: List[Tuple[str, object]]):
+        """
+        Queue one transcript's sidecar files as a single background job.
+        
+        Falls back to writing synchronously once the I/O thread has stopped.
+        
+        Args:
+            writes: List of (path, data) pairs
+        """
+        if not writes:
+            return
+        
+        if self._io_thread.is_alive():
+            with self._pending_writes_lock:
+                self._pending_writes.update(writes)
+            self._io_queue.put((self._write_files, (writes,)))
+            return
+        
+        self._write_files(writes)
+    
+    def flush_pending_writes(self):
+        """Block until all queued file writes have completed."""
+        self._io_queue.join()
+    
+    def _sidecar_exists(self, path: str) -> bool:
+        """Check whether a sidecar file exists or is queued for writing."""
+        with self._pending_writes_lock:
+            if path in self._pending_writes:
+                return True
+        return os.path.exists(path)
+    
+    def _read_sidecar_json(self, path: str) -> Optional[Dict]:
+        """
+        Load a JSON sidecar file, from its queued contents if not yet written.
+        
+        Args:
+            path: Sidecar file path
+            
+        Returns:
+            Parsed JSON, or None if the file neither exists nor is queued
+        """
+        with self._pending_writes_lock:
+            data = self._pending_writes.get(path)
+        if data is not None:
+            return json.loads(data)
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
     
     def _load_filtered_content(self):
         """Load filtered words, phrases, and patterns from configuration."""
         try:
-            # Load basic filtered words (legacy support)
-            filtered_words = self.filter_config.get('filtered_words', [])
-            for word in filtered_words:
-                processed_word = word.lower() if not self.case_sensitive else word
-                self.filtered_content[FilterCategory.PROFANITY].add(processed_word.strip())
-            
-            # Load basic filtered phrases (legacy support)
-            filtered_phrases = self.filter_config.get('filtered_phrases', [])
-            for phrase in filtered_phrases:
-                processed_phrase = phrase.lower() if not self.case_sensitive else phrase
-                self.filtered_phrases[FilterCategory.PROFANITY].add(processed_phrase.strip())
+            content_categories = [FilterCategory.PROFANITY, FilterCategory.SENSITIVE, FilterCategory.CUSTOM]
+            
+            # Gather raw terms per category; legacy lists belong to profanity
+            word_sources: Dict[FilterCategory, List[str]] = {cat: [] for cat in content_categories}
+            phrase_sources: Dict[FilterCategory, List[str]] = {cat: [] for cat in content_categories}
+            regex_patterns: Dict[FilterCategory, List[re.Pattern]] = {cat: [] for cat in content_categories}
+            
+            word_sources[FilterCategory.PROFANITY].extend(self.filter_config.get('filtered_words', []))
+            phrase_sources[FilterCategory.PROFANITY].extend(self.filter_config.get('filtered_phrases', []))
             
             # Load categorized content
             categories_config = self.filter_config.get('categories', {})
@@ -158,17 +460,8 @@ class ContentFilter:
                     self.logger.warning(f"Unknown filter category: {category_name}")
                     continue
                 
-                # Load words for this category
-                words = category_config.get('words', [])
-                for word in words:
-                    processed_word = word.lower() if not self.case_sensitive else word
-                    self.filtered_content[category].add(processed_word.strip())
-                
-                # Load phrases for this category
-                phrases = category_config.get('phrases', [])
-                for phrase in phrases:
-                    processed_phrase = phrase.lower() if not self.case_sensitive else phrase
-                    self.filtered_phrases[category].add(processed_phrase.strip())
+                word_sources.setdefault(category, []).extend(category_config.get('words', []))
+                phrase_sources.setdefault(category, []).extend(category_config.get('phrases', []))
                 
                 # Load regex patterns for this category
                 patterns = category_config.get('patterns', [])
@@ -176,26 +469,626 @@ class ContentFilter:
                     try:
                         flags = re.IGNORECASE if not self.case_sensitive else 0
                         compiled_pattern = re.compile(pattern, flags)
-                        self.regex_patterns[category].append(compiled_pattern)
+                        regex_patterns.setdefault(category, []).append(compiled_pattern)
                     except re.error as e:
                         self.logger.error(f"Invalid regex pattern '{pattern}': {e}")
             
+            # Normalize once per term and swap in the new sets, so a reload
+            # drops removed terms and readers never see a half-built set
+            self.filtered_content = {cat: self._normalize_terms(terms) for cat, terms in word_sources.items()}
+            self.filtered_phrases = {cat: self._normalize_terms(terms) for cat, terms in phrase_sources.items()}
+            self.regex_patterns = regex_patterns
+            
+            # Plain words are matched by token set intersection, the rest
+            # (containing punctuation or spaces) need boundary-aware search.
+            # Terms and analysis text are both lowercased unless matching is
+            # case sensitive, so these patterns need no IGNORECASE
+            token_words = {
+                cat: frozenset(word for word in words if _WORD_TOKEN_RE.fullmatch(word))
+                for cat, words in self.filtered_content.items()
+            }
+            self._complex_words = {
+                cat: [
+                    (word, re.compile(r'\b' + re.escape(word) + r'\b'))
+                    for word in words - token_words[cat]
+                ]
+                for cat, words in self.filtered_content.items()
+            }
+            
+            # Large word lists are packed into a static trie for lookups;
+            # filtered_content keeps the plain sets as the source of truth
+            if MARISA_TRIE_AVAILABLE:
+                token_words = {
+                    cat: marisa_trie.Trie(words) if len(words) >= _TRIE_MIN_WORDS else words
+                    for cat, words in token_words.items()
+                }
+            self._token_words = token_words
+            
+            # One alternation per category over the remaining words and the
+            # phrases, so the regex fallback rules out the no-hit case in a
+            # single scan (longest first; may over-match, never under-match)
+            term_unions = {}
+            for cat in self.filtered_content:
+                alternatives = [pattern.pattern for _, pattern in
+                                sorted(self._complex_words[cat], key=lambda entry: -len(entry[0]))]
+                alternatives.extend(re.escape(phrase) for phrase in
+                                    sorted(self.filtered_phrases.get(cat, ()), key=len, reverse=True))
+                if alternatives:
+                    term_unions[cat] = re.compile('|'.join(f'(?:{alt})' for alt in alternatives))
+            self._term_unions = term_unions
+            
+            # Phrases bucketed by their first two characters; a bucket is only
+            # searched when its key occurs in the text
+            phrase_buckets = {}
+            for cat, phrases in self.filtered_phrases.items():
+                buckets: Dict[str, List[str]] = {}
+                for phrase in phrases:
+                    if phrase:
+                        buckets.setdefault(phrase[:2], []).append(phrase)
+                phrase_buckets[cat] = list(buckets.items())
+            self._phrase_buckets = phrase_buckets
+            self._term_anchors, self._unanchored_terms = self._build_term_anchors()
+            
+            # Text shorter than every word and phrase cannot contain any
+            self._min_term_len = min(
+                (len(term) for terms in [*self.filtered_content.values(), *self.filtered_phrases.values()]
+                 for term in terms),
+                default=0
+            )
+            
             # Log loaded content
             total_words = sum(len(words) for words in self.filtered_content.values())
             total_phrases = sum(len(phrases) for phrases in self.filtered_phrases.values())
             total_patterns = sum(len(patterns) for patterns in self.regex_patterns.values())
             
             self.logger.info(f"Loaded filtering content: {total_words} words, {total_phrases} phrases, {total_patterns} patterns")
+            self._filter_content_hash = self._filter_content_signature()
             
         except Exception as e:
             self.logger.error(f"Failed to load filtered content: {e}")
+        
+        self._build_hyperscan_databases()
+        self._build_term_automaton()
+        self._build_pattern_sets()
+        
+        # A fresh cache per load, so results for the old term lists are dropped
+        cache_size = self.filter_config.get('analysis_cache_size', 1024)
+        if cache_size:
+            self._match_content_cached = functools.lru_cache(maxsize=cache_size)(self._match_content)
+        else:
+            self._match_content_cached = self._match_content
+    
+    def _filter_content_signature(self) -> str:
+        """
+        Hash the configuration that _load_filtered_content builds from.
+        
+        Returns:
+            Hex digest of the word, phrase, category and cache settings
+        """
+        source = json.dumps([
+            self.filter_config.get('filtered_words', []),
+            self.filter_config.get('filtered_phrases', []),
+            self.filter_config.get('categories', {}),
+            self.filter_config.get('analysis_cache_size', 1024)
+        ], sort_keys=True, default=str)
+        return hashlib.sha1(source.encode('utf-8')).hexdigest()
+    
+    def _build_term_anchors(self) -> Tuple[FrozenSet[str], Optional[re.Pattern]]:
+        """
+        Pick one anchor token for every non-plain word and phrase.
+        
+        An anchor is a run of word characters that appears as a whole token
+        of any text the term matches: every run of a boundary-wrapped word,
+        and the interior runs of a substring-matched phrase. If no text token
+        is an anchor, no anchored term can match, so the term scans can be
+        skipped with a set check on the already tokenized text.
+        
+        Terms without an anchor (e.g. two-word phrases, whose outer runs may
+        be part of longer tokens) are combined into one pattern that is
+        searched directly, so only they bypass the token check.
+        
+        Returns:
+            Tuple of (anchor tokens, pattern of unanchored terms or None)
+        """
+        anchors = set()
+        unanchored = []
+        for category, complex_words in self._complex_words.items():
+            terms = [(word, word_pattern.pattern, False) for word, word_pattern in complex_words]
+            terms.extend((phrase, re.escape(phrase), True) for phrase in self.filtered_phrases.get(category, ()))
+            for term, term_pattern, is_phrase in terms:
+                runs = [
+                    match.group() for match in _WORD_TOKEN_RE.finditer(term)
+                    if not is_phrase or (match.start() > 0 and match.end() < len(term))
+                ]
+                if runs:
+                    anchors.add(max(runs, key=len))
+                else:
+                    unanchored.append(term_pattern)
+        
+        unanchored_pattern = None
+        if unanchored:
+            unanchored_pattern = re.compile('|'.join(f'(?:{alt})' for alt in sorted(set(unanchored))))
+        return frozenset(anchors), unanchored_pattern
+    
+    def _build_term_automaton(self):
+        """
+        Build one Aho-Corasick automaton over all categories' words and phrases.
+        
+        Used for categories without a Hyperscan database, so a single scan of
+        the text finds every candidate term tagged with its categories. Word
+        candidates that start and end with word characters are confirmed by
+        checking the characters next to the match; others use their whole-word
+        regex. Plain words are left to the token set intersection.
+        """
+        self._term_automaton = None
+        
+        if not AHOCORASICK_AVAILABLE:
+            return
+        
+        categories = [
+            category for category in [FilterCategory.PROFANITY, FilterCategory.SENSITIVE, FilterCategory.CUSTOM]
+            if category not in self._hs_databases
+        ]
+        
+        # term -> (phrase categories, word categories, whole-word pattern)
+        term_entries: Dict[str, Tuple[List[FilterCategory], List[FilterCategory], Optional[re.Pattern]]] = {}
+        for category in categories:
+            for word, word_pattern in self._complex_words.get(category, []):
+                entry = term_entries.setdefault(word, ([], [], None))
+                entry[1].append(category)
+                term_entries[word] = (entry[0], entry[1], word_pattern)
+            for phrase in self.filtered_phrases.get(category, set()):
+                term_entries.setdefault(phrase, ([], [], None))[0].append(category)
+        
+        if not term_entries:
+            return
+        
+        # Large term lists are cached on disk, keyed by their content
+        cache_path = None
+        cache_dir = self._automaton_cache_dir() if len(term_entries) >= _AUTOMATON_CACHE_MIN_TERMS else None
+        if cache_dir:
+            key_source = repr(sorted(
+                (term, [c.value for c in phrase_categories], [c.value for c in word_categories])
+                for term, (phrase_categories, word_categories, _) in term_entries.items()
+            ))
+            key = hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+            cache_path = os.path.join(cache_dir, f'term_automaton_{key}.ac')
+            automaton = self._load_cached_automaton(cache_path)
+            if automaton is not None:
+                self._term_automaton = (automaton, frozenset(categories))
+                self.logger.info(f"Aho-Corasick term automaton loaded for {len(categories)} categories "
+                                 f"({len(term_entries)} words and phrases)")
+                return
+        
+        try:
+            automaton = ahocorasick.Automaton()
+            for term, (phrase_categories, word_categories, word_pattern) in term_entries.items():
+                # \b around a term with word characters at both ends only
+                # depends on the neighbouring characters
+                edge_check = _is_word_char(term[0]) and _is_word_char(term[-1])
+                automaton.add_word(term, (term, tuple(phrase_categories), tuple(word_categories),
+                                          word_pattern, edge_check))
+            automaton.make_automaton()
+            self._term_automaton = (automaton, frozenset(categories))
+            self.logger.info(f"Aho-Corasick term automaton built for {len(categories)} categories "
+                             f"({len(term_entries)} words and phrases)")
+        except Exception as e:
+            self.logger.warning(f"Aho-Corasick automaton build failed, using regex fallback: {e}")
+            return
+        
+        if cache_path:
+            self._save_cached_automaton(automaton, cache_path)
+    
+    def _automaton_cache_dir(self) -> Optional[str]:
+        """
+        Get the directory term automaton caches are kept in.
+        
+        Cache files are unpickled on load, so they are only used from a
+        directory that belongs to this user and is closed to everyone else.
+        
+        Returns:
+            Cache directory path, or None if it is not private
+        """
+        cache_dir = os.path.join(self.temp_dir, 'term_automaton_cache')
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            dir_stat = os.lstat(cache_dir)
+        except OSError as e:
+            self.logger.warning(f"Term automaton cache unavailable: {e}")
+            return None
+        
+        if not stat.S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != os.getuid() or \
+                dir_stat.st_mode & 0o077:
+            self.logger.warning(f"Not caching term automaton: {cache_dir} is not a private directory")
+            return None
+        return cache_dir
+    
+    def _load_cached_automaton(self, cache_path: str):
+        """
+        Load a previously built term automaton from disk.
+        
+        The file is only unpickled if its SHA-256 matches the digest saved
+        next to it, so partial or foreign files are rebuilt instead.
+        
+        Args:
+            cache_path: Cache file path
+            
+        Returns:
+            Automaton, or None if there is no usable cache file
+        """
+        try:
+            with open(f'{cache_path}.sha256', 'r') as f:
+                expected_digest = f.read().strip()
+            with open(cache_path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable term automaton cache {cache_path}: {e}")
+            return None
+        
+        if digest != expected_digest:
+            self.logger.warning(f"Ignoring term automaton cache {cache_path}: digest mismatch")
+            return None
+        
+        try:
+            automaton = ahocorasick.load(cache_path, pickle.loads)
+            self.logger.debug(f"Loaded term automaton from {cache_path}")
+            return automaton
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable term automaton cache {cache_path}: {e}")
+            return None
+    
+    def _save_cached_automaton(self, automaton, cache_path: str):
+        """
+        Save a built term automaton and its digest, replacing older cache files.
+        
+        Args:
+            automaton: Built automaton
+            cache_path: Cache file path
+        """
+        try:
+            partial_path = f'{cache_path}.{os.getpid()}.part'
+            automaton.save(partial_path, pickle.dumps)
+            with open(partial_path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            os.replace(partial_path, cache_path)
+            
+            # Written last, so a cache file is never trusted before it is complete
+            partial_digest_path = f'{cache_path}.sha256.{os.getpid()}.part'
+            with open(partial_digest_path, 'w') as f:
+                f.write(digest)
+            os.replace(partial_digest_path, f'{cache_path}.sha256')
+            
+            # Automatons for older term lists will not be loaded again
+            cache_dir = os.path.dirname(cache_path)
+            cache_name = os.path.basename(cache_path)
+            for entry in os.scandir(cache_dir):
+                if entry.name.startswith('term_automaton_') and \
+                        entry.name not in (cache_name, f'{cache_name}.sha256'):
+                    os.remove(entry.path)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache term automaton: {e}")
+    
+    def _scan_terms(self, text: str) -> Dict[FilterCategory, Dict[str, List[str]]]:
+        """
+        Find words and phrases of all automaton-covered categories in one pass.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Word and phrase hits per covered category (empty dict if no automaton)
+        """
+        if self._term_automaton is None:
+            return {}
+        
+        automaton, categories = self._term_automaton
+        hits = {category: {'words': [], 'phrases': []} for category in categories}
+        phrases_done = set()
+        words_done = set()
+        text_end = len(text) - 1
+        
+        for end_index, (term, phrase_categories, word_categories, word_pattern, edge_check) in automaton.iter(text):
+            if phrase_categories and term not in phrases_done:
+                phrases_done.add(term)
+                for category in phrase_categories:
+                    hits[category]['phrases'].append(term)
+            
+            if not word_categories or term in words_done:
+                continue
+            
+            if edge_check:
+                # Not a whole word here; a later occurrence may still be
+                start = end_index - len(term) + 1
+                if (start > 0 and _is_word_char(text[start - 1])) or \
+                        (end_index < text_end and _is_word_char(text[end_index + 1])):
+                    continue
+                words_done.add(term)
+            else:
+                words_done.add(term)
+                if not word_pattern.search(text):
+                    continue
+            
+            for category in word_categories:
+                hits[category]['words'].append(term)
+        
+        return hits
+    
+    def _build_pattern_sets(self):
+        """
+        Combine each category's regex patterns into one RE2 pattern set.
+        
+        The set tells in a single linear pass which patterns occur in the
+        text, so findall only runs for those. RE2's \\w, \\d, \\s and \\b are
+        ASCII-only and its $ does not match before a trailing newline, so
+        patterns using them (and patterns RE2 cannot parse, e.g.
+        backreferences) are always run with re.
+        """
+        self._pattern_sets = {}
+        
+        if not RE2_AVAILABLE:
+            return
+        
+        for category, patterns in self.regex_patterns.items():
+            if len(patterns) < 2:
+                continue
+            
+            options = re2.Options()
+            options.case_sensitive = self.case_sensitive
+            
+            pattern_set = re2.Set.SearchSet(options)
+            set_indexes = []
+            always_run = []
+            for index, pattern in enumerate(patterns):
+                if _PERL_CLASS_RE.search(pattern.pattern):
+                    always_run.append(index)
+                    continue
+                try:
+                    pattern_set.Add(pattern.pattern)
+                    set_indexes.append(index)
+                except Exception:
+                    always_run.append(index)
+            
+            if len(set_indexes) < 2:
+                continue
+            
+            try:
+                pattern_set.Compile()
+                self._pattern_sets[category] = (pattern_set, set_indexes, always_run)
+            except Exception as e:
+                self.logger.warning(f"RE2 pattern set unavailable for {category.value}: {e}")
+    
+    def _get_hs_scratch(self, key, database):
+        """
+        Get this thread's Hyperscan scratch space for a database.
+        
+        Scratch space cannot be shared by concurrent scans, so each filter
+        thread keeps its own per database.
+        
+        Args:
+            key: Name of the database slot (filter category)
+            database: Compiled Hyperscan database
+            
+        Returns:
+            Scratch space for scanning database on the current thread
+        """
+        scratches = getattr(self._thread_local, 'hs_scratch', None)
+        if scratches is None:
+            scratches = self._thread_local.hs_scratch = {}
+        
+        # Reloads replace the database, which invalidates the old scratch
+        entry = scratches.get(key)
+        if entry is None or entry[0] is not database:
+            entry = (database, hyperscan.Scratch(database))
+            scratches[key] = entry
+        return entry[1]
+    
+    def _build_channel_rules(self):
+        """
+        Precompile channel override rules.
+        
+        Additional words are normalized once and combined into a single
+        alternation used as a prefilter, and custom rule patterns are
+        compiled up front (invalid patterns are skipped). The mode override
+        and bypass score bonus are resolved here as well.
+        """
+        channel_rules = {}
+        
+        for channel_key, channel_config in self.channel_overrides.items():
+            # (original word, compiled whole-word pattern)
+            word_patterns = []
+            for word in channel_config.get('additional_words', []):
+                word_check = word.lower() if not self.case_sensitive else word
+                # Matched against the already lowercased analysis text
+                word_patterns.append((word, re.compile(r'\b' + re.escape(word_check) + r'\b')))
+            
+            word_union = None
+            if word_patterns:
+                word_union = re.compile('|'.join(f'(?:{pattern.pattern})' for _, pattern in word_patterns))
+            
+            custom_rules = []
+            for rule in channel_config.get('custom_rules', []):
+                try:
+                    pattern = rule.get('pattern', '')
+                    if pattern:
+                        custom_rules.append((re.compile(pattern, re.IGNORECASE), rule))
+                except re.error:
+                    continue
+            
+            filter_mode = None
+            if channel_config.get('mode'):
+                try:
+                    filter_mode = FilterMode(channel_config['mode'])
+                except ValueError:
+                    self.logger.warning(f"Ignoring invalid filter mode for {channel_key}: {channel_config['mode']}")
+            
+            bypass_words = channel_config.get('bypass_words', [])
+            
+            channel_rules[channel_key] = {
+                'mode': channel_config.get('mode'),
+                'filter_mode': filter_mode,
+                'bypass_bonus': len(bypass_words) * 0.1,
+                'word_union': word_union,
+                'word_patterns': word_patterns,
+                'bypass_words': bypass_words,
+                'custom_rules': custom_rules
+            }
+        
+        self._channel_rules = channel_rules
+    
+    def _normalize_terms(self, terms: List[str]) -> FrozenSet[str]:
+        """
+        Normalize and deduplicate filter terms, dropping empty entries.
+        
+        Terms are interned and returned as a frozenset; the filter sets are
+        never mutated after loading, only replaced on reload.
+        
+        Args:
+            terms: Raw words or phrases from configuration
+            
+        Returns:
+            Frozen set of normalized terms
+        """
+        # Case folding is decided once; lower/strip/intern then run as
+        # C-level map calls with no per-term Python branch
+        terms = filter(None, terms)
+        if not self.case_sensitive:
+            terms = map(str.lower, terms)
+        return frozenset(map(sys.intern, filter(None, map(str.strip, terms))))
+    
+    def _build_hyperscan_databases(self):
+        """
+        Compile words and phrases of each category into a Hyperscan database.
+        
+        Each database matches every term of its category as a literal in a
+        single pass over the text. Hyperscan cannot combine word boundaries
+        with Unicode word characters, so word hits are confirmed with the
+        usual whole-word regex. Categories that fail to compile (or all of
+        them, when Hyperscan is not installed) use the regular expression
+        fallback.
+        """
+        self._hs_databases = {}
+        
+        if not HYPERSCAN_AVAILABLE:
+            return
+        
+        # Terms and text are already lowercased when matching is case insensitive
+        flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        
+        for category in [FilterCategory.PROFANITY, FilterCategory.SENSITIVE, FilterCategory.CUSTOM]:
+            # (term, is_word, whole-word pattern for words)
+            terms = [(word, True, word_pattern) for word, word_pattern in self._complex_words.get(category, [])]
+            terms += [(phrase, False, None) for phrase in self.filtered_phrases.get(category, set()) if phrase]
+            if not terms:
+                continue
+            
+            try:
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[re.escape(term).encode('utf-8') for term, _, _ in terms],
+                    ids=list(range(len(terms))),
+                    elements=len(terms),
+                    flags=[flags] * len(terms)
+                )
+                self._hs_databases[category] = (database, terms)
+            except Exception as e:
+                self.logger.warning(f"Hyperscan compile failed for {category.value}, using regex fallback: {e}")
+        
+        if self._hs_databases:
+            self.logger.info(f"Hyperscan databases compiled for {len(self._hs_databases)} categories")
+    
+    def _build_file_index(self):
+        """Index audio files already present in the bin and playable directories."""
+        index = {}
+        try:
+            for channel in range(1, 6):
+                # Same precedence as the directory scan: lower channel, playable before bin
+                for accepted, status in ((True, 'accepted'), (False, 'filtered')):
+                    audio_dir = self._get_route_dir(channel, accepted, 'audio')
+                    with os.scandir(audio_dir) as it:
+                        for entry in it:
+                            if entry.is_file():
+                                index.setdefault(entry.name, (status, channel, entry.path))
+            
+            with self._file_index_lock:
+                self._file_index = index
+            self.logger.debug(f"Indexed {len(index)} routed audio files")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to build file index: {e}")
+    
+    def _index_routed_file(self, original_path: str, dest_path: str, status: str, channel: int):
+        """
+        Record a routed audio file under its destination and original names.
+        
+        Args:
+            original_path: Path the file was routed from
+            dest_path: Path the file was moved to
+            status: 'accepted' or 'filtered'
+            channel: Channel number
+        """
+        entry = (status, channel, dest_path)
+        with self._file_index_lock:
+            self._file_index[os.path.basename(dest_path)] = entry
+            self._file_index[os.path.basename(original_path)] = entry
+    
+    def _check_route_filesystems(self):
+        """Record which device holds the bin and playable trees."""
+        # accepted -> st_dev of the destination tree
+        self._route_devices: Dict[bool, int] = {}
+        try:
+            self._route_devices[True] = os.stat(self.playable_dir).st_dev
+            self._route_devices[False] = os.stat(self.bin_dir).st_dev
+            
+            if os.path.isdir(self.recordings_dir):
+                recordings_dev = os.stat(self.recordings_dir).st_dev
+                if recordings_dev not in self._route_devices.values():
+                    self.logger.warning(
+                        f"Recordings ({self.recordings_dir}) are on a different filesystem than "
+                        f"{self.playable_dir} and {self.bin_dir}; audio files will be copied, not renamed"
+                    )
+                    
+        except Exception as e:
+            self.logger.error(f"Failed to check filter directory filesystems: {e}")
+    
+    def _lookup_file_index(self, file_path: str) -> Optional[Tuple[str, int, str]]:
+        """
+        Look up a routed audio file by its original or routed basename.
+        
+        Entries whose file has since been removed are dropped.
+        
+        Args:
+            file_path: Path or name of the audio file
+            
+        Returns:
+            Tuple of (status, channel, location), or None if not indexed
+        """
+        basename = os.path.basename(file_path)
+        with self._file_index_lock:
+            indexed = self._file_index.get(basename)
+        
+        if indexed is None or os.path.exists(indexed[2]):
+            return indexed
+        
+        with self._file_index_lock:
+            if self._file_index.get(basename) == indexed:
+                del self._file_index[basename]
+        return None
     
     def _create_directories(self):
         """Create necessary directories for file management."""
+        # (channel, accepted, kind) -> directory path, used by file routing
+        self._dir_cache: Dict[Tuple[int, bool, str], str] = {}
+        
+        # audio dir -> (dir mtime_ns, sorted audio file entries)
+        self._audio_list_cache: Dict[str, Tuple[int, List[Tuple[float, str, str]]]] = {}
+        
         try:
             # Create main directories
             for directory in [self.bin_dir, self.playable_dir]:
                 os.makedirs(directory, exist_ok=True)
+                accepted = directory == self.playable_dir
                 
                 # Create channel subdirectories with organized structure
                 for channel in range(1, 6):
@@ -206,11 +1099,13 @@ class ContentFilter:
                     for subdir in ['audio', 'transcripts', 'metadata']:
                         subdir_path = os.path.join(channel_dir, subdir)
                         os.makedirs(subdir_path, exist_ok=True)
+                        self._dir_cache[(channel, accepted, subdir)] = subdir_path
                     
                     # For bin directory, also create filtered reasons directory
                     if directory == self.bin_dir:
                         filtered_reasons_dir = os.path.join(channel_dir, 'filtered_reasons')
                         os.makedirs(filtered_reasons_dir, exist_ok=True)
+                        self._dir_cache[(channel, accepted, 'filtered_reasons')] = filtered_reasons_dir
             
             self.logger.info(f"Created filter directories: {self.bin_dir}, {self.playable_dir}")
             
@@ -220,6 +1115,10 @@ class ContentFilter:
     
     def _setup_audit_logging(self):
         """Setup audit logging for filter decisions."""
+        self.audit_listener = None
+        self.audit_handler = None
+        self.audit_flush_stop = threading.Event()
+        
         try:
             logs_dir = self.config.get('paths', {}).get('logs', './logs')
             os.makedirs(logs_dir, exist_ok=True)
@@ -231,18 +1130,62 @@ class ContentFilter:
             self.audit_logger = logging.getLogger('content_filter_audit')
             self.audit_logger.setLevel(logging.INFO)
             
-            # Create file handler for audit log
+            # Audit records are queued by the filtering threads and written by
+            # a listener thread through a buffered file handler
             if not self.audit_logger.handlers:
-                handler = logging.FileHandler(self.audit_log_path)
+                logging_config = self.config.get('logging', {})
+                handler = BufferedAuditHandler(
+                    self.audit_log_path,
+                    flush_interval=self.filter_config.get('audit_flush_interval', 0.5),
+                    flush_records=self.filter_config.get('audit_flush_records', 100),
+                    max_bytes=int(logging_config.get('max_size_mb', 10) * 1024 * 1024),
+                    backup_count=logging_config.get('backup_count', 5)
+                )
                 formatter = logging.Formatter('%(asctime)s - %(message)s')
                 handler.setFormatter(formatter)
-                self.audit_logger.addHandler(handler)
+                
+                audit_queue = queue.Queue()
+                self.audit_logger.addHandler(logging.handlers.QueueHandler(audit_queue))
+                
+                self.audit_listener = logging.handlers.QueueListener(audit_queue, handler)
+                self.audit_listener.start()
+                self.audit_handler = handler
+                
+                # Flush records left in the buffer once traffic goes quiet
+                flusher = threading.Thread(target=self._audit_flush_loop, name="AuditLogFlusher", daemon=True)
+                flusher.start()
             
             self.logger.info(f"Audit logging setup complete: {self.audit_log_path}")
             
         except Exception as e:
             self.logger.error(f"Failed to setup audit logging: {e}")
     
+    def _audit_flush_loop(self):
+        """Periodically flush the buffered audit log handler."""
+        handler = self.audit_handler
+        while not self.audit_flush_stop.wait(handler.flush_interval):
+            try:
+                handler.flush_if_due()
+            except Exception as e:
+                self.logger.error(f"Audit log flush failed: {e}")
+    
+    def _stop_audit_logging(self):
+        """Drain queued audit records and close the audit log."""
+        if self.audit_listener is None:
+            return
+        
+        self.audit_flush_stop.set()
+        self.audit_listener.stop()
+        self.audit_handler.close()
+        
+        # Detach our queue handler so a new filter instance can set up again
+        for handler in list(self.audit_logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                self.audit_logger.removeHandler(handler)
+        
+        self.audit_listener = None
+        self.audit_handler = None
+    
     def set_filter_callback(self, callback: Callable):
         """
         Set callback function for filter processing completion.
@@ -281,59 +1224,173 @@ class ContentFilter:
             Filter results dictionary
         """
         try:
-            with self.processing_lock:
-                start_time = time.time()
-                
-                self.logger.info(f"Processing transcript for channel {channel}: '{transcript[:50]}...'")
-                
-                # Check for emergency bypass or maintenance mode
-                if self.emergency_bypass:
-                    return self._emergency_bypass_processing(channel, audio_file_path, transcript, confidence, metadata)
-                
-                if self.maintenance_mode:
-                    return self._maintenance_mode_processing(channel, audio_file_path, transcript, confidence, metadata)
-                
-                # Perform comprehensive content analysis
-                filter_results = self._comprehensive_content_analysis(transcript, confidence, channel)
-                
-                # Determine if content is acceptable
-                is_acceptable = self._determine_acceptability(filter_results, channel)
-                
-                # Route files to appropriate directories
-                destination_paths = self._route_files(channel, audio_file_path, transcript, is_acceptable, filter_results)
-                
-                # Generate comprehensive metadata
-                comprehensive_metadata = self._generate_metadata(
-                    channel, audio_file_path, transcript, confidence, 
-                    filter_results, is_acceptable, destination_paths, metadata, start_time
-                )
-                
-                # Update statistics
-                self._update_statistics(channel, is_acceptable, filter_results)
-                
+            comprehensive_metadata, notify = self._filter_transcript(
+                channel, audio_file_path, transcript, confidence, metadata
+            )
+            
+            if notify:
                 # Log to audit trail
                 self._log_audit_trail(comprehensive_metadata)
                 
                 # Call completion callbacks
-                self._call_completion_callbacks(channel, destination_paths, is_acceptable, comprehensive_metadata)
-                
-                # Legacy callback support
-                if self.filter_callback:
-                    try:
-                        self.filter_callback(channel, destination_paths.get('audio'), is_acceptable, comprehensive_metadata)
-                    except Exception as e:
-                        self.logger.error(f"Error in filter callback: {e}")
-                
-                processing_time = time.time() - start_time
-                status = "ACCEPTED" if is_acceptable else "FILTERED"
-                self.logger.info(f"Channel {channel} content {status} in {processing_time:.3f}s")
-                
-                return comprehensive_metadata
-                
+                self._notify_callbacks(channel, comprehensive_metadata)
+            
+            return comprehensive_metadata
+        
         except Exception as e:
             self.logger.error(f"Content filter processing failed for channel {channel}: {e}")
             return self._create_error_result(channel, audio_file_path, str(e))
     
+    def _mark_filter_worker(self):
+        """Flag the current thread as a filter pool worker (pool initializer)."""
+        self._thread_local.filter_worker = True
+    
+    def process_transcript_batch(self, items: List[Tuple[int, str, str, float, Dict]]) -> List[Dict]:
+        """
+        Process several transcripts in one pass.
+        
+        Transcripts are filtered and routed concurrently on the filter worker
+        pool, so file moves for different channels overlap. Applies all
+        statistics updates under one lock acquisition, writes all audit
+        entries with a single write/flush and fires callbacks once the whole
+        batch has been filtered. Useful when the processing queue backs up.
+        
+        No lock is held across the batch: destination names are claimed
+        atomically, so processing_lock only serializes emergency and
+        maintenance processing.
+        
+        Args:
+            items: List of (channel, audio_file_path, transcript, confidence, metadata) tuples
+        
+        Returns:
+            List of filter result dictionaries, in the same order as items
+        """
+        # Filter pool threads run the batch inline rather than wait on the pool
+        if len(items) > 1 and not getattr(self._thread_local, 'filter_worker', False):
+            futures = [self._filter_pool.submit(self._filter_batch_item, *item) for item in items]
+            outcomes = [future.result() for future in futures]
+        else:
+            outcomes = [self._filter_batch_item(*item) for item in items]
+        
+        results: List[Dict] = []
+        audited: List[Dict] = []
+        
+        for comprehensive_metadata, notify in outcomes:
+            results.append(comprehensive_metadata)
+            if notify:
+                audited.append(comprehensive_metadata)
+        
+        self._update_statistics_batch([
+            (item['channel'], item['is_acceptable'], item['filter_results']) for item in audited
+        ])
+        self._log_audit_trail_batch(audited)
+        
+        for comprehensive_metadata in audited:
+            self._notify_callbacks(comprehensive_metadata['channel'], comprehensive_metadata)
+        
+        return results
+    
+    def _filter_batch_item(self, channel: int, audio_file_path: str, transcript: str,
+                           confidence: float, metadata: Dict) -> Tuple[Dict, bool]:
+        """Filter one batch item with deferred statistics, turning failures into error results."""
+        try:
+            return self._filter_transcript(
+                channel, audio_file_path, transcript, confidence, metadata, update_statistics=False
+            )
+        except Exception as e:
+            self.logger.error(f"Content filter processing failed for channel {channel}: {e}")
+            return self._create_error_result(channel, audio_file_path, str(e)), False
+    
+    def _filter_transcript(self, channel: int, audio_file_path: str, transcript: str,
+                           confidence: float, metadata: Dict,
+                           update_statistics: bool = True) -> Tuple[Dict, bool]:
+        """
+        Analyze, route and record a single transcript.
+        
+        Safe to call from several threads: analysis runs without locks and
+        destination file names are claimed atomically. Audit logging and
+        callbacks are left to the caller so they can be batched.
+        
+        Args:
+            channel: Audio channel (1-5)
+            audio_file_path: Path to original audio file
+            transcript: Speech transcript text
+            confidence: Transcript confidence score
+            metadata: Processing metadata
+            update_statistics: Whether to update statistics now (batch callers defer it)
+        
+        Returns:
+            Tuple of (filter results, whether audit/callbacks should run)
+        """
+        start_ns = time.monotonic_ns()
+        
+        # Wall-clock time is read once per transcript and shared by the file
+        # name stamp, metadata and reasons files
+        now = datetime.now()
+        
+        self.logger.info(f"Processing transcript for channel {channel}: '{transcript[:50]}...'")
+        
+        # Check for emergency bypass or maintenance mode
+        if self.emergency_bypass:
+            with self.processing_lock:
+                return self._emergency_bypass_processing(channel, audio_file_path, transcript, confidence, metadata, now), False
+        
+        if self.maintenance_mode:
+            with self.processing_lock:
+                return self._maintenance_mode_processing(channel, audio_file_path, transcript, confidence, metadata, now), False
+        
+        # Perform comprehensive content analysis
+        filter_results = self._comprehensive_content_analysis(transcript, confidence, channel)
+        
+        # Determine if content is acceptable
+        is_acceptable = self._determine_acceptability(filter_results, channel)
+        
+        timestamp = now.isoformat()
+        filter_results['processing_time'] = timestamp
+        
+        # Route files to appropriate directories; the transcript, reasons and
+        # metadata files are written together as one background job
+        sidecar_writes = []
+        destination_paths = self._route_files(channel, audio_file_path, transcript, is_acceptable, filter_results,
+                                              now, sidecar_writes)
+        
+        # Generate comprehensive metadata
+        comprehensive_metadata = self._generate_metadata(
+            channel, audio_file_path, transcript, confidence,
+            filter_results, is_acceptable, destination_paths, metadata, start_ns, timestamp, sidecar_writes
+        )
+        self._queue_writes(sidecar_writes)
+        
+        # Update statistics
+        if update_statistics:
+            self._update_statistics(channel, is_acceptable, filter_results)
+        
+        processing_time = (time.monotonic_ns() - start_ns) / 1e9
+        status = "ACCEPTED" if is_acceptable else "FILTERED"
+        self.logger.info(f"Channel {channel} content {status} in {processing_time:.3f}s")
+        
+        return comprehensive_metadata, True
+    
+    def _notify_callbacks(self, channel: int, metadata: Dict):
+        """
+        Fire completion and legacy filter callbacks for a processed transcript.
+        
+        Args:
+            channel: Channel number
+            metadata: Complete processing metadata
+        """
+        destination_paths = metadata.get('destination_paths', {})
+        is_acceptable = metadata.get('is_acceptable', False)
+        
+        self._call_completion_callbacks(channel, destination_paths, is_acceptable, metadata)
+        
+        # Legacy callback support
+        if self.filter_callback:
+            try:
+                self.filter_callback(channel, destination_paths.get('audio'), is_acceptable, metadata)
+            except Exception as e:
+                self.logger.error(f"Error in filter callback: {e}")
+    
     def _comprehensive_content_analysis(self, transcript: str, confidence: float, channel: int) -> Dict:
         """
         Perform comprehensive content analysis with multi-level filtering.
@@ -350,6 +1407,7 @@ class ContentFilter:
             return {
                 'quality_assessment': self._assess_quality("", confidence),
                 'content_filters': {cat.value: {'words': [], 'phrases': [], 'patterns': []} for cat in FilterCategory if cat in [FilterCategory.PROFANITY, FilterCategory.SENSITIVE, FilterCategory.CUSTOM]},
+                'hit_totals': {'total': 0, 'by_category': {}},
                 'overall_score': 1.0,
                 'analysis_confidence': 'high'
             }
@@ -359,40 +1417,126 @@ class ContentFilter:
         if not self.case_sensitive:
             analysis_text = transcript.lower()
         
+        # Tokenize once for all quality checks
+        words = transcript.split()
+        sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(transcript) if s.strip()]
+        
         # Quality assessment
-        quality_assessment = self._assess_quality(transcript, confidence)
+        quality_assessment = self._assess_quality(
+            transcript, confidence, words, sentences,
+            analysis_text if not self.case_sensitive else None
+        )
+        
+        # Content filtering by category (repeated utterances hit the cache);
+        # with early_reject, transcripts that fail on quality are not matched
+        if self.early_reject and self._fails_on_quality(quality_assessment, channel):
+            content_filters = {
+                category.value: {'words': [], 'phrases': [], 'patterns': [], 'total_hits': 0}
+                for category in [FilterCategory.PROFANITY, FilterCategory.SENSITIVE, FilterCategory.CUSTOM]
+            }
+        else:
+            content_filters = {
+                name: {'words': list(words), 'phrases': list(phrases), 'patterns': list(patterns), 'total_hits': total_hits}
+                for name, words, phrases, patterns, total_hits in self._match_content_cached(analysis_text)
+            }
+        
+        # Hit counts are summed once for scoring, acceptability, statistics and audit
+        hit_totals = self._summarize_hits(content_filters)
+        
+        # Channel-specific filtering
+        channel_specific_results = self._apply_channel_specific_filtering(analysis_text, channel)
+        
+        # Calculate overall score
+        overall_score = self._calculate_overall_score(quality_assessment, content_filters, channel_specific_results,
+                                                      hit_totals, channel)
+        
+        # Determine analysis confidence
+        analysis_confidence = self._determine_analysis_confidence(transcript, confidence, content_filters, hit_totals)
+        
+        return {
+            'quality_assessment': quality_assessment,
+            'content_filters': content_filters,
+            'hit_totals': hit_totals,
+            'channel_specific': channel_specific_results,
+            'overall_score': overall_score,
+            'analysis_confidence': analysis_confidence,
+            'filter_mode': self.filter_mode.value
+        }
+    
+    def _match_content(self, analysis_text: str) -> Tuple:
+        """
+        Run the word, phrase and pattern filters of every content category.
+        
+        Results are returned as nested tuples so they can be cached and shared.
+        
+        Args:
+            analysis_text: Case-normalized transcript text
+            
+        Returns:
+            Tuple of (category name, words, phrases, patterns, total hits) per category
+        """
+        # Hyperscan databases share one encoding
+        text_bytes = None
+        if self._hs_databases:
+            text_bytes = analysis_text.encode('utf-8')
         
-        # Content filtering by category
-        content_filters = {}
+        if len(analysis_text) < self._min_term_len:
+            # Too short for any word or phrase; only patterns can match
+            text_tokens = set()
+            scan_terms = False
+        else:
+            # Clean text usually holds no anchor token, ruling out every
+            # anchored word and phrase before any scan of the text
+            text_tokens = set(_WORD_TOKEN_RE.findall(analysis_text))
+            scan_terms = not text_tokens.isdisjoint(self._term_anchors) or (
+                self._unanchored_terms is not None and self._unanchored_terms.search(analysis_text) is not None
+            )
+        term_hits = self._scan_terms(analysis_text) if scan_terms else {}
+        
+        matches = []
         for category in [FilterCategory.PROFANITY, FilterCategory.SENSITIVE, FilterCategory.CUSTOM]:
-            content_filters[category.value] = self._filter_by_category(analysis_text, category)
-        
-        # Channel-specific filtering
-        channel_specific_results = self._apply_channel_specific_filtering(analysis_text, channel)
+            results = self._filter_by_category(
+                analysis_text, category, text_tokens, term_hits.get(category),
+                text_bytes, scan_terms
+            )
+            matches.append((category.value, tuple(results['words']), tuple(results['phrases']),
+                            tuple(results['patterns']), results['total_hits']))
+        return tuple(matches)
+    
+    def _fails_on_quality(self, quality_assessment: Dict, channel: int) -> bool:
+        """
+        Check whether a transcript is rejected by its quality alone.
         
-        # Calculate overall score
-        overall_score = self._calculate_overall_score(quality_assessment, content_filters, channel_specific_results)
+        Every mode except emergency and maintenance rejects very poor
+        quality before looking at content hits, so content matching can be
+        skipped without changing the decision.
         
-        # Determine analysis confidence
-        analysis_confidence = self._determine_analysis_confidence(transcript, confidence, content_filters)
+        Args:
+            quality_assessment: Result of _assess_quality
+            channel: Audio channel number
+            
+        Returns:
+            True if the transcript is rejected whatever its content
+        """
+        if quality_assessment['overall_quality_score'] >= _VERY_POOR_QUALITY_SCORE:
+            return False
         
-        return {
-            'quality_assessment': quality_assessment,
-            'content_filters': content_filters,
-            'channel_specific': channel_specific_results,
-            'overall_score': overall_score,
-            'analysis_confidence': analysis_confidence,
-            'filter_mode': self.filter_mode.value,
-            'processing_time': datetime.now().isoformat()
-        }
+        rules = self._channel_rules.get(f'channel_{channel}')
+        mode = rules['filter_mode'] if rules and rules['filter_mode'] else self.filter_mode
+        return mode not in (FilterMode.EMERGENCY, FilterMode.MAINTENANCE)
     
-    def _assess_quality(self, transcript: str, confidence: float) -> Dict:
+    def _assess_quality(self, transcript: str, confidence: float,
+                        words: Optional[List[str]] = None, sentences: Optional[List[str]] = None,
+                        lower_text: Optional[str] = None) -> Dict:
         """
         Assess transcript quality based on multiple factors.
         
         Args:
             transcript: Transcript text
             confidence: STT confidence score
+            words: Whitespace-split words of the transcript, if already computed
+            sentences: Non-empty stripped sentences, if already computed
+            lower_text: Lowercased transcript, if already computed
             
         Returns:
             Quality assessment dictionary
@@ -412,9 +1556,12 @@ class ContentFilter:
             })
             return assessment
         
+        if words is None:
+            words = transcript.split()
+        
         # Length assessment
         length = len(transcript.strip())
-        word_count = len(transcript.split())
+        word_count = len(words)
         
         if length < self.min_transcript_length:
             assessment['length_check'] = {
@@ -453,7 +1600,7 @@ class ContentFilter:
             }
         
         # Intelligibility assessment
-        intelligibility_score = self._calculate_intelligibility(transcript)
+        intelligibility_score = self._calculate_intelligibility(transcript, words, lower_text)
         if intelligibility_score < self.intelligibility_threshold:
             assessment['intelligibility_check'] = {
                 'passed': False,
@@ -468,7 +1615,7 @@ class ContentFilter:
             }
         
         # Coherence assessment
-        coherence_score = self._calculate_coherence(transcript)
+        coherence_score = self._calculate_coherence(transcript, words, sentences)
         assessment['coherence_check'] = {
             'passed': coherence_score >= 0.6,
             'score': coherence_score,
@@ -486,12 +1633,15 @@ class ContentFilter:
         
         return assessment
     
-    def _calculate_intelligibility(self, transcript: str) -> float:
+    def _calculate_intelligibility(self, transcript: str, words: Optional[List[str]] = None,
+                                   lower_text: Optional[str] = None) -> float:
         """
         Calculate intelligibility score based on text characteristics.
         
         Args:
             transcript: Transcript text
+            words: Whitespace-split words of the transcript, if already computed
+            lower_text: Lowercased transcript, if already computed
             
         Returns:
             Intelligibility score between 0.0 and 1.0
@@ -504,7 +1654,8 @@ class ContentFilter:
             score = 0.7
             
             # Word characteristics
-            words = transcript.split()
+            if words is None:
+                words = transcript.split()
             if not words:
                 return 0.0
             
@@ -528,13 +1679,15 @@ class ContentFilter:
                 score -= long_word_ratio * 0.3
             
             # Character variety (repetitive characters might indicate poor recognition)
-            unique_chars = len(set(transcript.lower()))
+            if lower_text is None:
+                lower_text = transcript.lower()
+            unique_chars = len(set(lower_text))
             char_variety = unique_chars / max(1, len(transcript))
             if char_variety < 0.1:
                 score -= 0.2
             
             # Punctuation density (too much might indicate unclear speech)
-            punctuation_count = sum(1 for char in transcript if char in '.,!?;:-')
+            punctuation_count = len(transcript) - len(transcript.translate(_PUNCTUATION_TABLE))
             punctuation_density = punctuation_count / len(transcript)
             if punctuation_density > 0.1:
                 score -= punctuation_density * 0.5
@@ -544,12 +1697,15 @@ class ContentFilter:
         except Exception:
             return 0.5
     
-    def _calculate_coherence(self, transcript: str) -> float:
+    def _calculate_coherence(self, transcript: str, words: Optional[List[str]] = None,
+                             sentences: Optional[List[str]] = None) -> float:
         """
         Calculate coherence score based on text structure.
         
         Args:
             transcript: Transcript text
+            words: Whitespace-split words of the transcript, if already computed
+            sentences: Non-empty stripped sentences, if already computed
             
         Returns:
             Coherence score between 0.0 and 1.0
@@ -561,13 +1717,14 @@ class ContentFilter:
             # Base score
             score = 0.6
             
-            words = transcript.split()
+            if words is None:
+                words = transcript.split()
             if len(words) < 2:
                 return 0.3
             
             # Sentence structure indicators
-            sentences = re.split(r'[.!?]+', transcript)
-            sentences = [s.strip() for s in sentences if s.strip()]
+            if sentences is None:
+                sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(transcript) if s.strip()]
             
             if sentences:
                 # Average sentence length (optimal range 5-15 words)
@@ -583,9 +1740,9 @@ class ContentFilter:
                     score += 0.1
             
             # Word repetition (excessive repetition reduces coherence)
+            lower_words = [word.lower() for word in words]
             word_counts = {}
-            for word in words:
-                word_lower = word.lower()
+            for word_lower in lower_words:
                 word_counts[word_lower] = word_counts.get(word_lower, 0) + 1
             
             if words:
@@ -595,8 +1752,7 @@ class ContentFilter:
                     score -= repetition_ratio * 0.3
             
             # Basic grammar indicators (presence of common function words)
-            function_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with'}
-            function_word_count = sum(1 for word in words if word.lower() in function_words)
+            function_word_count = sum(1 for word_lower in lower_words if word_lower in _FUNCTION_WORDS)
             function_word_ratio = function_word_count / len(words) if words else 0
             
             if 0.1 <= function_word_ratio <= 0.4:
@@ -607,13 +1763,21 @@ class ContentFilter:
         except Exception:
             return 0.5
     
-    def _filter_by_category(self, text: str, category: FilterCategory) -> Dict:
+    def _filter_by_category(self, text: str, category: FilterCategory,
+                            text_tokens: Optional[Set[str]] = None,
+                            term_hits: Optional[Dict[str, List[str]]] = None,
+                            text_bytes: Optional[bytes] = None,
+                            scan_terms: bool = True) -> Dict:
         """
         Filter text by specific category.
         
         Args:
             text: Text to filter
             category: Filter category
+            text_tokens: Set of word tokens in text, if already computed
+            term_hits: Word/phrase hits for this category from _scan_terms, if scanned
+            text_bytes: UTF-8 encoding of text, if already computed
+            scan_terms: False if no non-plain word or phrase can match
             
         Returns:
             Filter results for this category
@@ -628,22 +1792,67 @@ class ContentFilter:
         if not text:
             return results
         
-        # Check words
-        for word in self.filtered_content.get(category, set()):
-            pattern = r'\b' + re.escape(word) + r'\b'
-            flags = re.IGNORECASE if not self.case_sensitive else 0
-            if re.search(pattern, text, flags):
-                results['words'].append(word)
-                results['total_hits'] += 1
-        
-        # Check phrases
-        for phrase in self.filtered_phrases.get(category, set()):
-            if phrase in text:
-                results['phrases'].append(phrase)
+        # Plain words by set intersection
+        token_words = self._token_words.get(category)
+        if token_words:
+            if text_tokens is None:
+                text_tokens = set(_WORD_TOKEN_RE.findall(text))
+            word_hits = [token for token in text_tokens if token in token_words]
+            results['words'].extend(word_hits)
+            results['total_hits'] += len(word_hits)
+        
+        hs_entry = self._hs_databases.get(category)
+        if not scan_terms:
+            pass
+        elif hs_entry:
+            # Remaining words and phrases in one vectorized pass
+            database, terms = hs_entry
+            matched_ids = set()
+            
+            def on_match(term_id, start, end, flags, context):
+                matched_ids.add(term_id)
+            
+            if text_bytes is None:
+                text_bytes = text.encode('utf-8')
+            database.scan(text_bytes, match_event_handler=on_match,
+                          scratch=self._get_hs_scratch(category, database))
+            
+            for term_id in sorted(matched_ids):
+                term, is_word, word_pattern = terms[term_id]
+                if is_word and not word_pattern.search(text):
+                    continue
+                results['words' if is_word else 'phrases'].append(term)
                 results['total_hits'] += 1
+        elif term_hits is not None:
+            # Already found by the shared automaton scan
+            results['words'].extend(term_hits['words'])
+            results['phrases'].extend(term_hits['phrases'])
+            results['total_hits'] += len(term_hits['words']) + len(term_hits['phrases'])
+        elif self._term_unions.get(category) is not None and self._term_unions[category].search(text):
+            # Check remaining words
+            for word, word_pattern in self._complex_words.get(category, []):
+                if word_pattern.search(text):
+                    results['words'].append(word)
+                    results['total_hits'] += 1
+            
+            # Check phrases
+            for prefix, phrases in self._phrase_buckets.get(category, []):
+                if prefix not in text:
+                    continue
+                for phrase in phrases:
+                    if phrase in text:
+                        results['phrases'].append(phrase)
+                        results['total_hits'] += 1
         
         # Check regex patterns
-        for pattern in self.regex_patterns.get(category, []):
+        patterns = self.regex_patterns.get(category, [])
+        pattern_set = self._pattern_sets.get(category)
+        if pattern_set is not None:
+            pattern_set, set_indexes, always_run = pattern_set
+            indexes = always_run + [set_indexes[match] for match in pattern_set.Match(text) or []]
+            patterns = [patterns[index] for index in sorted(indexes)]
+        
+        for pattern in patterns:
             matches = pattern.findall(text)
             if matches:
                 results['patterns'].extend(matches)
@@ -662,9 +1871,6 @@ class ContentFilter:
         Returns:
             Channel-specific filter results
         """
-        channel_key = f'channel_{channel}'
-        channel_config = self.channel_overrides.get(channel_key, {})
-        
         results = {
             'mode_override': None,
             'additional_filters': [],
@@ -672,36 +1878,66 @@ class ContentFilter:
             'custom_rules_applied': []
         }
         
+        rules = self._channel_rules.get(f'channel_{channel}')
+        if not rules:
+            return results
+        
         # Check for mode override
-        if 'mode' in channel_config:
-            results['mode_override'] = channel_config['mode']
-        
-        # Apply additional filters specific to this channel
-        additional_words = channel_config.get('additional_words', [])
-        for word in additional_words:
-            word_check = word.lower() if not self.case_sensitive else word
-            pattern = r'\b' + re.escape(word_check) + r'\b'
-            flags = re.IGNORECASE if not self.case_sensitive else 0
-            if re.search(pattern, text, flags):
-                results['additional_filters'].append(word)
+        results['mode_override'] = rules['mode']
+        
+        # Apply additional filters specific to this channel; the combined
+        # pattern rules out the common no-hit case with a single search
+        if rules['word_union'] is not None and rules['word_union'].search(text):
+            for word, pattern in rules['word_patterns']:
+                if pattern.search(text):
+                    results['additional_filters'].append(word)
         
         # Check for bypass filters (words that should be ignored for this channel)
-        bypass_words = channel_config.get('bypass_words', [])
-        results['bypass_filters'] = bypass_words
+        results['bypass_filters'] = rules['bypass_words']
         
         # Apply custom rules
-        custom_rules = channel_config.get('custom_rules', [])
-        for rule in custom_rules:
-            try:
-                pattern = rule.get('pattern', '')
-                if pattern and re.search(pattern, text, re.IGNORECASE):
-                    results['custom_rules_applied'].append(rule)
-            except re.error:
-                continue
+        for pattern, rule in rules['custom_rules']:
+            if pattern.search(text):
+                results['custom_rules_applied'].append(rule)
         
         return results
     
-    def _calculate_overall_score(self, quality_assessment: Dict, content_filters: Dict, channel_specific: Dict) -> float:
+    def _summarize_hits(self, content_filters: Dict) -> Dict:
+        """
+        Sum content filter hits overall and per category.
+        
+        Args:
+            content_filters: Content filter results
+            
+        Returns:
+            Dictionary with 'total' hits and non-zero 'by_category' hits
+        """
+        by_category = {}
+        total = 0
+        for category, results in content_filters.items():
+            hits = results.get('total_hits', 0)
+            if hits > 0:
+                by_category[category] = hits
+                total += hits
+        return {'total': total, 'by_category': by_category}
+    
+    def _get_hit_totals(self, filter_results: Dict) -> Dict:
+        """
+        Get the hit totals from filter results, summing them if absent.
+        
+        Args:
+            filter_results: Comprehensive filter results
+            
+        Returns:
+            Hit totals as returned by _summarize_hits
+        """
+        hit_totals = filter_results.get('hit_totals')
+        if hit_totals is None:
+            hit_totals = self._summarize_hits(filter_results.get('content_filters', {}))
+        return hit_totals
+    
+    def _calculate_overall_score(self, quality_assessment: Dict, content_filters: Dict, channel_specific: Dict,
+                                 hit_totals: Optional[Dict] = None, channel: Optional[int] = None) -> float:
         """
         Calculate overall acceptability score.
         
@@ -709,6 +1945,8 @@ class ContentFilter:
             quality_assessment: Quality assessment results
             content_filters: Content filter results
             channel_specific: Channel-specific results
+            hit_totals: Hit totals from _summarize_hits, if already computed
+            channel: Channel number, to use its precompiled bypass bonus
             
         Returns:
             Overall score between 0.0 and 1.0
@@ -718,21 +1956,21 @@ class ContentFilter:
             base_score = quality_assessment.get('overall_quality_score', 0.5)
             
             # Apply content filter penalties
+            if hit_totals is None:
+                hit_totals = self._summarize_hits(content_filters)
             content_penalty = 0.0
-            for category, results in content_filters.items():
-                hits = results.get('total_hits', 0)
-                if hits > 0:
-                    # Different penalties for different categories
-                    if category == 'profanity':
-                        content_penalty += hits * 0.3
-                    elif category == 'sensitive':
-                        content_penalty += hits * 0.2
-                    elif category == 'custom':
-                        content_penalty += hits * 0.25
-            
-            # Apply channel-specific adjustments
+            for category, hits in hit_totals['by_category'].items():
+                # Different penalties for different categories
+                content_penalty += hits * _CATEGORY_WEIGHTS.get(category, 0.0)
+            
+            # Apply channel-specific adjustments; the penalty depends on which
+            # additional words matched, the bonus only on configuration
             channel_penalty = len(channel_specific.get('additional_filters', [])) * 0.2
-            channel_bonus = len(channel_specific.get('bypass_filters', [])) * 0.1
+            rules = self._channel_rules.get(f'channel_{channel}') if channel is not None else None
+            if rules is not None:
+                channel_bonus = rules['bypass_bonus']
+            else:
+                channel_bonus = len(channel_specific.get('bypass_filters', [])) * 0.1
             
             # Calculate final score
             final_score = base_score - content_penalty - channel_penalty + channel_bonus
@@ -742,7 +1980,8 @@ class ContentFilter:
         except Exception:
             return 0.5
     
-    def _determine_analysis_confidence(self, transcript: str, stt_confidence: float, content_filters: Dict) -> str:
+    def _determine_analysis_confidence(self, transcript: str, stt_confidence: float, content_filters: Dict,
+                                       hit_totals: Optional[Dict] = None) -> str:
         """
         Determine confidence level of the analysis.
         
@@ -750,6 +1989,7 @@ class ContentFilter:
             transcript: Original transcript
             stt_confidence: STT confidence score
             content_filters: Content filter results
+            hit_totals: Hit totals from _summarize_hits, if already computed
             
         Returns:
             Confidence level: 'high', 'medium', 'low'
@@ -765,8 +2005,9 @@ class ContentFilter:
                 confidence_score += 0.1
             
             # Adjust based on filter hits (clear violations are high confidence)
-            total_hits = sum(results.get('total_hits', 0) for results in content_filters.values())
-            if total_hits > 0:
+            if hit_totals is None:
+                hit_totals = self._summarize_hits(content_filters)
+            if hit_totals['total'] > 0:
                 confidence_score += 0.1
             
             # Categorize confidence
@@ -780,6 +2021,19 @@ class ContentFilter:
         except Exception:
             return 'medium'
     
+    def _build_acceptability(self):
+        """Bind the acceptability check for the current mode and thresholds."""
+        self._custom_threshold = self.filter_config.get('custom_threshold', 0.6)
+        self._acceptability_fns: Dict[FilterMode, Callable[[Dict], bool]] = {
+            FilterMode.STRICT: self._acceptability_strict,
+            FilterMode.MODERATE: self._acceptability_moderate,
+            FilterMode.PERMISSIVE: self._acceptability_permissive,
+            FilterMode.CUSTOM: self._acceptability_custom,
+            FilterMode.EMERGENCY: self._acceptability_accept_all,
+            FilterMode.MAINTENANCE: self._acceptability_accept_all
+        }
+        self._acceptability_fn = self._acceptability_fns[self.filter_mode]
+    
     def _determine_acceptability(self, filter_results: Dict, channel: int) -> bool:
         """
         Determine if content is acceptable based on filter results and mode.
@@ -793,68 +2047,66 @@ class ContentFilter:
         """
         try:
             # Check channel-specific mode override
-            channel_specific = filter_results.get('channel_specific', {})
-            mode_override = channel_specific.get('mode_override')
-            current_mode = FilterMode(mode_override) if mode_override else self.filter_mode
-            
-            overall_score = filter_results.get('overall_score', 0.5)
-            quality_assessment = filter_results.get('quality_assessment', {})
-            content_filters = filter_results.get('content_filters', {})
-            
-            # Emergency mode - accept everything
-            if current_mode == FilterMode.EMERGENCY:
-                return True
-            
-            # Maintenance mode - accept everything
-            if current_mode == FilterMode.MAINTENANCE:
-                return True
-            
-            # Quality thresholds
-            quality_score = quality_assessment.get('overall_quality_score', 0.0)
-            if quality_score < 0.3:  # Very poor quality
-                return False
-            
-            # Content filter evaluation based on mode
-            total_content_hits = sum(results.get('total_hits', 0) for results in content_filters.values())
+            rules = self._channel_rules.get(f'channel_{channel}')
+            if rules is not None and rules['filter_mode'] is not None:
+                return self._acceptability_fns[rules['filter_mode']](filter_results)
             
-            if current_mode == FilterMode.STRICT:
-                # Any content violation or low quality fails
-                if total_content_hits > 0 or overall_score < 0.7:
-                    return False
-            
-            elif current_mode == FilterMode.MODERATE:
-                # Multiple violations or severe single violation fails
-                profanity_hits = content_filters.get('profanity', {}).get('total_hits', 0)
-                sensitive_hits = content_filters.get('sensitive', {}).get('total_hits', 0)
-                
-                if profanity_hits > 0 or sensitive_hits > 1 or overall_score < 0.5:
-                    return False
-            
-            elif current_mode == FilterMode.PERMISSIVE:
-                # Only severe violations fail
-                if overall_score < 0.3 or total_content_hits > 3:
-                    return False
-            
-            elif current_mode == FilterMode.CUSTOM:
-                # Use overall score threshold
-                threshold = self.filter_config.get('custom_threshold', 0.6)
-                if overall_score < threshold:
-                    return False
-            
-            # Additional channel-specific checks
-            additional_filters = channel_specific.get('additional_filters', [])
-            if additional_filters and current_mode == FilterMode.STRICT:
-                return False
-            
-            return True
+            return self._acceptability_fn(filter_results)
             
         except Exception as e:
             self.logger.error(f"Error determining acceptability: {e}")
             # Default to rejection on error in strict mode
             return self.filter_mode != FilterMode.STRICT
     
+    def _acceptability_accept_all(self, filter_results: Dict) -> bool:
+        """Emergency and maintenance modes accept everything."""
+        return True
+    
+    def _acceptability_strict(self, filter_results: Dict) -> bool:
+        """Any content violation, low quality or extra channel filter fails."""
+        quality_score = filter_results.get('quality_assessment', {}).get('overall_quality_score', 0.0)
+        if quality_score < _VERY_POOR_QUALITY_SCORE:
+            return False
+        
+        if self._get_hit_totals(filter_results)['total'] > 0 or filter_results.get('overall_score', 0.5) < 0.7:
+            return False
+        
+        # Additional channel-specific checks
+        return not filter_results.get('channel_specific', {}).get('additional_filters')
+    
+    def _acceptability_moderate(self, filter_results: Dict) -> bool:
+        """Multiple violations or a severe single violation fails."""
+        quality_score = filter_results.get('quality_assessment', {}).get('overall_quality_score', 0.0)
+        if quality_score < _VERY_POOR_QUALITY_SCORE:
+            return False
+        
+        hits_by_category = self._get_hit_totals(filter_results)['by_category']
+        profanity_hits = hits_by_category.get('profanity', 0)
+        sensitive_hits = hits_by_category.get('sensitive', 0)
+        
+        return not (profanity_hits > 0 or sensitive_hits > 1 or filter_results.get('overall_score', 0.5) < 0.5)
+    
+    def _acceptability_permissive(self, filter_results: Dict) -> bool:
+        """Only severe violations fail."""
+        quality_score = filter_results.get('quality_assessment', {}).get('overall_quality_score', 0.0)
+        if quality_score < _VERY_POOR_QUALITY_SCORE:
+            return False
+        
+        total_content_hits = self._get_hit_totals(filter_results)['total']
+        
+        return not (filter_results.get('overall_score', 0.5) < 0.3 or total_content_hits > 3)
+    
+    def _acceptability_custom(self, filter_results: Dict) -> bool:
+        """Use the configured overall score threshold."""
+        quality_score = filter_results.get('quality_assessment', {}).get('overall_quality_score', 0.0)
+        if quality_score < _VERY_POOR_QUALITY_SCORE:
+            return False
+        
+        return filter_results.get('overall_score', 0.5) >= self._custom_threshold
+    
     def _route_files(self, channel: int, audio_file_path: str, transcript: str, 
-                    is_acceptable: bool, filter_results: Dict) -> Dict[str, str]:
+                    is_acceptable: bool, filter_results: Dict, now: Optional[datetime] = None,
+                    sidecar_writes: Optional[List[Tuple[str, object]]] = None) -> Dict[str, str]:
         """
         Route files to appropriate directories based on filter results.
         
@@ -864,78 +2116,112 @@ class ContentFilter:
             transcript: Transcript text
             is_acceptable: Whether content passed filtering
             filter_results: Complete filter results
+            now: Processing time (defaults to the current time)
+            sidecar_writes: List to add transcript/reasons writes to; queued here if None
             
         Returns:
             Dictionary of destination paths
         """
         try:
             destination_paths = {}
+            writes = sidecar_writes if sidecar_writes is not None else []
             
-            # Determine base destination directory
-            if is_acceptable:
-                base_dir = os.path.join(self.playable_dir, f"channel_{channel}")
-            else:
-                base_dir = os.path.join(self.bin_dir, f"channel_{channel}")
-            
-            # Generate file basename
-            audio_basename = os.path.splitext(os.path.basename(audio_file_path))[0]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_filename = f"{audio_basename}_{timestamp}"
+            # Generate file basename; rpartition stands in for the
+            # basename/splitext calls on this per-transcript path
+            audio_name = audio_file_path.rpartition(os.sep)[2]
+            audio_basename = audio_name.rpartition('.')[0] or audio_name
+            now = now or datetime.now()
+            file_timestamp = now.strftime("%Y%m%d_%H%M%S")
+            base_filename = f"{audio_basename}_{file_timestamp}"
             
             # Route audio file
-            audio_dest_dir = os.path.join(base_dir, "audio")
-            audio_dest_path = os.path.join(audio_dest_dir, f"{base_filename}.wav")
-            
-            # Handle filename conflicts
-            counter = 1
-            while os.path.exists(audio_dest_path):
-                audio_dest_path = os.path.join(audio_dest_dir, f"{base_filename}_{counter}.wav")
-                counter += 1
-            
-            # Move audio file
-            if os.path.exists(audio_file_path):
-                shutil.move(audio_file_path, audio_dest_path)
-                destination_paths['audio'] = audio_dest_path
+            audio_dest_dir = self._get_route_dir(channel, is_acceptable, "audio")
+            source_exists = os.path.exists(audio_file_path)
+            
+            # Handle filename conflicts; the move claims the first free name
+            if source_exists:
+                audio_dest_path = claim_unique_path(audio_file_path, audio_dest_dir, base_filename, '.wav')
+                status = 'accepted' if is_acceptable else 'filtered'
+                self._index_routed_file(audio_file_path, audio_dest_path, status, channel)
+                self._audio_list_cache.pop(audio_dest_dir, None)
                 self.logger.info(f"Moved audio file to: {audio_dest_path}")
+                destination_paths['audio'] = audio_dest_path
+            else:
+                audio_dest_path = os.path.join(audio_dest_dir, f"{base_filename}.wav")
+                counter = 1
+                while os.path.exists(audio_dest_path):
+                    audio_dest_path = os.path.join(audio_dest_dir, f"{base_filename}_{counter}.wav")
+                    counter += 1
+            
+            # Sidecar files share the routed audio name without '.wav'
+            routed_name = audio_dest_path.rpartition(os.sep)[2][:-4]
             
             # Create transcript file
-            transcript_dest_dir = os.path.join(base_dir, "transcripts")
-            transcript_dest_path = os.path.join(transcript_dest_dir, f"{os.path.basename(audio_dest_path).replace('.wav', '.txt')}")
+            transcript_dest_dir = self._get_route_dir(channel, is_acceptable, "transcripts")
+            transcript_dest_path = os.path.join(transcript_dest_dir, f"{routed_name}.txt")
             
-            with open(transcript_dest_path, 'w', encoding='utf-8') as f:
-                f.write(transcript)
+            writes.append((transcript_dest_path, transcript))
             destination_paths['transcript'] = transcript_dest_path
             
             # Create metadata file
-            metadata_dest_dir = os.path.join(base_dir, "metadata")
-            metadata_dest_path = os.path.join(metadata_dest_dir, f"{os.path.basename(audio_dest_path).replace('.wav', '_metadata.json')}")
+            metadata_dest_dir = self._get_route_dir(channel, is_acceptable, "metadata")
+            metadata_dest_path = os.path.join(metadata_dest_dir, f"{routed_name}_metadata.json")
             destination_paths['metadata'] = metadata_dest_path
             
             # For filtered content, also create filtered reasons file
             if not is_acceptable:
-                reasons_dest_dir = os.path.join(base_dir, "filtered_reasons")
-                reasons_dest_path = os.path.join(reasons_dest_dir, f"{os.path.basename(audio_dest_path).replace('.wav', '_reasons.json')}")
+                reasons_dest_dir = self._get_route_dir(channel, is_acceptable, "filtered_reasons")
+                reasons_dest_path = os.path.join(reasons_dest_dir, f"{routed_name}_reasons.json")
                 
                 reasons_data = {
                     'filter_results': filter_results,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'channel': channel,
                     'original_file': audio_file_path
                 }
                 
-                with open(reasons_dest_path, 'w', encoding='utf-8') as f:
-                    json.dump(reasons_data, f, indent=2)
+                writes.append((reasons_dest_path, _json_dumps_pretty(reasons_data)))
                 destination_paths['reasons'] = reasons_dest_path
             
+            if sidecar_writes is None:
+                self._queue_writes(writes)
+            
             return destination_paths
             
         except Exception as e:
             self.logger.error(f"Failed to route files for channel {channel}: {e}")
             return {}
     
+    def _get_route_dir(self, channel: int, is_acceptable: bool, kind: str, create: bool = True) -> str:
+        """
+        Get the destination directory for routed files.
+        
+        Directories for channels 1-5 are created and cached at startup;
+        any other channel's directory is created on first use.
+        
+        Args:
+            channel: Channel number
+            is_acceptable: Whether content passed filtering
+            kind: Subdirectory ('audio', 'transcripts', 'metadata' or 'filtered_reasons')
+            create: Create and cache a missing directory (False for read-only lookups)
+            
+        Returns:
+            Directory path
+        """
+        key = (channel, is_acceptable, kind)
+        path = self._dir_cache.get(key)
+        if path is None:
+            base_dir = self.playable_dir if is_acceptable else self.bin_dir
+            path = os.path.join(base_dir, f"channel_{channel}", kind)
+            if create:
+                os.makedirs(path, exist_ok=True)
+                self._dir_cache[key] = path
+        return path
+    
     def _generate_metadata(self, channel: int, audio_file_path: str, transcript: str, 
                           confidence: float, filter_results: Dict, is_acceptable: bool,
-                          destination_paths: Dict, original_metadata: Dict, start_time: float) -> Dict:
+                          destination_paths: Dict, original_metadata: Dict, start_ns: int,
+                          timestamp: str, sidecar_writes: Optional[List[Tuple[str, object]]] = None) -> Dict:
         """
         Generate comprehensive metadata for filtered content.
         
@@ -948,17 +2234,19 @@ class ContentFilter:
             is_acceptable: Whether content was accepted
             destination_paths: File destination paths
             original_metadata: Original processing metadata
-            start_time: Processing start time
+            start_ns: Processing start time from time.monotonic_ns()
+            timestamp: ISO processing timestamp
+            sidecar_writes: List to add the metadata file write to; queued here if None
             
         Returns:
             Comprehensive metadata dictionary
         """
-        processing_time = time.time() - start_time
+        processing_time = (time.monotonic_ns() - start_ns) / 1e9
         
         metadata = {
             # Basic information
             'channel': channel,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'processing_time_seconds': processing_time,
             
             # File information
@@ -983,11 +2271,14 @@ class ContentFilter:
             'original_metadata': original_metadata
         }
         
-        # Save metadata file
+        # Save metadata file (serialized here, written by the I/O thread)
         if 'metadata' in destination_paths:
             try:
-                with open(destination_paths['metadata'], 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2)
+                write = (destination_paths['metadata'], _json_dumps_pretty(metadata))
+                if sidecar_writes is not None:
+                    sidecar_writes.append(write)
+                else:
+                    self._queue_writes([write])
             except Exception as e:
                 self.logger.error(f"Failed to save metadata file: {e}")
         
@@ -1002,31 +2293,102 @@ class ContentFilter:
             is_acceptable: Whether content was accepted
             filter_results: Filter results
         """
-        try:
+        self._update_statistics_batch([(channel, is_acceptable, filter_results)])
+    
+    def _new_stats_shard(self) -> Dict:
+        """
+        Create a zeroed statistics shard with every counter key present.
+        
+        Returns:
+            Counter dictionary
+        """
+        shard = {'total_processed': 0, 'total_filtered': 0, 'total_accepted': 0}
+        for i in range(1, 6):
+            for outcome in ('processed', 'filtered', 'accepted'):
+                shard[('by_channel', f'channel_{i}', outcome)] = 0
+        for cat in FilterCategory:
+            shard[('by_category', cat.value)] = 0
+        return shard
+    
+    def _get_stats_shard(self) -> Dict:
+        """
+        Get the calling thread's statistics shard, registering a new one after
+        startup or a statistics reset.
+        
+        Returns:
+            Counter dictionary owned by the calling thread
+        """
+        local = self._thread_local
+        shards = self._stats_shards
+        if getattr(local, 'stats_shards', None) is not shards:
+            local.stats_shard = self._new_stats_shard()
+            local.stats_shards = shards
             with self.stats_lock:
-                # Update totals
-                self.filter_stats['total_processed'] += 1
-                if is_acceptable:
-                    self.filter_stats['total_accepted'] += 1
+                shards.append(local.stats_shard)
+        return local.stats_shard
+    
+    def _collect_filter_stats(self) -> Dict:
+        """
+        Sum all thread shards into the filter statistics structure.
+        
+        Returns:
+            Statistics dictionary
+        """
+        totals = self._new_stats_shard()
+        with self.stats_lock:
+            shards = list(self._stats_shards)
+            start_time = self._stats_start_time
+        
+        for shard in shards:
+            # dict.copy() is a single step under the GIL, so writers can keep counting
+            for key, value in shard.copy().items():
+                totals[key] += value
+        
+        stats = {
+            'total_processed': totals['total_processed'],
+            'total_filtered': totals['total_filtered'],
+            'total_accepted': totals['total_accepted'],
+            'by_channel': {f'channel_{i}': {} for i in range(1, 6)},
+            'by_category': {},
+            'start_time': start_time
+        }
+        for key, value in totals.items():
+            if isinstance(key, tuple):
+                if key[0] == 'by_channel':
+                    stats['by_channel'][key[1]][key[2]] = value
                 else:
-                    self.filter_stats['total_filtered'] += 1
+                    stats['by_category'][key[1]] = value
+        return stats
+    
+    def _update_statistics_batch(self, outcomes: List[Tuple[int, bool, Dict]]):
+        """
+        Update filtering statistics for several decisions.
+        
+        Args:
+            outcomes: List of (channel, is_acceptable, filter_results) tuples
+        """
+        if not outcomes:
+            return
+        
+        try:
+            shard = self._get_stats_shard()
+            for channel, is_acceptable, filter_results in outcomes:
+                outcome = 'accepted' if is_acceptable else 'filtered'
+                
+                # Update totals
+                shard['total_processed'] += 1
+                shard[f'total_{outcome}'] += 1
                 
                 # Update channel stats
                 channel_key = f'channel_{channel}'
-                if channel_key in self.filter_stats['by_channel']:
-                    self.filter_stats['by_channel'][channel_key]['processed'] += 1
-                    if is_acceptable:
-                        self.filter_stats['by_channel'][channel_key]['accepted'] += 1
-                    else:
-                        self.filter_stats['by_channel'][channel_key]['filtered'] += 1
+                if ('by_channel', channel_key, 'processed') in shard:
+                    shard[('by_channel', channel_key, 'processed')] += 1
+                    shard[('by_channel', channel_key, outcome)] += 1
                 
                 # Update category stats
-                content_filters = filter_results.get('content_filters', {})
-                for category, results in content_filters.items():
-                    hits = results.get('total_hits', 0)
-                    if hits > 0:
-                        self.filter_stats['by_category'][category] += hits
-                        
+                for category, hits in self._get_hit_totals(filter_results)['by_category'].items():
+                    shard[('by_category', category)] += hits
+                    
         except Exception as e:
             self.logger.error(f"Failed to update statistics: {e}")
     
@@ -1038,36 +2400,66 @@ class ContentFilter:
             metadata: Complete processing metadata
         """
         try:
-            audit_entry = {
-                'timestamp': metadata['timestamp'],
-                'channel': metadata['channel'],
-                'decision': 'ACCEPTED' if metadata['is_acceptable'] else 'FILTERED',
-                'transcript_preview': metadata['transcript'][:100] + '...' if len(metadata['transcript']) > 100 else metadata['transcript'],
-                'filter_mode': metadata['filter_mode'],
-                'overall_score': metadata['filter_results'].get('overall_score', 0.0),
-                'processing_time': metadata['processing_time_seconds']
-            }
-            
-            # Add filter hit summary for rejected content
-            if not metadata['is_acceptable']:
-                content_filters = metadata['filter_results'].get('content_filters', {})
-                hit_summary = {}
-                for category, results in content_filters.items():
-                    hits = results.get('total_hits', 0)
-                    if hits > 0:
-                        hit_summary[category] = {
-                            'hits': hits,
-                            'words': len(results.get('words', [])),
-                            'phrases': len(results.get('phrases', [])),
-                            'patterns': len(results.get('patterns', []))
-                        }
-                audit_entry['filter_hits'] = hit_summary
-            
-            self.audit_logger.info(json.dumps(audit_entry))
-            
+            self.audit_logger.info(_json_dumps_line(self._build_audit_entry(metadata)))
+        
         except Exception as e:
             self.logger.error(f"Failed to log audit trail: {e}")
     
+    def _log_audit_trail_batch(self, metadata_list: List[Dict]):
+        """
+        Log several filtering decisions to the audit trail.
+        
+        Entries are serialized up front and logged one line each; with the
+        default queued setup the listener's buffered handler batches the
+        writes, and any other handler keeps its own rotation and flushing.
+        
+        Args:
+            metadata_list: Processing metadata for each decision
+        """
+        try:
+            for line in [_json_dumps_line(self._build_audit_entry(metadata)) for metadata in metadata_list]:
+                self.audit_logger.info(line)
+        
+        except Exception as e:
+            self.logger.error(f"Failed to log audit trail batch: {e}")
+    
+    def _build_audit_entry(self, metadata: Dict) -> Dict:
+        """
+        Build the audit trail entry for a filtering decision.
+        
+        Args:
+            metadata: Complete processing metadata
+        
+        Returns:
+            Audit entry dictionary
+        """
+        audit_entry = {
+            'timestamp': metadata['timestamp'],
+            'channel': metadata['channel'],
+            'decision': 'ACCEPTED' if metadata['is_acceptable'] else 'FILTERED',
+            'transcript_preview': metadata['transcript'][:100] + '...' if len(metadata['transcript']) > 100 else metadata['transcript'],
+            'filter_mode': metadata['filter_mode'],
+            'overall_score': metadata['filter_results'].get('overall_score', 0.0),
+            'processing_time': metadata['processing_time_seconds']
+        }
+        
+        # Add filter hit summary for rejected content
+        if not metadata['is_acceptable']:
+            filter_results = metadata['filter_results']
+            content_filters = filter_results.get('content_filters', {})
+            hit_summary = {}
+            for category, hits in self._get_hit_totals(filter_results)['by_category'].items():
+                results = content_filters[category]
+                hit_summary[category] = {
+                    'hits': hits,
+                    'words': len(results.get('words', [])),
+                    'phrases': len(results.get('phrases', [])),
+                    'patterns': len(results.get('patterns', []))
+                }
+            audit_entry['filter_hits'] = hit_summary
+        
+        return audit_entry
+    
     def _call_completion_callbacks(self, channel: int, destination_paths: Dict, 
                                   is_acceptable: bool, metadata: Dict):
         """
@@ -1086,7 +2478,8 @@ class ContentFilter:
                 self.logger.error(f"Error in completion callback: {e}")
     
     def _emergency_bypass_processing(self, channel: int, audio_file_path: str, 
-                                   transcript: str, confidence: float, metadata: Dict) -> Dict:
+                                   transcript: str, confidence: float, metadata: Dict,
+                                   now: Optional[datetime] = None) -> Dict:
         """
         Process content in emergency bypass mode (accept everything).
         
@@ -1096,17 +2489,20 @@ class ContentFilter:
             transcript: Transcript text
             confidence: STT confidence
             metadata: Original metadata
+            now: Processing time (defaults to the current time)
             
         Returns:
             Emergency processing results
         """
         try:
+            now = now or datetime.now()
+            
             # Route to playable directory
-            destination_paths = self._route_files(channel, audio_file_path, transcript, True, {})
+            destination_paths = self._route_files(channel, audio_file_path, transcript, True, {}, now)
             
             emergency_metadata = {
                 'channel': channel,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
                 'is_acceptable': True,
                 'emergency_bypass': True,
                 'transcript': transcript,
@@ -1117,9 +2513,9 @@ class ContentFilter:
             }
             
             # Update stats
-            with self.stats_lock:
-                self.filter_stats['total_processed'] += 1
-                self.filter_stats['total_accepted'] += 1
+            shard = self._get_stats_shard()
+            shard['total_processed'] += 1
+            shard['total_accepted'] += 1
             
             self.logger.warning(f"Emergency bypass: Channel {channel} content accepted without filtering")
             return emergency_metadata
@@ -1129,7 +2525,8 @@ class ContentFilter:
             return self._create_error_result(channel, audio_file_path, str(e))
     
     def _maintenance_mode_processing(self, channel: int, audio_file_path: str,
-                                   transcript: str, confidence: float, metadata: Dict) -> Dict:
+                                   transcript: str, confidence: float, metadata: Dict,
+                                   now: Optional[datetime] = None) -> Dict:
         """
         Process content in maintenance mode (accept everything with logging).
         
@@ -1139,17 +2536,20 @@ class ContentFilter:
             transcript: Transcript text
             confidence: STT confidence
             metadata: Original metadata
+            now: Processing time (defaults to the current time)
             
         Returns:
             Maintenance processing results
         """
         try:
+            now = now or datetime.now()
+            
             # Route to playable directory
-            destination_paths = self._route_files(channel, audio_file_path, transcript, True, {})
+            destination_paths = self._route_files(channel, audio_file_path, transcript, True, {}, now)
             
             maintenance_metadata = {
                 'channel': channel,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
                 'is_acceptable': True,
                 'maintenance_mode': True,
                 'transcript': transcript,
@@ -1160,9 +2560,9 @@ class ContentFilter:
             }
             
             # Update stats
-            with self.stats_lock:
-                self.filter_stats['total_processed'] += 1
-                self.filter_stats['total_accepted'] += 1
+            shard = self._get_stats_shard()
+            shard['total_processed'] += 1
+            shard['total_accepted'] += 1
             
             self.logger.info(f"Maintenance mode: Channel {channel} content accepted for testing")
             return maintenance_metadata
@@ -1256,9 +2656,20 @@ class ContentFilter:
             Status dictionary
         """
         try:
-            # Check if file exists in playable directories
+            # Indexed lookup by original or routed basename
+            indexed = self._lookup_file_index(file_path)
+            if indexed:
+                status, channel, location = indexed
+                return {
+                    'file_path': file_path,
+                    'status': status,
+                    'channel': channel,
+                    'location': location
+                }
+            
+            # Fall back to a substring scan for partial names
             for channel in range(1, 6):
-                playable_audio_dir = os.path.join(self.playable_dir, f'channel_{channel}', 'audio')
+                playable_audio_dir = self._get_route_dir(channel, True, 'audio', create=False)
                 if os.path.exists(playable_audio_dir):
                     for audio_file in os.listdir(playable_audio_dir):
                         if os.path.basename(file_path) in audio_file:
@@ -1270,7 +2681,7 @@ class ContentFilter:
                             }
                 
                 # Check in bin directories
-                bin_audio_dir = os.path.join(self.bin_dir, f'channel_{channel}', 'audio')
+                bin_audio_dir = self._get_route_dir(channel, False, 'audio', create=False)
                 if os.path.exists(bin_audio_dir):
                     for audio_file in os.listdir(bin_audio_dir):
                         if os.path.basename(file_path) in audio_file:
@@ -1294,6 +2705,114 @@ class ContentFilter:
                 'error': str(e)
             }
     
+    def _iter_audio_entries(self, audio_dir: str) -> Iterator[Tuple[float, str, str]]:
+        """
+        Lazily yield the audio files of a directory from one scandir pass.
+        
+        Args:
+            audio_dir: Audio directory to scan
+            
+        Yields:
+            (negated mtime, file name, path) per non-empty audio file
+        """
+        with os.scandir(audio_dir) as it:
+            for entry in it:
+                if entry.name.endswith(('.wav', '.mp3', '.flac')):
+                    # DirEntry caches the stat result
+                    stat_result = entry.stat()
+                    # Empty files are claimed names still being copied in
+                    if stat_result.st_size:
+                        yield -stat_result.st_mtime, entry.name, entry.path
+    
+    def _get_cached_audio_entries(self, audio_dir: str, dir_mtime_ns: int) -> Optional[List[Tuple[float, str, str]]]:
+        """
+        Get the memoized listing of a directory if it is still current.
+        
+        Args:
+            audio_dir: Audio directory
+            dir_mtime_ns: Current directory mtime in nanoseconds
+            
+        Returns:
+            Sorted entries, or None if they must be rescanned
+        """
+        cached = self._audio_list_cache.get(audio_dir)
+        if cached and cached[0] == dir_mtime_ns and time.time_ns() - dir_mtime_ns > 1_000_000_000:
+            return cached[1]
+        return None
+    
+    def _scan_audio_entries(self, audio_dir: str) -> List[Tuple[float, str, str]]:
+        """
+        List the audio files in a directory, newest first.
+        
+        The listing is memoized per directory and reused while the
+        directory's mtime is unchanged, except for directories modified
+        within the last second, since further changes could land in the same
+        timestamp tick. Routing drops the memo of a directory it moves into.
+        
+        Args:
+            audio_dir: Audio directory to scan
+            
+        Returns:
+            Shared, sorted list of (negated mtime, file name, path) entries
+        """
+        try:
+            dir_mtime_ns = os.stat(audio_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        cached = self._get_cached_audio_entries(audio_dir, dir_mtime_ns)
+        if cached is not None:
+            return cached
+        
+        # Sort by modification time (newest first), then by name
+        entries = sorted(self._iter_audio_entries(audio_dir))
+        
+        self._audio_list_cache[audio_dir] = (dir_mtime_ns, entries)
+        return entries
+    
+    def _newest_audio_file(self, audio_dir: str) -> Optional[str]:
+        """
+        Find the newest audio file in a directory without sorting the listing.
+        
+        Reuses the memoized listing from _scan_audio_entries when it is still
+        current, otherwise makes a single min() pass over the directory with
+        the same filtering and ordering rules.
+        
+        Args:
+            audio_dir: Audio directory to scan
+            
+        Returns:
+            Path of the newest audio file or None
+        """
+        try:
+            dir_mtime_ns = os.stat(audio_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        cached = self._get_cached_audio_entries(audio_dir, dir_mtime_ns)
+        if cached is not None:
+            return cached[0][2] if cached else None
+        
+        newest = min(self._iter_audio_entries(audio_dir), default=None)
+        return newest[2] if newest else None
+    
+    def get_latest_playable_file(self, channel: int) -> Optional[str]:
+        """
+        Get the most recent playable file for a channel.
+        
+        Args:
+            channel: Channel number (1-5)
+            
+        Returns:
+            Path of the newest playable file or None
+        """
+        try:
+            return self._newest_audio_file(self._get_route_dir(channel, True, 'audio', create=False))
+            
+        except Exception as e:
+            self.logger.error(f"Error getting latest playable file for channel {channel}: {e}")
+            return None
+    
     def get_playable_files(self, channel: int) -> List[str]:
         """
         Get playable files for Audio Output Manager integration.
@@ -1305,21 +2824,36 @@ class ContentFilter:
             List of playable file paths
         """
         try:
-            playable_files = []
-            audio_dir = os.path.join(self.playable_dir, f'channel_{channel}', 'audio')
+            audio_dir = self._get_route_dir(channel, True, 'audio', create=False)
+            return [path for _, _, path in self._scan_audio_entries(audio_dir)]
             
-            if os.path.exists(audio_dir):
-                for filename in sorted(os.listdir(audio_dir)):
-                    if filename.endswith(('.wav', '.mp3', '.flac')):
-                        full_path = os.path.join(audio_dir, filename)
-                        playable_files.append(full_path)
+        except Exception as e:
+            self.logger.error(f"Error getting playable files for channel {channel}: {e}")
+            return []
+    
+    def get_channel_files(self, channel: int, clean_only: bool = True) -> List[str]:
+        """
+        Get routed audio files for a channel, newest first.
+        
+        Args:
+            channel: Channel number (1-5)
+            clean_only: Only include accepted (playable) files
             
-            # Sort by modification time (newest first)
-            playable_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-            return playable_files
+        Returns:
+            List of audio file paths
+        """
+        if clean_only:
+            return self.get_playable_files(channel)
+        
+        try:
+            entries = []
+            for accepted in (True, False):
+                entries.extend(self._scan_audio_entries(self._get_route_dir(channel, accepted, 'audio', create=False)))
+            entries.sort()
+            return [path for _, _, path in entries]
             
         except Exception as e:
-            self.logger.error(f"Error getting playable files for channel {channel}: {e}")
+            self.logger.error(f"Error getting files for channel {channel}: {e}")
             return []
     
     def get_file_metadata(self, file_path: str) -> Optional[Dict]:
@@ -1333,27 +2867,32 @@ class ContentFilter:
             Metadata dictionary or None
         """
         try:
-            # Look for metadata file
+            # Look for metadata file; checks include files still queued for writing
             metadata_file = file_path.replace('.wav', '_metadata.json').replace('.mp3', '_metadata.json').replace('.flac', '_metadata.json')
             
-            # If direct metadata file doesn't exist, search in appropriate metadata directory
-            if not os.path.exists(metadata_file):
+            # Otherwise derive it from the indexed routed file
+            if not self._sidecar_exists(metadata_file):
+                indexed = self._lookup_file_index(file_path)
+                if indexed:
+                    status, channel, location = indexed
+                    metadata_dir = self._get_route_dir(channel, status == 'accepted', 'metadata')
+                    routed_name = os.path.splitext(os.path.basename(location))[0]
+                    metadata_file = os.path.join(metadata_dir, f'{routed_name}_metadata.json')
+            
+            # If still not found, search in appropriate metadata directory
+            if not self._sidecar_exists(metadata_file):
                 base_name = os.path.splitext(os.path.basename(file_path))[0]
                 
                 # Search in playable and bin metadata directories
-                for base_dir in [self.playable_dir, self.bin_dir]:
+                for accepted in (True, False):
                     for channel in range(1, 6):
-                        metadata_dir = os.path.join(base_dir, f'channel_{channel}', 'metadata')
+                        metadata_dir = self._get_route_dir(channel, accepted, 'metadata', create=False)
                         potential_metadata = os.path.join(metadata_dir, f'{base_name}_metadata.json')
-                        if os.path.exists(potential_metadata):
+                        if self._sidecar_exists(potential_metadata):
                             metadata_file = potential_metadata
                             break
             
-            if os.path.exists(metadata_file):
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            
-            return None
+            return self._read_sidecar_json(metadata_file)
             
         except Exception as e:
             self.logger.error(f"Error getting metadata for {file_path}: {e}")
@@ -1371,16 +2910,10 @@ class ContentFilter:
             self.emergency_bypass = False
             self.maintenance_mode = False
             
-            # Reset statistics
+            # Reset statistics; threads register fresh shards on their next update
             with self.stats_lock:
-                self.filter_stats = {
-                    'total_processed': 0,
-                    'total_filtered': 0,
-                    'total_accepted': 0,
-                    'by_channel': {f'channel_{i}': {'processed': 0, 'filtered': 0, 'accepted': 0} for i in range(1, 6)},
-                    'by_category': {cat.value: 0 for cat in FilterCategory},
-                    'start_time': datetime.now()
-                }
+                self._stats_shards = []
+                self._stats_start_time = datetime.now()
             
             self.logger.info("Content filtering started")
             return True
@@ -1412,27 +2945,26 @@ class ContentFilter:
             Status dictionary
         """
         try:
-            with self.stats_lock:
-                status = {
-                    'timestamp': datetime.now().isoformat(),
-                    'mode': self.filter_mode.value,
-                    'emergency_bypass': self.emergency_bypass,
-                    'maintenance_mode': self.maintenance_mode,
-                    'statistics': self.filter_stats.copy(),
-                    'configuration': {
-                        'case_sensitive': self.case_sensitive,
-                        'min_confidence_threshold': self.min_confidence_threshold,
-                        'intelligibility_threshold': self.intelligibility_threshold,
-                        'min_transcript_length': self.min_transcript_length,
-                        'max_transcript_length': self.max_transcript_length
-                    },
-                    'filter_counts': {
-                        'total_words': sum(len(words) for words in self.filtered_content.values()),
-                        'total_phrases': sum(len(phrases) for phrases in self.filtered_phrases.values()),
-                        'total_patterns': sum(len(patterns) for patterns in self.regex_patterns.values())
-                    }
+            status = {
+                'timestamp': datetime.now().isoformat(),
+                'mode': self.filter_mode.value,
+                'emergency_bypass': self.emergency_bypass,
+                'maintenance_mode': self.maintenance_mode,
+                'statistics': self._collect_filter_stats(),
+                'configuration': {
+                    'case_sensitive': self.case_sensitive,
+                    'min_confidence_threshold': self.min_confidence_threshold,
+                    'intelligibility_threshold': self.intelligibility_threshold,
+                    'min_transcript_length': self.min_transcript_length,
+                    'max_transcript_length': self.max_transcript_length
+                },
+                'filter_counts': {
+                    'total_words': sum(len(words) for words in self.filtered_content.values()),
+                    'total_phrases': sum(len(phrases) for phrases in self.filtered_phrases.values()),
+                    'total_patterns': sum(len(patterns) for patterns in self.regex_patterns.values())
                 }
-            
+            }
+        
             return status
             
         except Exception as e:
@@ -1457,14 +2989,30 @@ class ContentFilter:
             # Update filter configuration
             self.filter_config.update(new_config)
             
-            # Reload filtered content if word lists changed
+            # Reload filtered content if word lists changed; resending the
+            # current lists leaves the built matchers in place
             if any(key in new_config for key in ['filtered_words', 'filtered_phrases', 'categories']):
-                self._load_filtered_content()
+                if self._filter_content_signature() != self._filter_content_hash:
+                    self._load_filtered_content()
+                else:
+                    self.logger.debug("Filtered content unchanged, skipping reload")
+            
+            # Recompile channel rules if overrides changed
+            if 'channel_overrides' in new_config:
+                self.channel_overrides = self.filter_config.get('channel_overrides', {})
+                self._build_channel_rules()
             
             # Update mode if specified
             if 'mode' in new_config:
                 self.filter_mode = FilterMode(new_config['mode'])
             
+            if 'early_reject' in new_config:
+                self.early_reject = new_config['early_reject']
+            
+            # Rebind the acceptability check for the new mode/threshold
+            if 'mode' in new_config or 'custom_threshold' in new_config:
+                self._build_acceptability()
+            
             # Update quality settings if specified
             quality_config = new_config.get('quality_assessment', {})
             if quality_config:
@@ -1537,31 +3085,30 @@ class ContentFilter:
             Statistics dictionary
         """
         try:
-            with self.stats_lock:
-                stats = self.filter_stats.copy()
-                
-                # Add calculated fields
-                total_processed = stats['total_processed']
-                if total_processed > 0:
-                    stats['acceptance_rate'] = stats['total_accepted'] / total_processed
-                    stats['rejection_rate'] = stats['total_filtered'] / total_processed
-                else:
-                    stats['acceptance_rate'] = 0.0
-                    stats['rejection_rate'] = 0.0
-                
-                # Add runtime
-                runtime = datetime.now() - stats['start_time']
-                stats['runtime_seconds'] = runtime.total_seconds()
-                stats['runtime_formatted'] = str(runtime)
-                
-                # Add processing rate
-                if runtime.total_seconds() > 0:
-                    stats['processing_rate_per_hour'] = total_processed / (runtime.total_seconds() / 3600)
-                else:
-                    stats['processing_rate_per_hour'] = 0.0
-                
-                return stats
-                
+            stats = self._collect_filter_stats()
+            
+            # Add calculated fields
+            total_processed = stats['total_processed']
+            if total_processed > 0:
+                stats['acceptance_rate'] = stats['total_accepted'] / total_processed
+                stats['rejection_rate'] = stats['total_filtered'] / total_processed
+            else:
+                stats['acceptance_rate'] = 0.0
+                stats['rejection_rate'] = 0.0
+            
+            # Add runtime
+            runtime = datetime.now() - stats['start_time']
+            stats['runtime_seconds'] = runtime.total_seconds()
+            stats['runtime_formatted'] = str(runtime)
+            
+            # Add processing rate
+            if runtime.total_seconds() > 0:
+                stats['processing_rate_per_hour'] = total_processed / (runtime.total_seconds() / 3600)
+            else:
+                stats['processing_rate_per_hour'] = 0.0
+            
+            return stats
+            
         except Exception as e:
             self.logger.error(f"Error getting filter statistics: {e}")
             return {}
@@ -1569,6 +3116,10 @@ class ContentFilter:
     def cleanup(self):
         """Clean up content filter resources."""
         try:
+            self._filter_pool.shutdown(wait=True)
+            self._io_queue.put(None)
+            self._io_thread.join(timeout=10.0)
+            self._stop_audit_logging()
             self.logger.info("Content filter cleanup completed")
         except Exception as e:
             self.logger.error(f"Content filter cleanup failed: {e}")
\ No newline at end of file
@@ -14,9 +14,46 @@ from typing import Optional, Callable, Dict, List, Union
 from datetime import datetime
 import pyaudio
 from enum import Enum
-from collections import deque
-import uuid
-import shutil
+from collections import deque, OrderedDict
+import queue
+import itertools
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.file_manager import claim_unique_path
+
+# Canonical 44-byte PCM WAV header: RIFF chunk, fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+_WAV_SIZE = struct.Struct('<I')
+_WAV_RIFF_SIZE_OFFSET = 4
+_WAV_DATA_SIZE_OFFSET = 40
+
+# Finished recordings whose parsed metadata is kept between scans
+_METADATA_CACHE_SIZE = 4096
+# Cold scans with at least this many uncached files parse headers in parallel
+_METADATA_PARALLEL_MIN = 8
+_METADATA_SCAN_WORKERS = 4
+
+
+def _wav_header_template(channels: int, sample_width: int, sample_rate: int) -> bytes:
+    """
+    Build a PCM WAV header with zeroed size fields.
+    
+    Args:
+        channels: Number of audio channels
+        sample_width: Sample width in bytes
+        sample_rate: Sample rate in Hz
+        
+    Returns:
+        44-byte header; only the RIFF and data sizes change per file
+    """
+    block_align = channels * sample_width
+    return _WAV_HEADER.pack(
+        b'RIFF', 36, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, sample_width * 8,
+        b'data', 0
+    )
 
 
 class RecordingState(Enum):
@@ -65,13 +102,114 @@ class StreamManager:
         """Close all active streams."""
         with self.stream_lock:
             stream_ids = list(self.active_streams.keys())
-            for stream_id in stream_ids:
-                self.close_stream(stream_id)
+        # close_stream takes the lock itself
+        for stream_id in stream_ids:
+            self.close_stream(stream_id)
     
     def get_stream(self, stream_id: str) -> Optional[pyaudio.Stream]:
         """Get stream by ID."""
-        with self.stream_lock:
-            return self.active_streams.get(stream_id)
+        # A single dict lookup is atomic; the lock only guards changes
+        return self.active_streams.get(stream_id)
+
+
+class SPSCRingBuffer:
+    """
+    Single-producer/single-consumer byte ring buffer.
+    
+    The input stream callback is the only writer and a session's recording
+    worker the only reader. Each side advances only its own position, which
+    is a single reference store under the GIL, so neither takes a lock and
+    the callback never allocates. Data that does not fit is dropped and
+    counted rather than blocking the audio thread.
+    """
+    
+    __slots__ = ('capacity', 'buffer', 'view', 'write_pos', 'read_pos', 'overruns', 'input_overflows')
+    
+    def __init__(self, capacity: int, buffer: Optional[bytearray] = None):
+        self.capacity = capacity
+        self.buffer = buffer if buffer is not None else bytearray(capacity)
+        # Exported once; the buffer is never resized, so the view stays valid
+        self.view = memoryview(self.buffer)
+        self.write_pos = 0  # Total bytes written (producer only)
+        self.read_pos = 0   # Total bytes read (consumer only)
+        self.overruns = 0
+        self.input_overflows = 0  # Device-side overflows reported while active
+    
+    def push(self, data: bytes) -> bool:
+        """
+        Copy data into the ring (producer side).
+        
+        Args:
+            data: Audio bytes from the stream callback
+            
+        Returns:
+            True if written, False if the ring was too full
+        """
+        size = len(data)
+        if size > self.capacity - (self.write_pos - self.read_pos):
+            self.overruns += 1
+            return False
+        
+        start = self.write_pos % self.capacity
+        first = min(size, self.capacity - start)
+        if first == size:
+            self.buffer[start:start + size] = data
+        else:
+            view = memoryview(data)
+            self.buffer[start:] = view[:first]
+            self.buffer[:size - first] = view[first:]
+        self.write_pos += size
+        return True
+    
+    def pop_into(self, sink: Callable) -> int:
+        """
+        Hand all buffered data to sink (consumer side).
+        
+        Args:
+            sink: Called with a memoryview of each contiguous region
+            
+        Returns:
+            Number of bytes consumed
+        """
+        available = self.write_pos - self.read_pos
+        if not available:
+            return 0
+        
+        start = self.read_pos % self.capacity
+        first = min(available, self.capacity - start)
+        view = self.view
+        sink(view[start:start + first])
+        if first < available:
+            sink(view[:available - first])
+        self.read_pos += available
+        return available
+
+
+class BufferPool:
+    """
+    Process-wide pool of equally sized bytearrays for the capture rings.
+    
+    Buffers are handed out and returned first-in first-out, so a buffer
+    released by a finished session is the last one to be reused.
+    """
+    
+    def __init__(self, size: int, initial: int = 0):
+        self.size = size
+        self._free: queue.SimpleQueue = queue.SimpleQueue()
+        for _ in range(initial):
+            self._free.put(bytearray(size))
+    
+    def get(self) -> bytearray:
+        """Take a buffer from the pool, allocating one if it is empty."""
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            return bytearray(self.size)
+    
+    def put(self, buffer: bytearray):
+        """Return a buffer to the pool."""
+        if len(buffer) == self.size:
+            self._free.put(buffer)
 
 
 class RecordingSession:
@@ -79,30 +217,94 @@ class RecordingSession:
     Represents an active recording session.
     """
     
-    def __init__(self, channel: int, stream_id: str, file_path: str):
+    # Fixed attribute set: smaller sessions and faster lookups in the worker
+    __slots__ = (
+        'channel', 'stream_id', 'file_path', 'temp_file_path',
+        'start_time', 'end_time', 'start_ns', 'end_ns', 'deadline',
+        'audio_file', 'wav_header', 'block_align', 'ring',
+        'state', 'stop_event', 'recording_thread', 'stream',
+        'bytes_recorded', 'error_message'
+    )
+    
+    def __init__(self, channel: int, stream_id: str, file_path: str, ring_size: int = 0,
+                 ring_buffer: Optional[bytearray] = None):
         self.channel = channel
         self.stream_id = stream_id
         self.file_path = file_path
         self.temp_file_path = file_path
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
-        self.frames: List[bytes] = []
+        # Durations come from the monotonic clock; the datetimes are for metadata
+        self.start_ns = time.monotonic_ns()
+        self.end_ns: Optional[int] = None
+        self.deadline = float('inf')  # time.monotonic() after which the session is stuck
+        # Audio is streamed into the temp WAV file as it arrives
+        self.audio_file = None
+        self.wav_header = b''
+        self.block_align = 1
+        # Filled by the shared input stream callback, drained by the worker
+        self.ring = SPSCRingBuffer(ring_size, ring_buffer) if ring_size else None
         self.state = RecordingState.RECORDING
         self.stop_event = threading.Event()
         self.recording_thread: Optional[threading.Thread] = None
+        self.stream: Optional[pyaudio.Stream] = None
         self.bytes_recorded = 0
         self.error_message: Optional[str] = None
     
     def get_duration(self) -> float:
         """Get recording duration in seconds."""
-        end_time = self.end_time or datetime.now()
-        return (end_time - self.start_time).total_seconds()
+        end_ns = self.end_ns if self.end_ns is not None else time.monotonic_ns()
+        return (end_ns - self.start_ns) / 1e9
+    
+    def open_audio_file(self, header: bytes, block_align: int,
+                        write_buffer_size: int = -1, dir_fd: Optional[int] = None):
+        """
+        Open the temp WAV file that audio frames are written to.
+        
+        Args:
+            header: WAV header template from _wav_header_template
+            block_align: Bytes per frame across all channels
+            write_buffer_size: File buffer size in bytes; drained blocks are
+                collected here and reach the disk in one write per buffer
+            dir_fd: Open descriptor of the temp directory; the file is then
+                created relative to it instead of resolving the full path
+        """
+        self.wav_header = header
+        self.block_align = block_align
+        if dir_fd is not None:
+            fd = os.open(os.path.basename(self.temp_file_path),
+                         os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+            self.audio_file = os.fdopen(fd, 'wb', buffering=write_buffer_size)
+        else:
+            self.audio_file = open(self.temp_file_path, 'wb', buffering=write_buffer_size)
+        # The sizes are patched in once the data length is known
+        self.audio_file.write(header)
+    
+    @property
+    def frame_count(self) -> int:
+        """Number of complete audio frames recorded."""
+        return self.bytes_recorded // self.block_align
     
     def add_frame(self, frame: bytes):
-        """Add audio frame to recording."""
-        self.frames.append(frame)
+        """Add audio data (any number of bytes drained from the ring) to the recording."""
+        self.audio_file.write(frame)
         self.bytes_recorded += len(frame)
     
+    def close_audio_file(self):
+        """Close the temp WAV file, writing the final header."""
+        audio_file, self.audio_file = self.audio_file, None
+        if audio_file is None:
+            return
+        try:
+            data_len = self.bytes_recorded - self.bytes_recorded % self.block_align
+            header = bytearray(self.wav_header)
+            _WAV_SIZE.pack_into(header, _WAV_RIFF_SIZE_OFFSET, 36 + data_len)
+            _WAV_SIZE.pack_into(header, _WAV_DATA_SIZE_OFFSET, data_len)
+            audio_file.seek(0)
+            audio_file.write(header)
+        finally:
+            audio_file.close()
+    
     def set_error(self, error_message: str):
         """Set error state."""
         self.state = RecordingState.ERROR
@@ -113,7 +315,10 @@ class RecordingSession:
         """Signal recording to stop."""
         self.state = RecordingState.STOPPING
         self.stop_event.set()
-        self.end_time = datetime.now()
+        # Keep the first stop time if the session was already signalled
+        if self.end_time is None:
+            self.end_ns = time.monotonic_ns()
+            self.end_time = datetime.now()
     
     def get_metadata(self) -> Dict:
         """Get recording metadata."""
@@ -123,7 +328,7 @@ class RecordingSession:
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'duration': self.get_duration(),
             'bytes_recorded': self.bytes_recorded,
-            'frame_count': len(self.frames),
+            'frame_count': self.frame_count,
             'state': self.state.value,
             'file_path': self.file_path,
             'error_message': self.error_message
@@ -161,19 +366,57 @@ class AudioRecorder:
         self.max_recording_duration = self.audio_config.get('max_recording_duration', 300)
         self.min_recording_duration = self.audio_config.get('min_recording_duration', 1.0)
         
+        # Sample layout, resolved once for the recorder's format
+        self.sample_width = pyaudio.get_sample_size(self.format)
+        self.frame_bytes = self.sample_width * self.channels
+        # Header fields are fixed for the recorder's format; built once
+        self.wav_header = _wav_header_template(self.channels, self.sample_width, self.sample_rate)
+        
+        # Per-session ring between the input callback and the worker
+        ring_seconds = self.audio_config.get('ring_buffer_seconds', 2.0)
+        self.ring_buffer_size = max(int(ring_seconds * self.sample_rate), self.chunk_size * 4) * self.frame_bytes
+        # One ring per channel up front; sessions borrow and return them
+        self.buffer_pool = BufferPool(self.ring_buffer_size, initial=5)
+        
+        # How often workers drain their ring; several chunks per wakeup keeps
+        # per-chunk Python work off the workers, bounded to a quarter ring
+        chunk_seconds = self.chunk_size / self.sample_rate
+        ring_duration = self.ring_buffer_size / (self.frame_bytes * self.sample_rate)
+        drain_seconds = self.audio_config.get('drain_interval_ms', 50) / 1000.0
+        self.drain_interval = min(max(drain_seconds, chunk_seconds), ring_duration / 4)
+        
+        # Per-session WAV write buffer, batching many drained blocks per write()
+        self.write_buffer_size = int(self.audio_config.get('write_buffer_kb', 64) * 1024)
+        
+        # Real-time scheduling for recording workers; opt-in, 0 keeps SCHED_OTHER
+        self.worker_rt_priority = self.audio_config.get('worker_rt_priority', 0)
+        self.worker_cpu = self.audio_config.get('worker_cpu')
+        self._rt_warning_logged = False
+        
         # File management
         self.paths = config.get('paths', {})
         self.recordings_dir = self.paths.get('recordings', './recordings')
         self.temp_dir = self.paths.get('temp', './temp')
         self.playable_dir = self.paths.get('playable', './playable')
         self.bin_dir = self.paths.get('bin', './bin')
+        self._recordings_channel_dirs: Dict[int, str] = {}
+        self._temp_dir_fd: Optional[int] = None
         
-        # Stream management
+        # Stream management; one callback-mode input stream is shared by all
+        # channels and fans each buffer out to the recording sessions' rings
         self.stream_manager = StreamManager()
+        self.input_stream_id = "recording_input"
+        self._capture_rings: tuple = ()
+        # Ring buffers of finished sessions, returned to the pool by the next
+        # callback, which can no longer see the rings they belonged to
+        self._retired_buffers: queue.SimpleQueue = queue.SimpleQueue()
         
         # Recording state management
-        self.active_sessions: Dict[int, RecordingSession] = {}  # channel -> session
+        # Active session per channel, indexed by channel number (index 0
+        # unused); written under recording_lock, read without it
+        self._channel_slots: List[Optional[RecordingSession]] = [None] * 6
         self.recording_lock = threading.Lock()
+        self._temp_seq = itertools.count(1)  # Unique suffix for temp file names
         self.channel_states: Dict[int, RecordingState] = {}
         
         # Initialize all channels as idle
@@ -183,6 +426,9 @@ class AudioRecorder:
         # Callbacks and integration
         self.recording_complete_callbacks: List[Callable] = []
         self.gpio_handler: Optional[object] = None
+        self.callback_workers = self.audio_config.get('callback_workers', 2)
+        self._callback_pool = ThreadPoolExecutor(max_workers=self.callback_workers,
+                                                 thread_name_prefix="CompletionCallback")
         
         # Performance tracking
         self.performance_stats = {
@@ -194,12 +440,22 @@ class AudioRecorder:
             'concurrent_recordings_max': 0,
             'errors': deque(maxlen=100)
         }
+        # Guards read-modify-write updates only; deque appends and the
+        # readers' dict copies are single operations under the GIL
         self.stats_lock = threading.Lock()
         
         # System health monitoring
         self.health_check_interval = 30  # seconds
         self.health_monitor_thread: Optional[threading.Thread] = None
         self.stop_health_monitoring = threading.Event()
+        # Wakes the monitor early: on shutdown, or when a new session
+        # brings its next deadline forward
+        self._health_wakeup = threading.Event()
+        
+        # Parsed recording metadata keyed by path, valid while the file's
+        # (mtime_ns, size) is unchanged; least recently used entries go first
+        self._metadata_cache: OrderedDict = OrderedDict()
+        self._metadata_cache_lock = threading.Lock()
         
         # Emergency stop capability
         self.emergency_stop_event = threading.Event()
@@ -220,10 +476,18 @@ class AudioRecorder:
             
             # Channel-specific directories
             for channel in range(1, 6):
+                channel_recordings = os.path.join(self.recordings_dir, f"channel_{channel}")
                 channel_playable = os.path.join(self.playable_dir, f"channel_{channel}")
                 channel_bin = os.path.join(self.bin_dir, f"channel_{channel}")
+                os.makedirs(channel_recordings, exist_ok=True)
                 os.makedirs(channel_playable, exist_ok=True)
                 os.makedirs(channel_bin, exist_ok=True)
+                self._recordings_channel_dirs[channel] = channel_recordings
+            
+            # Temp files are created relative to this descriptor, so the
+            # directory path is resolved once rather than per recording
+            if os.open in os.supports_dir_fd:
+                self._temp_dir_fd = os.open(self.temp_dir, os.O_RDONLY | os.O_DIRECTORY)
             
             self.logger.info("Created complete recording directory structure")
         except Exception as e:
@@ -248,22 +512,43 @@ class AudioRecorder:
         while not self.stop_health_monitoring.is_set():
             try:
                 self._perform_health_check()
-                time.sleep(self.health_check_interval)
+                timeout = self._next_health_check_timeout()
             except Exception as e:
                 self.logger.error(f"Health monitoring error: {e}")
-                time.sleep(10)  # Shorter sleep on error
+                timeout = 10  # Shorter sleep on error
+            
+            # Sleep until the next interval or session deadline, whichever
+            # comes first; start_recording and cleanup wake us early
+            self._health_wakeup.wait(timeout)
+            self._health_wakeup.clear()
+    
+    def _next_health_check_timeout(self) -> float:
+        """
+        Seconds until the health monitor is next due.
+        
+        Returns:
+            Time to the earliest active session deadline, capped at the
+            health check interval
+        """
+        timeout = self.health_check_interval
+        now = time.monotonic()
+        for session in self._channel_slots:
+            if session is not None:
+                # Floor keeps a session that fails to stop from spinning the loop
+                timeout = min(timeout, max(session.deadline - now, 0.5))
+        return timeout
     
     def _perform_health_check(self):
         """Perform system health check."""
         try:
-            # Check for stuck recordings
-            current_time = datetime.now()
-            with self.recording_lock:
-                for channel, session in list(self.active_sessions.items()):
-                    duration = (current_time - session.start_time).total_seconds()
-                    if duration > self.max_recording_duration:
-                        self.logger.warning(f"Recording on channel {channel} exceeded max duration, stopping")
-                        self._force_stop_recording(channel, "Maximum duration exceeded")
+            # Check for stuck recordings; _force_stop_recording takes the
+            # recording lock itself, so it is called after the scan
+            now = time.monotonic()
+            expired = [channel for channel, session in enumerate(self._channel_slots)
+                       if session is not None and now > session.deadline]
+            for channel in expired:
+                self.logger.warning(f"Recording on channel {channel} exceeded max duration, stopping")
+                self._force_stop_recording(channel, "Maximum duration exceeded")
             
             # Check audio device health
             if not self.audio_device_manager.get_input_device():
@@ -279,7 +564,7 @@ class AudioRecorder:
         """Update performance statistics."""
         with self.stats_lock:
             # Update concurrent recordings max
-            current_concurrent = len(self.active_sessions)
+            current_concurrent = len(self._active_channels())
             if current_concurrent > self.performance_stats['concurrent_recordings_max']:
                 self.performance_stats['concurrent_recordings_max'] = current_concurrent
             
@@ -365,9 +650,17 @@ class AudioRecorder:
             self.logger.warning("Cannot start recording: emergency stop is active")
             return False
         
+        # Name the temporary file before taking the lock; the counter keeps
+        # names unique even for re-presses within the same second
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"recording_ch{channel}_{timestamp}_{next(self._temp_seq)}.wav"
+        temp_file_path = os.path.join(self.temp_dir, filename)
+        session: Optional[RecordingSession] = None
+        ring_buffer: Optional[bytearray] = None
+        
         with self.recording_lock:
             # Check if already recording on this channel
-            if channel in self.active_sessions:
+            if self._channel_slots[channel] is not None:
                 self.logger.warning(f"Recording already active on channel {channel}")
                 return False
             
@@ -376,6 +669,11 @@ class AudioRecorder:
                 self.logger.warning(f"Channel {channel} is in error state, cannot start recording")
                 return False
             
+            # Previous recording on this channel is still being saved
+            if self.channel_states.get(channel) == RecordingState.PROCESSING:
+                self.logger.warning(f"Channel {channel} is still saving its last recording")
+                return False
+            
             try:
                 # Get input device
                 input_device = self.audio_device_manager.get_input_device()
@@ -383,23 +681,19 @@ class AudioRecorder:
                     self.logger.error("No input device available for recording")
                     return False
                 
-                # Create audio stream
-                stream_id = f"recording_ch{channel}_{uuid.uuid4().hex[:8]}"
-                stream = self.audio_device_manager.create_input_stream(stream_id)
+                # Open (or reuse) the shared input stream
+                stream = self._acquire_input_stream()
                 if not stream:
                     self.logger.error("Failed to create input stream")
                     return False
                 
-                # Register stream
-                self.stream_manager.register_stream(stream_id, stream)
-                
-                # Generate temporary file path
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"recording_ch{channel}_{timestamp}_{uuid.uuid4().hex[:8]}.wav"
-                temp_file_path = os.path.join(self.temp_dir, filename)
-                
                 # Create recording session
-                session = RecordingSession(channel, stream_id, temp_file_path)
+                ring_buffer = self.buffer_pool.get()
+                session = RecordingSession(channel, self.input_stream_id, temp_file_path, self.ring_buffer_size,
+                                           ring_buffer)
+                session.deadline = time.monotonic() + self.max_recording_duration
+                session.open_audio_file(self.wav_header, self.frame_bytes,
+                                        self.write_buffer_size, self._temp_dir_fd)
                 
                 # Start recording thread
                 recording_thread = threading.Thread(
@@ -409,10 +703,13 @@ class AudioRecorder:
                     name=f"RecordingWorker-Ch{channel}"
                 )
                 session.recording_thread = recording_thread
+                session.stream = stream
                 
-                # Update state
-                self.active_sessions[channel] = session
+                # Update state; the callback starts filling the ring now
+                self._channel_slots[channel] = session
                 self.channel_states[channel] = RecordingState.RECORDING
+                self._health_wakeup.set()  # Let the monitor see the new deadline
+                self._capture_rings = self._capture_rings + (session.ring,)
                 
                 # Start recording
                 recording_thread.start()
@@ -429,17 +726,30 @@ class AudioRecorder:
                 
                 # Clean up on failure
                 self.channel_states[channel] = RecordingState.ERROR
-                if channel in self.active_sessions:
-                    del self.active_sessions[channel]
+                if session is not None:
+                    if self._channel_slots[channel] is session:
+                        self._channel_slots[channel] = None
+                    self._capture_rings = tuple(ring for ring in self._capture_rings if ring is not session.ring)
+                    session.close_audio_file()
+                    if os.path.exists(session.temp_file_path):
+                        try:
+                            os.remove(session.temp_file_path)
+                        except Exception as remove_error:
+                            self.logger.warning(f"Could not delete temp file {session.temp_file_path}: {remove_error}")
+                    session.ring = None
+                if not self._capture_rings:
+                    self.stream_manager.close_stream(self.input_stream_id)
+                if ring_buffer is not None:
+                    self._release_ring_buffer(ring_buffer)
                 
                 with self.stats_lock:
                     self.performance_stats['recordings_failed'] += 1
-                    self.performance_stats['errors'].append({
-                        'timestamp': datetime.now().isoformat(),
-                        'channel': channel,
-                        'error': str(e),
-                        'operation': 'start_recording'
-                    })
+                self.performance_stats['errors'].append({
+                    'timestamp': datetime.now().isoformat(),
+                    'channel': channel,
+                    'error': str(e),
+                    'operation': 'start_recording'
+                })
                 
                 return False
     
@@ -458,84 +768,174 @@ class AudioRecorder:
             self.logger.error(f"Invalid channel: {channel}. Must be 1-5")
             return None
         
+        # Only the hand-off happens under the lock; joining the worker and
+        # saving run outside it so other channels can start and stop
         with self.recording_lock:
-            session = self.active_sessions.get(channel)
+            session = self._channel_slots[channel]
             if not session:
                 self.logger.warning(f"No active recording on channel {channel}")
                 return None
             
-            try:
-                self.logger.info(f"Stopping recording on channel {channel}")
-                
-                # Signal recording to stop
-                session.stop()
-                self.channel_states[channel] = RecordingState.PROCESSING
-                
-                # Wait for recording thread to finish
-                if session.recording_thread and session.recording_thread.is_alive():
-                    session.recording_thread.join(timeout=10.0)
-                    if session.recording_thread.is_alive():
-                        self.logger.warning(f"Recording thread for channel {channel} did not stop gracefully")
-                
-                # Close stream
-                self.stream_manager.close_stream(session.stream_id)
-                
-                # Check minimum duration
-                duration = session.get_duration()
-                if duration < self.min_recording_duration:
-                    self.logger.info(f"Recording on channel {channel} too short ({duration:.2f}s), discarding")
+            self.logger.info(f"Stopping recording on channel {channel}")
+            
+            # Signal recording to stop and stop feeding this session
+            session.stop()
+            self._detach_session(session)
+            
+            # PROCESSING keeps the channel from restarting until the save is done
+            self.channel_states[channel] = RecordingState.PROCESSING
+            self._channel_slots[channel] = None
+        
+        try:
+            # Wait for recording thread to finish
+            if session.recording_thread and session.recording_thread.is_alive():
+                session.recording_thread.join(timeout=10.0)
+                if session.recording_thread.is_alive():
+                    self.logger.warning(f"Recording thread for channel {channel} did not stop gracefully")
+            
+            # Check minimum duration
+            duration = session.get_duration()
+            if duration < self.min_recording_duration:
+                self.logger.info(f"Recording on channel {channel} too short ({duration:.2f}s), discarding")
+                with self.recording_lock:
                     self._cleanup_session(channel, session)
-                    return None
-                
-                # Save audio file
-                final_file_path = self._save_recording(session)
-                
-                # Clean up session
+                return None
+            
+            # Save audio file
+            final_file_path = self._save_recording(session)
+            
+            # Clean up session
+            with self.recording_lock:
                 self._cleanup_session(channel, session)
+            
+            if final_file_path:
+                # Update statistics
+                with self.stats_lock:
+                    self.performance_stats['recordings_completed'] += 1
+                    self.performance_stats['total_recording_time'] += duration
                 
-                if final_file_path:
-                    # Update statistics
-                    with self.stats_lock:
-                        self.performance_stats['recordings_completed'] += 1
-                        self.performance_stats['total_recording_time'] += duration
-                    
-                    # Call completion callbacks
-                    self._call_completion_callbacks(channel, final_file_path, session.get_metadata())
-                    
-                    self.logger.info(f"Successfully stopped recording on channel {channel}: {final_file_path}")
-                    return final_file_path
-                else:
-                    self.logger.error(f"Failed to save recording for channel {channel}")
-                    with self.stats_lock:
-                        self.performance_stats['recordings_failed'] += 1
-                    return None
-                
-            except Exception as e:
-                self.logger.error(f"Failed to stop recording on channel {channel}: {e}")
-                
-                # Clean up on error
-                self._cleanup_session(channel, session, error=True)
+                # Call completion callbacks
+                self._call_completion_callbacks(channel, final_file_path, session.get_metadata())
                 
+                self.logger.info(f"Successfully stopped recording on channel {channel}: {final_file_path}")
+                return final_file_path
+            else:
+                self.logger.error(f"Failed to save recording for channel {channel}")
                 with self.stats_lock:
                     self.performance_stats['recordings_failed'] += 1
-                    self.performance_stats['errors'].append({
-                        'timestamp': datetime.now().isoformat(),
-                        'channel': channel,
-                        'error': str(e),
-                        'operation': 'stop_recording'
-                    })
-                
                 return None
+            
+        except Exception as e:
+            self.logger.error(f"Failed to stop recording on channel {channel}: {e}")
+            
+            # Clean up on error
+            with self.recording_lock:
+                self._cleanup_session(channel, session, error=True)
+            
+            with self.stats_lock:
+                self.performance_stats['recordings_failed'] += 1
+            self.performance_stats['errors'].append({
+                'timestamp': datetime.now().isoformat(),
+                'channel': channel,
+                'error': str(e),
+                'operation': 'stop_recording'
+            })
+            
+            return None
+    
+    def _acquire_input_stream(self) -> Optional[pyaudio.Stream]:
+        """
+        Get the shared callback-mode input stream, opening it on first use.
+        
+        Caller must hold recording_lock.
+        
+        Returns:
+            Active input stream, or None if it could not be opened
+        """
+        stream = self.stream_manager.get_stream(self.input_stream_id)
+        if stream is None:
+            stream = self.audio_device_manager.create_input_stream(
+                self.input_stream_id, callback=self._input_callback
+            )
+            if not stream:
+                return None
+            self.stream_manager.register_stream(self.input_stream_id, stream)
+        
+        if not stream.is_active():
+            stream.start_stream()
+        return stream
+    
+    def _detach_session(self, session: RecordingSession):
+        """
+        Stop feeding a session from the input callback.
+        
+        Closes the shared input stream once no session is recording.
+        Caller must hold recording_lock.
+        
+        Args:
+            session: RecordingSession to detach
+        """
+        self._capture_rings = tuple(ring for ring in self._capture_rings if ring is not session.ring)
+        if not self._capture_rings:
+            self.stream_manager.close_stream(session.stream_id)
+    
+    def _input_callback(self, in_data, frame_count, time_info, status_flags):
+        """
+        PyAudio callback for the shared input stream.
+        
+        Runs on the PortAudio thread: copies the buffer into every active
+        session's ring without locking or allocating. Input overflows are
+        read from the status flags and counted rather than raised.
+        """
+        # Callbacks run one at a time and read the rings only after this, so
+        # no callback can still be writing to a buffer retired before now
+        retired = self._retired_buffers
+        while not retired.empty():
+            self.buffer_pool.put(retired.get_nowait())
+        
+        rings = self._capture_rings
+        if status_flags & pyaudio.paInputOverflow:
+            for ring in rings:
+                ring.input_overflows += 1
+        for ring in rings:
+            ring.push(in_data)
+        return (None, pyaudio.paContinue)
+    
+    def _set_worker_scheduling(self, channel: int):
+        """
+        Move the calling recording worker to SCHED_FIFO and optionally pin it.
+        
+        Needs CAP_SYS_NICE or an rtprio limit; without them the worker keeps
+        normal scheduling and a warning is logged once.
+        
+        Args:
+            channel: Recording channel (for logging)
+        """
+        try:
+            if self.worker_rt_priority and hasattr(os, 'sched_setscheduler'):
+                # pid 0 is the calling thread on Linux
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.worker_rt_priority))
+            if self.worker_cpu is not None and hasattr(os, 'sched_setaffinity'):
+                os.sched_setaffinity(0, {self.worker_cpu})
+        except (OSError, ValueError) as e:
+            if not self._rt_warning_logged:
+                self._rt_warning_logged = True
+                self.logger.warning(f"Could not set real-time scheduling for recording workers: {e}")
+            else:
+                self.logger.debug(f"Real-time scheduling unavailable for channel {channel}: {e}")
     
     def _recording_worker(self, session: RecordingSession):
         """
         Worker thread for audio recording.
         
+        Drains the session's ring buffer, filled by the input callback,
+        into the session's WAV file once per drain interval.
+        
         Args:
             session: RecordingSession instance
         """
         channel = session.channel
-        stream = self.stream_manager.get_stream(session.stream_id)
+        stream = session.stream
         
         if not stream:
             self.logger.error(f"No stream found for channel {channel}")
@@ -543,40 +943,51 @@ class AudioRecorder:
             return
         
         self.logger.debug(f"Recording worker started for channel {channel}")
+        self._set_worker_scheduling(channel)
+        
+        ring = session.ring
+        drain_interval = self.drain_interval
+        
+        # Loop invariants bound once; the safety limit is a byte budget
+        # compared against the session's counter instead of a clock read
+        pop_into = ring.pop_into
+        add_frame = session.add_frame
+        stop_is_set = session.stop_event.is_set
+        wait_for_stop = session.stop_event.wait
+        emergency_is_set = self.emergency_stop_event.is_set
+        stream_is_active = stream.is_active
+        max_bytes = int(self.max_recording_duration * self.sample_rate) * self.frame_bytes
         
         try:
-            # Start the stream if not already active
-            if not stream.is_active():
-                stream.start_stream()
-            
-            while not session.stop_event.is_set() and not self.emergency_stop_event.is_set():
+            while not stop_is_set() and not emergency_is_set():
                 try:
-                    # Read audio data with timeout
-                    if stream.is_active():
-                        data = stream.read(self.chunk_size, exception_on_overflow=False)
-                        if data:
-                            session.add_frame(data)
-                    else:
+                    pop_into(add_frame)
+                    
+                    if not stream_is_active():
                         self.logger.warning(f"Stream not active for channel {channel}")
                         break
                     
                     # Check for maximum duration (safety limit)
-                    duration = session.get_duration()
-                    if duration > self.max_recording_duration:
+                    if session.bytes_recorded >= max_bytes:
+                        duration = session.bytes_recorded / (self.sample_rate * self.frame_bytes)
                         self.logger.warning(f"Recording on channel {channel} exceeded maximum duration ({duration:.2f}s)")
                         break
                     
-                    # Small sleep to prevent busy waiting
-                    time.sleep(0.001)  # 1ms
+                    # Sleep until the next chunk is due, waking early on stop
+                    wait_for_stop(drain_interval)
                     
                 except Exception as e:
                     self.logger.error(f"Error reading audio data on channel {channel}: {e}")
                     session.set_error(f"Audio read error: {e}")
                     break
             
-            # Stop the stream
-            if stream.is_active():
-                stream.stop_stream()
+            # Keep what the callback delivered before the stop
+            ring.pop_into(session.add_frame)
+            
+            if ring.overruns:
+                self.logger.warning(f"Channel {channel} ring buffer overran {ring.overruns} times")
+            if ring.input_overflows:
+                self.logger.warning(f"Channel {channel} input overflowed {ring.input_overflows} times")
             
         except Exception as e:
             self.logger.error(f"Recording worker error on channel {channel}: {e}")
@@ -585,6 +996,26 @@ class AudioRecorder:
             session.state = RecordingState.STOPPING
             self.logger.debug(f"Recording worker finished for channel {channel}")
     
+    def _release_ring_buffer(self, buffer: bytearray):
+        """
+        Return a detached session's ring buffer to the pool.
+        
+        A callback that started before the detach may still write to it, so
+        while the stream runs the next callback releases it. Caller must
+        hold recording_lock.
+        
+        Args:
+            buffer: Ring buffer no longer in the capture rings
+        """
+        if self._capture_rings:
+            self._retired_buffers.put(buffer)
+        else:
+            # The stream has been stopped, so no callback is running
+            # and buffers retired while it ran can be released too
+            self.buffer_pool.put(buffer)
+            while not self._retired_buffers.empty():
+                self.buffer_pool.put(self._retired_buffers.get_nowait())
+    
     def _cleanup_session(self, channel: int, session: RecordingSession, error: bool = False):
         """
         Clean up recording session.
@@ -596,8 +1027,8 @@ class AudioRecorder:
         """
         try:
             # Remove from active sessions
-            if channel in self.active_sessions:
-                del self.active_sessions[channel]
+            if self._channel_slots[channel] is session:
+                self._channel_slots[channel] = None
             
             # Update channel state
             if error:
@@ -605,11 +1036,18 @@ class AudioRecorder:
             else:
                 self.channel_states[channel] = RecordingState.IDLE
             
-            # Close stream if still active
-            self.stream_manager.close_stream(session.stream_id)
+            # Stop feeding the session (closes the stream if it was the last)
+            self._detach_session(session)
+            
+            # Return the ring's buffer unless the worker may still drain it
+            thread = session.recording_thread
+            if session.ring and not (thread and thread.is_alive()):
+                self._release_ring_buffer(session.ring.buffer)
+                session.ring = None
             
             # Delete temp file if it exists and was not processed
-            if error and os.path.exists(session.temp_file_path):
+            session.close_audio_file()
+            if os.path.exists(session.temp_file_path):
                 try:
                     os.remove(session.temp_file_path)
                     self.logger.debug(f"Deleted temp file: {session.temp_file_path}")
@@ -630,19 +1068,30 @@ class AudioRecorder:
         """
         for callback in self.recording_complete_callbacks:
             try:
-                # Call callback in separate thread to avoid blocking
-                threading.Thread(
-                    target=callback,
-                    args=(channel, file_path, metadata),
-                    daemon=True,
-                    name=f"CompletionCallback-Ch{channel}"
-                ).start()
+                # Run on the callback pool to avoid blocking the stop path
+                self._callback_pool.submit(self._run_completion_callback, callback,
+                                           channel, file_path, metadata)
             except Exception as e:
                 self.logger.error(f"Error calling completion callback: {e}")
     
+    def _run_completion_callback(self, callback: Callable, channel: int, file_path: str, metadata: Dict):
+        """
+        Run one completion callback on the callback pool, logging failures.
+        
+        Args:
+            callback: Registered completion callback
+            channel: Recording channel
+            file_path: Path to completed recording
+            metadata: Recording metadata
+        """
+        try:
+            callback(channel, file_path, metadata)
+        except Exception as e:
+            self.logger.error(f"Completion callback failed for channel {channel}: {e}")
+    
     def _save_recording(self, session: RecordingSession) -> Optional[str]:
         """
-        Save recorded audio frames to WAV file.
+        Finish the session's streamed WAV file and move it into place.
         
         Args:
             session: RecordingSession with audio data
@@ -651,37 +1100,34 @@ class AudioRecorder:
             Path to saved file, or None if save failed
         """
         try:
-            if not session.frames:
+            if not session.bytes_recorded:
                 self.logger.warning(f"No audio data to save for channel {session.channel}")
                 return None
             
-            # Generate final filename
+            # Writes the final header; the frames are already on disk
+            session.close_audio_file()
+            
+            # Determine final directory based on channel (created at startup)
             timestamp = session.start_time.strftime("%Y%m%d_%H%M%S")
-            final_filename = f"{timestamp}_recording.wav"
-            
-            # Determine final directory based on channel
-            recordings_channel_dir = os.path.join(self.recordings_dir, f"channel_{session.channel}")
-            os.makedirs(recordings_channel_dir, exist_ok=True)
-            
-            final_file_path = os.path.join(recordings_channel_dir, final_filename)
-            
-            # Ensure unique filename
-            counter = 1
-            while os.path.exists(final_file_path):
-                base_name = f"{timestamp}_recording_{counter}.wav"
-                final_file_path = os.path.join(recordings_channel_dir, base_name)
-                counter += 1
-            
-            # Write WAV file
-            with wave.open(final_file_path, 'wb') as wav_file:
-                wav_file.setnchannels(self.channels)
-                wav_file.setsampwidth(pyaudio.get_sample_size(self.format))
-                wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(b''.join(session.frames))
-            
-            # Verify file was created and has content
-            if os.path.exists(final_file_path) and os.path.getsize(final_file_path) > 0:
-                file_size = os.path.getsize(final_file_path)
+            recordings_channel_dir = self._recordings_channel_dirs[session.channel]
+            
+            # Move the finished temp file into the recordings directory,
+            # recreating the channel directory if it was removed since startup
+            try:
+                final_file_path = claim_unique_path(session.temp_file_path, recordings_channel_dir,
+                                                    f"{timestamp}_recording", '.wav')
+            except FileNotFoundError:
+                os.makedirs(recordings_channel_dir, exist_ok=True)
+                final_file_path = claim_unique_path(session.temp_file_path, recordings_channel_dir,
+                                                    f"{timestamp}_recording", '.wav')
+            
+            # Verify file was created and has content (one stat for both)
+            try:
+                file_size = os.stat(final_file_path).st_size
+            except FileNotFoundError:
+                file_size = 0
+            
+            if file_size > 0:
                 duration = session.get_duration()
                 
                 self.logger.info(
@@ -709,26 +1155,37 @@ class AudioRecorder:
             channel: Channel to stop
             reason: Reason for force stop
         """
+        # As in stop_recording, only the hand-off happens under the lock so
+        # joining the worker does not block other channels
         with self.recording_lock:
-            session = self.active_sessions.get(channel)
-            if session:
-                self.logger.warning(f"Force stopping recording on channel {channel}: {reason}")
-                session.set_error(f"Force stopped: {reason}")
-                
-                # Force close stream
-                self.stream_manager.close_stream(session.stream_id)
-                
-                # Clean up
-                self._cleanup_session(channel, session, error=True)
+            session = self._channel_slots[channel] if 1 <= channel <= 5 else None
+            if not session:
+                return
+            
+            self.logger.warning(f"Force stopping recording on channel {channel}: {reason}")
+            session.set_error(f"Force stopped: {reason}")
+            
+            # Stop feeding the session
+            self._detach_session(session)
+            
+            # ERROR keeps the channel from restarting until cleared
+            self.channel_states[channel] = RecordingState.ERROR
+            self._channel_slots[channel] = None
+        
+        # Let the worker finish its last write before the file is closed
+        if session.recording_thread and session.recording_thread is not threading.current_thread():
+            session.recording_thread.join(timeout=2.0)
+        
+        # Clean up
+        with self.recording_lock:
+            self._cleanup_session(channel, session, error=True)
     
     def emergency_stop_all(self):
         """Emergency stop all active recordings."""
         self.logger.warning("Emergency stop all recordings activated")
         self.emergency_stop_event.set()
         
-        with self.recording_lock:
-            active_channels = list(self.active_sessions.keys())
-        
+        active_channels = self._active_channels()
         for channel in active_channels:
             self._force_stop_recording(channel, "Emergency stop all")
         
@@ -752,8 +1209,13 @@ class AudioRecorder:
         Returns:
             True if recording is active on channel
         """
-        with self.recording_lock:
-            return channel in self.active_sessions
+        if not (1 <= channel <= 5):
+            return False
+        return self._channel_slots[channel] is not None
+    
+    def _active_channels(self) -> List[int]:
+        """Channels with an active session, read from the slot table without locking."""
+        return [channel for channel, session in enumerate(self._channel_slots) if session is not None]
     
     def get_active_recordings(self) -> Dict[int, Dict]:
         """
@@ -762,9 +1224,9 @@ class AudioRecorder:
         Returns:
             Dictionary mapping channels to recording information
         """
-        with self.recording_lock:
-            active_info = {}
-            for channel, session in self.active_sessions.items():
+        active_info = {}
+        for channel, session in enumerate(self._channel_slots):
+            if session is not None:
                 active_info[channel] = {
                     'channel': channel,
                     'start_time': session.start_time.isoformat(),
@@ -772,14 +1234,19 @@ class AudioRecorder:
                     'file_path': session.file_path,
                     'state': session.state.value,
                     'bytes_recorded': session.bytes_recorded,
-                    'stream_id': session.stream_id
+                    'stream_id': session.stream_id,
+                    'input_overflows': session.ring.input_overflows if session.ring else 0
                 }
-            return active_info
+        return active_info
     
     def stop_all_recordings(self):
         """Stop all active recordings."""
         with self.recording_lock:
-            active_channels = list(self.active_sessions.keys())
+            active_channels = self._active_channels()
+            # Signal every worker first so they wind down together; the
+            # per-channel joins below then wait at most for the slowest one
+            for channel in active_channels:
+                self._channel_slots[channel].stop()
         
         for channel in active_channels:
             self.stop_recording(channel)
@@ -800,27 +1267,42 @@ class AudioRecorder:
         """
         try:
             completed_recordings = []
+            uncached = []
             
-            # Search in recordings directory
+            # Search in recordings directory, one channel or all of them
             search_dir = self.recordings_dir
+            channels = [channel] if channel else range(1, 6)
             
-            if channel:
-                # Search specific channel
-                channel_dir = os.path.join(search_dir, f"channel_{channel}")
-                if os.path.exists(channel_dir):
-                    for file_path in glob.glob(os.path.join(channel_dir, "*.wav")):
-                        metadata = self.get_recording_metadata(file_path)
-                        if metadata:
-                            completed_recordings.append(metadata)
-            else:
-                # Search all channels
-                for ch in range(1, 6):
-                    channel_dir = os.path.join(search_dir, f"channel_{ch}")
-                    if os.path.exists(channel_dir):
-                        for file_path in glob.glob(os.path.join(channel_dir, "*.wav")):
-                            metadata = self.get_recording_metadata(file_path)
+            for ch in channels:
+                channel_dir = os.path.join(search_dir, f"channel_{ch}")
+                try:
+                    entries = os.scandir(channel_dir)
+                except FileNotFoundError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        # Same selection as glob's "*.wav": no hidden files
+                        if entry.name.startswith('.') or not entry.name.endswith('.wav'):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        if self._metadata_cached(entry.path, stat):
+                            metadata = self.get_recording_metadata(entry.path, stat)
                             if metadata:
                                 completed_recordings.append(metadata)
+                        else:
+                            uncached.append((entry.path, stat))
+            
+            # Header reads block on storage, so overlap them on cold scans
+            if len(uncached) >= _METADATA_PARALLEL_MIN:
+                with ThreadPoolExecutor(max_workers=_METADATA_SCAN_WORKERS,
+                                        thread_name_prefix="RecordingMetadata") as pool:
+                    results = list(pool.map(lambda item: self.get_recording_metadata(*item), uncached))
+            else:
+                results = [self.get_recording_metadata(*item) for item in uncached]
+            completed_recordings.extend(metadata for metadata in results if metadata)
             
             # Sort by creation time (newest first)
             completed_recordings.sort(key=lambda x: x.get('created_time', ''), reverse=True)
@@ -831,22 +1313,42 @@ class AudioRecorder:
             self.logger.error(f"Error getting completed recordings: {e}")
             return []
     
-    def get_recording_metadata(self, file_path: str) -> Optional[Dict]:
+    def _metadata_cached(self, file_path: str, stat: os.stat_result) -> bool:
+        """Whether get_recording_metadata can answer for this file from its cache."""
+        with self._metadata_cache_lock:
+            cached = self._metadata_cache.get(file_path)
+        return bool(cached) and cached[0] == (stat.st_mtime_ns, stat.st_size)
+    
+    def get_recording_metadata(self, file_path: str, stat: Optional[os.stat_result] = None) -> Optional[Dict]:
         """
         Get metadata for a specific recording file.
         
         Args:
             file_path: Path to recording file
+            stat: Stat result already obtained by the caller (e.g. from a
+                directory scan), saving another stat call
             
         Returns:
             Recording metadata dictionary or None
         """
         try:
-            if not os.path.exists(file_path):
-                return None
-            
             # Basic file information
-            stat = os.stat(file_path)
+            if stat is None:
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    with self._metadata_cache_lock:
+                        self._metadata_cache.pop(file_path, None)
+                    return None
+            
+            # Finished recordings are not rewritten, so an unchanged
+            # mtime and size means the cached header parse still holds
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            with self._metadata_cache_lock:
+                cached = self._metadata_cache.get(file_path)
+                if cached and cached[0] == cache_key:
+                    self._metadata_cache.move_to_end(file_path)
+                    return dict(cached[1])
             
             # Extract channel from path
             channel = None
@@ -879,7 +1381,13 @@ class AudioRecorder:
                 **audio_info
             }
             
-            return metadata
+            with self._metadata_cache_lock:
+                self._metadata_cache[file_path] = (cache_key, metadata)
+                self._metadata_cache.move_to_end(file_path)
+                if len(self._metadata_cache) > _METADATA_CACHE_SIZE:
+                    self._metadata_cache.popitem(last=False)
+            
+            return dict(metadata)
             
         except Exception as e:
             self.logger.error(f"Error getting metadata for {file_path}: {e}")
@@ -896,30 +1404,31 @@ class AudioRecorder:
             Status dictionary
         """
         try:
-            with self.recording_lock:
-                session = self.active_sessions.get(channel)
-                channel_state = self.channel_states.get(channel, RecordingState.IDLE)
-                
-                status = {
-                    'channel': channel,
-                    'state': channel_state.value,
-                    'is_recording': channel in self.active_sessions,
-                    'session_info': None
+            # One load of the slot; the session object stays valid even if
+            # the recording stops while the status is being built
+            session = self._channel_slots[channel] if 1 <= channel <= 5 else None
+            channel_state = self.channel_states.get(channel, RecordingState.IDLE)
+            
+            status = {
+                'channel': channel,
+                'state': channel_state.value,
+                'is_recording': session is not None,
+                'session_info': None
+            }
+            
+            if session:
+                status['session_info'] = {
+                    'start_time': session.start_time.isoformat(),
+                    'duration': session.get_duration(),
+                    'bytes_recorded': session.bytes_recorded,
+                    'frames_count': session.frame_count,
+                    'file_path': session.file_path,
+                    'stream_id': session.stream_id,
+                    'error_message': session.error_message
                 }
-                
-                if session:
-                    status['session_info'] = {
-                        'start_time': session.start_time.isoformat(),
-                        'duration': session.get_duration(),
-                        'bytes_recorded': session.bytes_recorded,
-                        'frames_count': len(session.frames),
-                        'file_path': session.file_path,
-                        'stream_id': session.stream_id,
-                        'error_message': session.error_message
-                    }
-                
-                return status
-                
+            
+            return status
+            
         except Exception as e:
             self.logger.error(f"Error getting recording status for channel {channel}: {e}")
             return {
@@ -937,11 +1446,9 @@ class AudioRecorder:
             System status dictionary
         """
         try:
-            with self.recording_lock:
-                active_count = len(self.active_sessions)
-                
-            with self.stats_lock:
-                stats = self.performance_stats.copy()
+            active_count = len(self._active_channels())
+            
+            stats = self.performance_stats.copy()
             
             # Get channel states
             channel_states = {}
@@ -976,13 +1483,12 @@ class AudioRecorder:
     
     def get_performance_stats(self) -> Dict:
         """Get performance statistics."""
-        with self.stats_lock:
-            stats = self.performance_stats.copy()
-            
+        stats = self.performance_stats.copy()
+        
         # Add current active sessions info
-        with self.recording_lock:
-            stats['current_active_sessions'] = len(self.active_sessions)
-            stats['active_channels'] = list(self.active_sessions.keys())
+        active_channels = self._active_channels()
+        stats['current_active_sessions'] = len(active_channels)
+        stats['active_channels'] = active_channels
         
         return stats
     
@@ -993,6 +1499,7 @@ class AudioRecorder:
             
             # Stop health monitoring
             self.stop_health_monitoring.set()
+            self._health_wakeup.set()
             if self.health_monitor_thread and self.health_monitor_thread.is_alive():
                 self.health_monitor_thread.join(timeout=5.0)
             
@@ -1004,15 +1511,18 @@ class AudioRecorder:
             
             # Clear states
             with self.recording_lock:
-                self.active_sessions.clear()
+                self._channel_slots = [None] * 6
                 for channel in range(1, 6):
                     self.channel_states[channel] = RecordingState.IDLE
             
+            # Let queued completion callbacks run without waiting on them
+            self._callback_pool.shutdown(wait=False)
+            
+            if self._temp_dir_fd is not None:
+                os.close(self._temp_dir_fd)
+                self._temp_dir_fd = None
+            
             self.logger.info("Audio recorder cleanup completed")
             
         except Exception as e:
             self.logger.error(f"Audio recorder cleanup failed: {e}")
-
-
-# Import for compatibility
-import glob
\ No newline at end of file
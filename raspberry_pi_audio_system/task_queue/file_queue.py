@@ -8,7 +8,7 @@ and content filtering pipeline with proper channel mapping preservation.
 import threading
 import time
 import logging
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Tuple, Callable, Any
 from datetime import datetime
 from enum import Enum
 import queue
@@ -80,6 +80,7 @@ class FileProcessingQueue:
         self.max_queue_size = self.queue_config.get('max_size', 100)
         self.max_workers = self.queue_config.get('max_workers', 2)
         self.processing_timeout = self.queue_config.get('processing_timeout', 120)
+        self.filter_batch_size = max(1, self.queue_config.get('filter_batch_size', 8))
         
         # Processing queue (priority queue)
         self.task_queue = queue.PriorityQueue(maxsize=self.max_queue_size)
@@ -88,6 +89,11 @@ class FileProcessingQueue:
         self.tasks: Dict[str, ProcessingTask] = {}
         self.tasks_lock = threading.Lock()
         
+        # Transcribed tasks waiting for content filtering, drained in
+        # batches by one worker at a time
+        self._filter_ready: queue.SimpleQueue = queue.SimpleQueue()
+        self._filter_lock = threading.Lock()
+        
         # Worker threads
         self.workers: List[threading.Thread] = []
         self._stop_event = threading.Event()
@@ -196,6 +202,10 @@ class FileProcessingQueue:
         """
         Process individual task through the pipeline.
         
+        Speech processing runs on this worker; the transcript then waits in
+        the filter-ready queue, so transcripts finished while the filter is
+        busy are filtered together as one batch.
+        
         Args:
             worker_id: Worker thread identifier
             task: Processing task to execute
@@ -214,11 +224,77 @@ class FileProcessingQueue:
                 self._mark_task_failed(task, "Speech processing failed")
                 return
             
-            # Step 2: Content filtering
-            filter_result = self._process_content_filter(task, speech_result)
+            self._filter_ready.put((task, speech_result))
+            
+        except Exception as e:
+            self.logger.error(f"Worker {worker_id} failed to process task {task.task_id}: {e}")
+            self._mark_task_failed(task, str(e))
+            return
+        
+        # Step 2: Content filtering
+        self._filter_ready_tasks(worker_id)
+    
+    def _filter_ready_tasks(self, worker_id: int):
+        """
+        Filter transcripts waiting in the filter-ready queue.
+        
+        One worker at a time drains the queue, up to filter_batch_size
+        transcripts per content filter call. A worker that finds the filter
+        busy returns to speech processing; the draining worker checks the
+        queue again after releasing the lock, so no transcript is left behind.
+        
+        Args:
+            worker_id: Worker thread identifier
+        """
+        while not self._filter_ready.empty():
+            if not self._filter_lock.acquire(blocking=False):
+                return
+            try:
+                while True:
+                    ready = []
+                    while len(ready) < self.filter_batch_size:
+                        try:
+                            ready.append(self._filter_ready.get_nowait())
+                        except queue.Empty:
+                            break
+                    if not ready:
+                        break
+                    self._filter_batch(worker_id, ready)
+            finally:
+                self._filter_lock.release()
+    
+    def _filter_batch(self, worker_id: int, ready: List[Tuple[ProcessingTask, Dict]]):
+        """
+        Run content filtering for transcribed tasks and record the results.
+        
+        Args:
+            worker_id: Worker thread identifier
+            ready: (task, speech result) pairs to filter
+        """
+        if len(ready) == 1:
+            task, speech_result = ready[0]
+            filter_results = [self._process_content_filter(task, speech_result)]
+        else:
+            self.logger.info(f"Worker {worker_id} filtering batch of {len(ready)} tasks")
+            try:
+                filter_results = self.content_filter.process_transcript_batch([
+                    (
+                        speech_result['channel'],
+                        speech_result['audio_file'],
+                        speech_result['transcript'],
+                        speech_result['confidence'],
+                        speech_result['metadata']
+                    )
+                    for _, speech_result in ready
+                ])
+            except Exception as e:
+                self.logger.error(f"Content filter batch error: {e}")
+                filter_results = [None] * len(ready)
+        
+        for (task, speech_result), filter_result in zip(ready, filter_results):
             if not filter_result:
                 self._mark_task_failed(task, "Content filtering failed")
-                return
+                continue
             
             # Mark task as completed
             self._mark_task_completed(task, {
@@ -227,10 +303,6 @@ class FileProcessingQueue:
             })
             
             self.logger.info(f"Worker {worker_id} completed task {task.task_id}")
-            
-        except Exception as e:
-            self.logger.error(f"Worker {worker_id} failed to process task {task.task_id}: {e}")
-            self._mark_task_failed(task, str(e))
     
     def _process_speech(self, task: ProcessingTask) -> Optional[Dict]:
         """
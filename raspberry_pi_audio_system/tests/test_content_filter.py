@@ -2,15 +2,41 @@ import unittest
 from unittest.mock import patch
 import sys
 import os
+import logging.handlers
+import re
+import shutil
+import tempfile
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Mock pyaudio before importing the module that uses it
 with patch.dict('sys.modules', {'pyaudio': unittest.mock.MagicMock()}):
+    from processing import content_filter as content_filter_module
     from processing.content_filter import ContentFilter
 
 class TestContentFilter(unittest.TestCase):
 
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _build_filter(self, filter_config):
+        """Build a filter writing under the test's temp directory, cleaned up after the test."""
+        config = {
+            'content_filter': filter_config,
+            'paths': {
+                'bin': os.path.join(self.temp_dir, 'bin'),
+                'playable': os.path.join(self.temp_dir, 'playable'),
+                'recordings': os.path.join(self.temp_dir, 'recordings'),
+                'temp': os.path.join(self.temp_dir, 'temp')
+            }
+        }
+        content_filter = ContentFilter(config)
+        self.addCleanup(content_filter.cleanup)
+        return content_filter
+
     def test_filter_words(self):
         """Test that the content filter correctly identifies and filters words."""
         config = {
@@ -51,5 +77,279 @@ class TestContentFilter(unittest.TestCase):
         result = content_filter.process_transcript(1, 'test.wav', 'this is a good phrase', 0.9, {})
         self.assertTrue(result['is_acceptable'])
 
+    def test_pattern_hits_match_re(self):
+        """Test that regex pattern hits are exactly what plain re finds."""
+        cases = [
+            (['a+b', 'b$'], "\u00dfba.xbba-\u00e9'a.ab"),
+            (['SS', '^a'], 'xK\u00df\n\u00e9.a\u00e9.Bx\n.SS'),
+            (['b$', r'\.a'], 'b\n'),
+            (['\u00df', 'a.b', "'a"], "KbA.Bx'\u00e9.-xB-x\u00df"),
+            ([r'\d{3}-\d{4}', r'secret\w*', r'(a)\1'], 'call 555-1234 about secrets, aa'),
+        ]
+        for patterns, text in cases:
+            content_filter = self._build_filter({'categories': {'custom': {'patterns': patterns}}})
+
+            result = content_filter.process_transcript(1, 'test.wav', text, 0.9, {})
+            hits = result['filter_results']['content_filters']['custom']['patterns']
+            expected = [match for pattern in patterns
+                        for match in re.findall(pattern, text.lower(), re.IGNORECASE)]
+            self.assertEqual(hits, expected, (patterns, text))
+
+    def test_anchor_prefilter_with_two_word_phrases(self):
+        """Test that phrases without an interior token do not turn off the anchor prefilter."""
+        content_filter = self._build_filter({
+            'filtered_words': ['x-ray'],
+            'filtered_phrases': ['bad word', 'make money fast']
+        })
+        self.assertEqual(content_filter._term_anchors, frozenset({'ray', 'money'}))
+
+        with patch.object(content_filter, '_scan_terms', wraps=content_filter._scan_terms) as scan_terms:
+            content_filter._match_content('a perfectly clean sentence')
+            scan_terms.assert_not_called()
+
+            # Phrases match as substrings, so the outer words may be parts of longer tokens
+            profanity = content_filter._match_content('this is abad wordy thing')[0]
+            self.assertEqual(profanity[2], ('bad word',))
+            profanity = content_filter._match_content('an x-ray to make money fast')[0]
+            self.assertEqual(sorted(profanity[1]), ['x-ray'])
+            self.assertEqual(profanity[2], ('make money fast',))
+
+    def test_early_reject_keeps_decisions(self):
+        """Test that early_reject skips matching without changing decisions or result keys."""
+        filters = {}
+        for early_reject in (False, True):
+            filters[early_reject] = self._build_filter({
+                'filtered_words': ['x', 'badword'],
+                'early_reject': early_reject,
+                'channel_overrides': {'channel_2': {'mode': 'emergency'}}
+            })
+
+        for transcript in ['x', 'b', 'x x', 'badword', 'this is a good word', '']:
+            for confidence in (0.0, 0.2, 0.9):
+                for channel in (1, 2):
+                    full = filters[False]._comprehensive_content_analysis(transcript, confidence, channel)
+                    early = filters[True]._comprehensive_content_analysis(transcript, confidence, channel)
+                    self.assertEqual(full.keys(), early.keys())
+                    self.assertEqual(filters[False]._determine_acceptability(full, channel),
+                                     filters[True]._determine_acceptability(early, channel))
+
+        # Very poor quality is rejected without content matching
+        early = filters[True]._comprehensive_content_analysis('x', 0.0, 1)
+        self.assertEqual(early['hit_totals']['total'], 0)
+        self.assertFalse(filters[True]._determine_acceptability(early, 1))
+
+        # Emergency mode accepts it anyway, so its content is still matched
+        early = filters[True]._comprehensive_content_analysis('x', 0.0, 2)
+        self.assertEqual(early['hit_totals']['total'], 1)
+        self.assertTrue(filters[True]._determine_acceptability(early, 2))
+
+
+class TestMatcherBackends(unittest.TestCase):
+
+    BACKEND_FLAGS = ['AHOCORASICK_AVAILABLE', 'HYPERSCAN_AVAILABLE', 'RE2_AVAILABLE', 'MARISA_TRIE_AVAILABLE']
+
+    TRANSCRIPTS = [
+        'this is a badword and another badword',
+        'badwords are not badword-ish, but x-ray is',
+        "call 555-1234 about o'neil's secret plans",
+        'make money fast with a credit card, secretly',
+        '\u00fcber alles: \u00dcBER stra\u00dfe',
+        'no hits at all here',
+        'x',
+        '',
+        'bad phrase\nbad phrase ending\nfinal word',
+    ]
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _build_filter(self, enabled):
+        """Build a filter with only the given optional backends turned on."""
+        config = {
+            'content_filter': {
+                'filtered_words': ['badword', 'x-ray', "o'neil", '\u00fcber', 'x'],
+                'filtered_phrases': ['bad phrase', 'make money fast'],
+                'categories': {
+                    'sensitive': {
+                        'words': ['secret', 'stra\u00dfe'],
+                        'phrases': ['credit card', 'final word'],
+                        'patterns': [r'cred(it)? card', r'[0-9]{3}-[0-9]{4}', r"o.neil('s)?", r'\d{3}-\d{4}']
+                    },
+                    'custom': {
+                        'words': ['plans', 'badword'],
+                        'patterns': [r'secret\w*', r'word$']
+                    }
+                }
+            },
+            'paths': {
+                'bin': os.path.join(self.temp_dir, 'bin'),
+                'playable': os.path.join(self.temp_dir, 'playable'),
+                'recordings': os.path.join(self.temp_dir, 'recordings'),
+                'temp': os.path.join(self.temp_dir, 'temp')
+            }
+        }
+        flags = {flag: flag in enabled for flag in self.BACKEND_FLAGS}
+        with patch.multiple(content_filter_module, _TRIE_MIN_WORDS=1, **flags):
+            content_filter = ContentFilter(config)
+        self.addCleanup(content_filter.cleanup)
+        return content_filter
+
+    def _matches(self, content_filter):
+        """Match every transcript, with word and phrase hits in a canonical order."""
+        results = []
+        for transcript in self.TRANSCRIPTS:
+            for category, words, phrases, patterns, total in content_filter._match_content(transcript.lower()):
+                results.append((transcript, category, sorted(words), sorted(phrases), list(patterns), total))
+        return results
+
+    def _backend_filter(self, flag):
+        """Build a filter using only the given backend, skipping when it is not installed."""
+        if not getattr(content_filter_module, flag):
+            self.skipTest(f"{flag} is False in this environment")
+        return self._build_filter(enabled=(flag,))
+
+    def _assert_matches_fallback(self, content_filter):
+        expected = self._matches(self._build_filter(enabled=()))
+        self.assertTrue(any(total for *_, total in expected))
+        self.assertEqual(self._matches(content_filter), expected)
+
+    def test_hyperscan_matches_fallback(self):
+        """Test that Hyperscan term databases find exactly what the regex fallback finds."""
+        content_filter = self._backend_filter('HYPERSCAN_AVAILABLE')
+        self.assertTrue(content_filter._hs_databases)
+        self._assert_matches_fallback(content_filter)
+
+    def test_re2_pattern_set_matches_fallback(self):
+        """Test that the RE2 pattern set prefilter keeps exactly the pattern hits re finds."""
+        content_filter = self._backend_filter('RE2_AVAILABLE')
+        self.assertTrue(content_filter._pattern_sets)
+        self._assert_matches_fallback(content_filter)
+
+    def test_automaton_matches_fallback(self):
+        """Test that the shared Aho-Corasick term automaton finds exactly what the regex fallback finds."""
+        content_filter = self._backend_filter('AHOCORASICK_AVAILABLE')
+        self.assertIsNotNone(content_filter._term_automaton)
+        self._assert_matches_fallback(content_filter)
+
+    def test_marisa_trie_matches_fallback(self):
+        """Test that plain words stored in a marisa-trie match the same tokens as the word sets."""
+        content_filter = self._backend_filter('MARISA_TRIE_AVAILABLE')
+        self.assertTrue(all(isinstance(words, content_filter_module.marisa_trie.Trie)
+                            for words in content_filter._token_words.values() if words))
+        self._assert_matches_fallback(content_filter)
+
+
+class TestContentFilterBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        config = {
+            'content_filter': {
+                'filtered_words': ['badword'],
+                'filtered_phrases': [],
+                'filter_workers': 3
+            },
+            'paths': {
+                'bin': os.path.join(self.temp_dir, 'bin'),
+                'playable': os.path.join(self.temp_dir, 'playable'),
+                'recordings': os.path.join(self.temp_dir, 'recordings'),
+                'temp': os.path.join(self.temp_dir, 'temp')
+            }
+        }
+        self.content_filter = ContentFilter(config)
+
+    def tearDown(self):
+        self.content_filter.cleanup()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_items(self):
+        items = []
+        for i in range(8):
+            audio_path = os.path.join(self.temp_dir, f'clip_{i}.wav')
+            with open(audio_path, 'wb') as f:
+                f.write(b'RIFF' + bytes(64))
+            transcript = 'this is a badword' if i % 2 else 'this is a good word'
+            items.append((i % 5 + 1, audio_path, transcript, 0.9, {'index': i}))
+        return items
+
+    def test_batch_results_keep_input_order(self):
+        """Test that batch results line up with their items."""
+        items = self._make_items()
+        results = self.content_filter.process_transcript_batch(items)
+
+        self.assertEqual(len(results), len(items))
+        for item, result in zip(items, results):
+            self.assertEqual(result['channel'], item[0])
+            self.assertEqual(result['original_audio_file'], item[1])
+            self.assertEqual(result['original_metadata'], item[4])
+
+    def test_batch_routes_files(self):
+        """Test that batch items are moved to the playable or bin tree of their channel."""
+        items = self._make_items()
+        results = self.content_filter.process_transcript_batch(items)
+
+        for item, result in zip(items, results):
+            audio_path = result['destination_paths']['audio']
+            tree = 'playable' if result['is_acceptable'] else 'bin'
+            self.assertEqual(result['is_acceptable'], 'badword' not in item[2])
+            self.assertTrue(audio_path.startswith(os.path.join(self.temp_dir, tree, f'channel_{item[0]}')))
+            self.assertTrue(os.path.exists(audio_path))
+            self.assertFalse(os.path.exists(item[1]))
+        self.assertEqual(len({result['destination_paths']['audio'] for result in results}), len(items))
+
+    def test_batch_updates_statistics(self):
+        """Test that a batch counts every item once."""
+        items = self._make_items()
+        self.content_filter.process_transcript_batch(items)
+        stats = self.content_filter.get_filter_statistics()
+
+        self.assertEqual(stats['total_processed'], 8)
+        self.assertEqual(stats['total_accepted'], 4)
+        self.assertEqual(stats['total_filtered'], 4)
+        self.assertEqual(stats['by_channel']['channel_1']['processed'], 2)
+
+    def test_batch_audit_lines_respect_rotation(self):
+        """Test that batch audit entries go through the handler, so size-based rotation applies."""
+        log_path = os.path.join(self.temp_dir, 'audit.log')
+        handler = logging.handlers.RotatingFileHandler(log_path, maxBytes=1024, backupCount=20)
+        audit_logger = self.content_filter.audit_logger
+        saved_handlers = audit_logger.handlers[:]
+        audit_logger.handlers = [handler]
+        try:
+            self.content_filter.process_transcript_batch(self._make_items())
+        finally:
+            audit_logger.handlers = saved_handlers
+            handler.close()
+
+        log_files = [path for path in os.listdir(self.temp_dir) if path.startswith('audit.log')]
+        self.assertGreater(len(log_files), 1)
+        lines = []
+        for name in log_files:
+            path = os.path.join(self.temp_dir, name)
+            with open(path) as f:
+                file_lines = f.read().splitlines()
+            # Only a file holding a single entry larger than maxBytes may overshoot
+            if os.path.getsize(path) > 1024:
+                self.assertEqual(len(file_lines), 1)
+            lines.extend(file_lines)
+        self.assertEqual(len(lines), 8)
+
+    def test_batch_from_filter_worker_runs_inline(self):
+        """Test that a batch submitted from a filter pool thread does not wait on the pool."""
+        # With a single worker, waiting on the pool from inside would never finish
+        self.content_filter.cleanup()
+        self.content_filter = ContentFilter({
+            'content_filter': {'filtered_words': ['badword'], 'filter_workers': 1},
+            'paths': {'bin': os.path.join(self.temp_dir, 'bin'), 'playable': os.path.join(self.temp_dir, 'playable')}
+        })
+
+        items = self._make_items()
+        future = self.content_filter._filter_pool.submit(self.content_filter.process_transcript_batch, items)
+        results = future.result(timeout=30)
+        self.assertEqual([result['original_audio_file'] for result in results], [item[1] for item in items])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
+import threading
 import time
 import sys
 import os
@@ -41,5 +42,131 @@ class TestFileProcessingQueue(unittest.TestCase):
 
         queue.cleanup()
 
+class TestFileQueueBatching(unittest.TestCase):
+
+    def setUp(self):
+        self.speech_gates = {}
+        self.release_filter = threading.Event()
+        self.speech_calls = []
+        self.speech_processor = MagicMock()
+        self.speech_processor.process_audio_file.side_effect = self._speech
+        self.content_filter = MagicMock()
+        self.content_filter.process_transcript.side_effect = self._filter
+        self.content_filter.process_transcript_batch.side_effect = (
+            lambda items: [{'is_acceptable': True, 'audio_file': item[1]} for item in items]
+        )
+        config = {
+            'queue': {
+                'max_workers': 2,
+                'filter_batch_size': 3
+            }
+        }
+        self.queue = FileProcessingQueue(self.speech_processor, self.content_filter, config)
+
+    def tearDown(self):
+        for gate in self.speech_gates.values():
+            gate.set()
+        self.release_filter.set()
+        self.queue.cleanup()
+
+    def _speech(self, channel, audio_file, metadata):
+        """Speech stub that holds gated files until their gate is set."""
+        self.speech_calls.append(audio_file)
+        if audio_file in self.speech_gates:
+            self.speech_gates[audio_file].wait(5.0)
+        if audio_file.startswith('fail'):
+            return None
+        return {
+            'channel': channel,
+            'audio_file': audio_file,
+            'transcript': f'transcript of {audio_file}',
+            'confidence': 0.9,
+            'metadata': metadata
+        }
+
+    def _filter(self, channel, audio_file, transcript, confidence, metadata):
+        """Single-item filter stub that holds the filter until released."""
+        self.release_filter.wait(5.0)
+        return {'is_acceptable': True, 'audio_file': audio_file}
+
+    def _wait_until(self, condition, message):
+        deadline = time.time() + 5.0
+        while not condition():
+            if time.time() > deadline:
+                self.fail(message)
+            time.sleep(0.01)
+
+    def _wait_for_tasks(self, task_ids):
+        finished = (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value)
+        self._wait_until(
+            lambda: all(self.queue.get_task_status(task_id)['status'] in finished for task_id in task_ids),
+            "Queued tasks did not finish"
+        )
+
+    def _submit_while_filter_busy(self, audio_files):
+        """Hold the filter on a first task, transcribe the rest meanwhile, then release it."""
+        first_id = self.queue.submit_task(1, 'first.wav', {})
+        self._wait_until(lambda: self.content_filter.process_transcript.called, "First task never reached the filter")
+        task_ids = [self.queue.submit_task(1, audio_file, {}) for audio_file in audio_files]
+        self._wait_until(lambda: len(self.speech_calls) == len(audio_files) + 1, "Speech stalled behind the filter")
+        self.release_filter.set()
+        self._wait_for_tasks([first_id] + task_ids)
+        return first_id, task_ids
+
+    def test_tasks_taken_one_at_a_time(self):
+        """Test that a busy worker leaves queued tasks to the other workers instead of claiming them."""
+        self.release_filter.set()
+        self.speech_gates = {name: threading.Event() for name in ('slow_a.wav', 'slow_b.wav', 'slow_c.wav')}
+
+        # Occupy both workers, then queue more work behind them
+        slow_ids = [self.queue.submit_task(1, name, {}) for name in ('slow_a.wav', 'slow_b.wav')]
+        self._wait_until(lambda: len(self.speech_calls) == 2, "Workers did not start speech processing")
+        queued_ids = [self.queue.submit_task(1, name, {}) for name in ('slow_c.wav', 'd.wav', 'e.wav')]
+
+        # The first free worker takes only the next task
+        self.speech_gates['slow_a.wav'].set()
+        self._wait_until(lambda: 'slow_c.wav' in self.speech_calls, "Freed worker did not take the next task")
+        self.assertEqual(self.queue.task_queue.qsize(), 2)
+
+        # The other worker finishes the rest while slow_c is still in speech processing
+        self.speech_gates['slow_b.wav'].set()
+        self._wait_for_tasks(queued_ids[1:])
+        self.assertEqual(self.queue.get_task_status(queued_ids[0])['status'], TaskStatus.PROCESSING.value)
+
+        self.speech_gates['slow_c.wav'].set()
+        self._wait_for_tasks(slow_ids + queued_ids)
+        for task_id in slow_ids + queued_ids:
+            self.assertEqual(self.queue.get_task_status(task_id)['status'], TaskStatus.COMPLETED.value)
+
+    def test_transcripts_filtered_as_batches_while_filter_busy(self):
+        """Test that transcripts waiting on the filter are filtered together, capped at filter_batch_size."""
+        audio_files = [f'clip_{i}.wav' for i in range(5)]
+        first_id, task_ids = self._submit_while_filter_busy(audio_files)
+
+        # The lone first transcript takes the single-item path
+        self.content_filter.process_transcript.assert_called_once()
+        self.assertEqual(self.content_filter.process_transcript.call_args[0][1], 'first.wav')
+
+        batches = [call[0][0] for call in self.content_filter.process_transcript_batch.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [3, 2])
+        self.assertEqual(sorted(item[1] for batch in batches for item in batch), audio_files)
+        for item in batches[0]:
+            self.assertEqual(item[2], f'transcript of {item[1]}')
+
+        for task_id in [first_id] + task_ids:
+            self.assertEqual(self.queue.get_task_status(task_id)['status'], TaskStatus.COMPLETED.value)
+
+    def test_speech_failure_fails_only_its_task(self):
+        """Test that a speech failure leaves the other tasks' batch intact."""
+        _, task_ids = self._submit_while_filter_busy(['clip_0.wav', 'fail.wav', 'clip_1.wav'])
+
+        statuses = {task_id: self.queue.get_task_status(task_id)['status'] for task_id in task_ids}
+        self.assertEqual(statuses[task_ids[1]], TaskStatus.FAILED.value)
+        self.assertEqual(statuses[task_ids[0]], TaskStatus.COMPLETED.value)
+        self.assertEqual(statuses[task_ids[2]], TaskStatus.COMPLETED.value)
+
+        batch = self.content_filter.process_transcript_batch.call_args[0][0]
+        self.assertEqual(sorted(item[1] for item in batch), ['clip_0.wav', 'clip_1.wav'])
+
 if __name__ == '__main__':
     unittest.main()
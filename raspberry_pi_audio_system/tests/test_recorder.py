@@ -0,0 +1,267 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import shutil
+import sys
+import tempfile
+import time
+import wave
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mock pyaudio before importing the module that uses it
+with patch.dict('sys.modules', {'pyaudio': MagicMock()}):
+    from processing import recorder as recorder_module
+    from processing.recorder import AudioRecorder
+
+CHUNK_FRAMES = 256
+
+
+class FakeStream:
+    """Callback-mode input stream whose callback is driven by the test."""
+
+    def __init__(self):
+        self.active = False
+
+    def is_active(self):
+        return self.active
+
+    def start_stream(self):
+        self.active = True
+
+    def stop_stream(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+
+class TestAudioRecorder(unittest.TestCase):
+
+    def setUp(self):
+        pyaudio = recorder_module.pyaudio
+        pyaudio.paInt16 = 8
+        pyaudio.paInputOverflow = 2
+        pyaudio.paContinue = 0
+        pyaudio.get_sample_size.return_value = 2
+
+        self.temp_dir = tempfile.mkdtemp()
+        config = {
+            'audio': {
+                'sample_rate': 16000,
+                'chunk_size': CHUNK_FRAMES,
+                'min_recording_duration': 0,
+                'max_recording_duration': 30
+            },
+            'paths': {
+                kind: os.path.join(self.temp_dir, kind)
+                for kind in ('recordings', 'temp', 'playable', 'bin')
+            }
+        }
+        self.device_manager = MagicMock()
+        self.device_manager.create_input_stream.side_effect = lambda *args, **kwargs: FakeStream()
+        self.recorder = AudioRecorder(self.device_manager, config)
+        self.chunk_counter = 0
+
+    def tearDown(self):
+        self.recorder.cleanup()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _push_chunks(self, count):
+        """Feed numbered chunks through the input callback, as PortAudio would."""
+        pushed = bytearray()
+        for _ in range(count):
+            self.chunk_counter += 1
+            data = bytes([self.chunk_counter % 256, self.chunk_counter // 256 % 256]) * CHUNK_FRAMES
+            self.recorder._input_callback(data, CHUNK_FRAMES, {}, 0)
+            pushed += data
+        return bytes(pushed)
+
+    def _read_frames(self, path):
+        with wave.open(path, 'rb') as wav_file:
+            return wav_file.readframes(wav_file.getnframes())
+
+    def _temp_recordings(self):
+        return sorted(os.listdir(os.path.join(self.temp_dir, 'temp')))
+
+    def _wait_for_bytes(self, channel, count):
+        deadline = time.time() + 5.0
+        while self.recorder._channel_slots[channel].bytes_recorded < count:
+            if time.time() > deadline:
+                self.fail("Recording worker did not drain the ring")
+            time.sleep(0.01)
+
+    def test_callback_audio_written_in_order(self):
+        """Test that audio pushed through the input callback reaches each session's WAV unchanged."""
+        self.assertTrue(self.recorder.start_recording(1))
+        first_pushed = self._push_chunks(5)
+        self.assertTrue(self.recorder.start_recording(2))
+        shared = self._push_chunks(10)
+        second_path = self.recorder.stop_recording(2)
+        last_pushed = self._push_chunks(5)
+        first_path = self.recorder.stop_recording(1)
+
+        self.assertEqual(self._read_frames(second_path), shared)
+        self.assertEqual(self._read_frames(first_path), first_pushed + shared + last_pushed)
+        self.assertEqual(self.device_manager.create_input_stream.call_count, 1)
+
+    def test_frame_count_counts_audio_frames(self):
+        """Test that the reported frame count is audio frames, however the ring was drained."""
+        self.assertTrue(self.recorder.start_recording(1))
+        for _ in range(4):
+            self._push_chunks(5)
+            time.sleep(0.02)
+        self._wait_for_bytes(1, 20 * CHUNK_FRAMES * 2)
+
+        session_info = self.recorder.get_recording_status(1)['session_info']
+        self.assertEqual(session_info['frames_count'], 20 * CHUNK_FRAMES)
+        self.assertEqual(self.recorder._channel_slots[1].get_metadata()['frame_count'], 20 * CHUNK_FRAMES)
+        self.recorder.stop_recording(1)
+
+    def _failing_thread_start(self):
+        """Patch the recorder's threading so the worker thread fails to start."""
+        worker = MagicMock()
+        worker.start.side_effect = RuntimeError("can't start new thread")
+        return patch.object(recorder_module, 'threading', MagicMock(Thread=MagicMock(return_value=worker)))
+
+    def test_failed_start_removes_temp_file_and_buffer(self):
+        """Test that a start failing after the session is built leaves no temp file or borrowed buffer."""
+        pool_size = self.recorder.buffer_pool._free.qsize()
+        with self._failing_thread_start():
+            self.assertFalse(self.recorder.start_recording(1))
+
+        self.assertEqual(self._temp_recordings(), [])
+        self.assertEqual(self.recorder.buffer_pool._free.qsize(), pool_size)
+        self.assertEqual(self.recorder._capture_rings, ())
+        self.assertIsNone(self.recorder._channel_slots[1])
+
+    def test_failed_start_while_streaming_retires_buffer(self):
+        """Test that a failed start beside a running session retires its buffer until the next callback."""
+        pool_size = self.recorder.buffer_pool._free.qsize()
+        self.assertTrue(self.recorder.start_recording(1))
+        first_pushed = self._push_chunks(5)
+
+        with self._failing_thread_start():
+            self.assertFalse(self.recorder.start_recording(2))
+
+        self.assertEqual(len(self._temp_recordings()), 1)
+        self.assertTrue(self._temp_recordings()[0].startswith('recording_ch1_'))
+        self.assertEqual(self.recorder._retired_buffers.qsize(), 1)
+
+        last_pushed = self._push_chunks(5)
+        self.assertEqual(self.recorder.buffer_pool._free.qsize(), pool_size - 1)
+        first_path = self.recorder.stop_recording(1)
+        self.assertEqual(self._read_frames(first_path), first_pushed + last_pushed)
+        self.assertEqual(self.recorder.buffer_pool._free.qsize(), pool_size)
+
+    def test_back_to_back_sessions_reuse_ring_buffers(self):
+        """Test that sessions borrow ring buffers from the pool and return them intact."""
+        pool_size = self.recorder.buffer_pool._free.qsize()
+        ring_buffers = set()
+
+        for _ in range(3):
+            self.assertTrue(self.recorder.start_recording(1))
+            ring_buffers.add(id(self.recorder._channel_slots[1].ring.buffer))
+            pushed = self._push_chunks(20)
+            path = self.recorder.stop_recording(1)
+
+            self.assertEqual(self._read_frames(path), pushed)
+            # The stream closed with the last session, so the buffer is back at once
+            self.assertEqual(self.recorder.buffer_pool._free.qsize(), pool_size)
+
+        self.assertEqual(self.device_manager.create_input_stream.call_count, 3)
+        self.assertLessEqual(len(ring_buffers), pool_size)
+
+    def test_buffer_released_after_next_callback_while_streaming(self):
+        """Test that a finished session's buffer returns to the pool only after the next callback."""
+        pool_size = self.recorder.buffer_pool._free.qsize()
+        self.assertTrue(self.recorder.start_recording(1))
+        first_pushed = self._push_chunks(5)
+
+        self.assertTrue(self.recorder.start_recording(2))
+        shared = self._push_chunks(10)
+        second_path = self.recorder.stop_recording(2)
+
+        # Channel 1 keeps the stream running; a callback may still hold the old rings
+        self.assertEqual(self.recorder.buffer_pool._free.qsize(), pool_size - 2)
+        self.assertEqual(self.recorder._retired_buffers.qsize(), 1)
+
+        last_pushed = self._push_chunks(5)
+        self.assertEqual(self.recorder.buffer_pool._free.qsize(), pool_size - 1)
+        self.assertTrue(self.recorder._retired_buffers.empty())
+
+        # A new session may now reuse the buffer without disturbing channel 1
+        self.assertTrue(self.recorder.start_recording(3))
+        third_pushed = self._push_chunks(5)
+        third_path = self.recorder.stop_recording(3)
+        first_path = self.recorder.stop_recording(1)
+
+        self.assertEqual(self._read_frames(second_path), shared)
+        self.assertEqual(self._read_frames(third_path), third_pushed)
+        self.assertEqual(self._read_frames(first_path), first_pushed + shared + last_pushed + third_pushed)
+        self.assertEqual(self.recorder.buffer_pool._free.qsize(), pool_size)
+
+    def test_force_stop_joins_worker_outside_lock(self):
+        """Test that force-stopping joins the worker without holding the recording lock."""
+        pool_size = self.recorder.buffer_pool._free.qsize()
+        self.assertTrue(self.recorder.start_recording(1))
+        session = self.recorder._channel_slots[1]
+        worker = session.recording_thread
+        lock_held_during_join = []
+
+        def join(timeout=None):
+            lock_held_during_join.append(self.recorder.recording_lock.locked())
+            worker.join(timeout)
+
+        session.recording_thread = MagicMock(is_alive=worker.is_alive, join=join)
+        self._push_chunks(5)
+        self.recorder._force_stop_recording(1, "test")
+
+        self.assertEqual(lock_held_during_join, [False])
+        self.assertIsNone(self.recorder._channel_slots[1])
+        self.assertEqual(self.recorder.channel_states[1].value, 'error')
+        self.assertEqual(os.listdir(os.path.join(self.temp_dir, 'temp')), [])
+        self.assertEqual(self.recorder.buffer_pool._free.qsize(), pool_size)
+
+    def test_metadata_cache_invalidated_by_mtime_and_size(self):
+        """Test that cached recording metadata is reused until the file's mtime or size changes."""
+        channel_dir = os.path.join(self.temp_dir, 'recordings', 'channel_1')
+        os.makedirs(channel_dir, exist_ok=True)
+        path = os.path.join(channel_dir, 'test_recording.wav')
+
+        def write_wav(sample_rate, frames):
+            with wave.open(path, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(sample_rate)
+                wav_file.writeframes(bytes(frames * 2))
+
+        write_wav(16000, 1600)
+        original = os.stat(path)
+        metadata = self.recorder.get_recording_metadata(path)
+        self.assertEqual(metadata['sample_rate'], 16000)
+        self.assertEqual(metadata['channel'], 1)
+
+        # Same size and mtime: the cached parse is returned
+        write_wav(8000, 1600)
+        os.utime(path, ns=(original.st_atime_ns, original.st_mtime_ns))
+        self.assertEqual(self.recorder.get_recording_metadata(path)['sample_rate'], 16000)
+
+        # A new mtime invalidates the entry
+        os.utime(path, ns=(original.st_atime_ns, original.st_mtime_ns + 1000000))
+        self.assertEqual(self.recorder.get_recording_metadata(path)['sample_rate'], 8000)
+
+        # So does a new size, even with the mtime restored
+        write_wav(8000, 3200)
+        os.utime(path, ns=(original.st_atime_ns, original.st_mtime_ns + 1000000))
+        metadata = self.recorder.get_recording_metadata(path)
+        self.assertEqual(metadata['frames'], 3200)
+        self.assertEqual(metadata['size_bytes'], os.path.getsize(path))
+
+        # Removed files drop out of the cache
+        os.remove(path)
+        self.assertIsNone(self.recorder.get_recording_metadata(path))
+        self.assertNotIn(path, self.recorder._metadata_cache)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,15 +6,95 @@ across the audio processing pipeline with channel mapping preservation.
 """
 
 import os
+import errno
 import shutil
 import logging
 import glob
+import threading
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 import wave
 
 
+# Link errors meaning "no hard link possible here", not "name taken"
+_NO_LINK_ERRNOS = (errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EMLINK)
+
+
+def _claim_first_free(directory: str, base: str, ext: str, claim) -> str:
+    """Call claim on base + ext, base_1 + ext, ... until it does not raise FileExistsError."""
+    counter = 0
+    while True:
+        suffix = f"_{counter}" if counter else ""
+        path = os.path.join(directory, f"{base}{suffix}{ext}")
+        try:
+            claim(path)
+        except FileExistsError:
+            counter += 1
+            continue
+        return path
+
+
+def _create_empty(path: str):
+    """Create an empty file, failing if the path exists."""
+    os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+
+
+def claim_unique_path(source_path: str, directory: str, base: str, ext: str, copy: bool = False) -> str:
+    """
+    Move or copy a file to the first free name in a directory.
+    
+    Names are tried as base + ext, then base_1 + ext, base_2 + ext and so
+    on. Each attempt hard-links the file to the name, which fails if the
+    name is taken, so one syscall both checks and claims it: concurrent
+    callers (threads or processes) never get the same name, nothing is
+    overwritten, and the final name never shows an empty or partial file.
+    Copies, and moves onto another filesystem, are first written to a hidden
+    partial file in the directory, which is then linked into place.
+    
+    Args:
+        source_path: File to move or copy
+        directory: Destination directory
+        base: File name without extension
+        ext: File extension including the dot
+        copy: Leave the source file in place
+        
+    Returns:
+        Final path of the file
+    """
+    if not copy:
+        try:
+            dest_path = _claim_first_free(directory, base, ext, lambda path: os.link(source_path, path))
+        except OSError as e:
+            if e.errno not in _NO_LINK_ERRNOS:
+                raise
+        else:
+            os.unlink(source_path)
+            return dest_path
+    
+    partial_path = os.path.join(directory, f".{base}{ext}.{os.getpid()}.{threading.get_ident()}.part")
+    try:
+        shutil.copy2(source_path, partial_path)
+        try:
+            dest_path = _claim_first_free(directory, base, ext, lambda path: os.link(partial_path, path))
+        except OSError as e:
+            if e.errno not in _NO_LINK_ERRNOS:
+                raise
+            # No hard links on the destination filesystem (e.g. FAT); an
+            # exclusively created placeholder claims the name instead
+            dest_path = _claim_first_free(directory, base, ext, _create_empty)
+            os.replace(partial_path, dest_path)
+    finally:
+        try:
+            os.remove(partial_path)
+        except OSError:
+            pass
+    
+    if not copy:
+        os.remove(source_path)
+    return dest_path
+
+
 class FileManager:
     """
     File management system for audio recording and processing.
@@ -192,10 +272,6 @@ class FileManager:
             New file path or None if move failed
         """
         try:
-            if not os.path.exists(source_path):
-                self.logger.error(f"Source file not found: {source_path}")
-                return None
-            
             os.makedirs(destination_dir, exist_ok=True)
             
             if preserve_name:
@@ -206,18 +282,17 @@ class FileManager:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"{base}_{timestamp}{ext}"
             
-            dest_path = os.path.join(destination_dir, filename)
+            base, ext = os.path.splitext(filename)
             
             # Handle filename conflicts
-            if os.path.exists(dest_path):
-                base, ext = os.path.splitext(filename)
-                counter = 1
-                while os.path.exists(dest_path):
-                    new_filename = f"{base}_{counter}{ext}"
-                    dest_path = os.path.join(destination_dir, new_filename)
-                    counter += 1
-            
-            shutil.move(source_path, dest_path)
+            try:
+                dest_path = claim_unique_path(source_path, destination_dir, base, ext)
+            except FileNotFoundError:
+                if os.path.exists(source_path):
+                    raise
+                self.logger.error(f"Source file not found: {source_path}")
+                return None
+            
             self.logger.info(f"Moved file from {source_path} to {dest_path}")
             return dest_path
             
@@ -245,18 +320,10 @@ class FileManager:
             os.makedirs(destination_dir, exist_ok=True)
             
             filename = new_name if new_name else os.path.basename(source_path)
-            dest_path = os.path.join(destination_dir, filename)
+            base, ext = os.path.splitext(filename)
             
             # Handle filename conflicts
-            if os.path.exists(dest_path):
-                base, ext = os.path.splitext(filename)
-                counter = 1
-                while os.path.exists(dest_path):
-                    new_filename = f"{base}_{counter}{ext}"
-                    dest_path = os.path.join(destination_dir, new_filename)
-                    counter += 1
-            
-            shutil.copy2(source_path, dest_path)
+            dest_path = claim_unique_path(source_path, destination_dir, base, ext, copy=True)
             self.logger.info(f"Copied file from {source_path} to {dest_path}")
             return dest_path
             
@@ -369,27 +436,27 @@ class FileManager:
             
             # Manage playable files
             playable_dir = self.get_channel_directory(channel, 'playable')
-            playable_files = glob.glob(os.path.join(playable_dir, "*.wav"))
+            playable_files = self._list_wav_files(playable_dir)
             
             if len(playable_files) > self.max_files_per_channel:
                 # Sort by modification time (oldest first)
-                playable_files.sort(key=lambda x: os.path.getmtime(x))
+                playable_files.sort()
                 files_to_remove = len(playable_files) - self.max_files_per_channel
                 
-                for file_path in playable_files[:files_to_remove]:
+                for _, file_path in playable_files[:files_to_remove]:
                     if self.delete_file(file_path):
                         results['playable_removed'] += 1
             
             # Manage bin files
             bin_dir = self.get_channel_directory(channel, 'bin')
-            bin_files = glob.glob(os.path.join(bin_dir, "*.wav"))
+            bin_files = self._list_wav_files(bin_dir)
             
             if len(bin_files) > self.max_files_per_channel:
                 # Sort by modification time (oldest first)
-                bin_files.sort(key=lambda x: os.path.getmtime(x))
+                bin_files.sort()
                 files_to_remove = len(bin_files) - self.max_files_per_channel
                 
-                for file_path in bin_files[:files_to_remove]:
+                for _, file_path in bin_files[:files_to_remove]:
                     if self.delete_file(file_path):
                         results['bin_removed'] += 1
             
@@ -402,6 +469,43 @@ class FileManager:
             self.logger.error(f"Channel {channel} file management failed: {e}")
             return {'playable_removed': 0, 'bin_removed': 0}
     
+    def _list_wav_files(self, directory: str) -> List[Tuple[float, str]]:
+        """
+        List WAV files in a directory with their modification times.
+        
+        Uses a single os.scandir pass so the mtime comes from the directory
+        entry instead of a separate stat call per file.
+        
+        Args:
+            directory: Directory to scan
+            
+        Returns:
+            List of (mtime, path) tuples
+        """
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.name.endswith('.wav'):
+                        continue
+                    try:
+                        if entry.is_file():
+                            files.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return files
+    
+    def _count_wav_files(self, directory: str) -> int:
+        """Count WAV files in a directory with one scandir pass and no stat calls."""
+        try:
+            with os.scandir(directory) as entries:
+                return sum(1 for entry in entries
+                           if entry.name.endswith('.wav') and not entry.name.startswith('.'))
+        except FileNotFoundError:
+            return 0
+    
     def backup_channel_files(self, channel: int) -> bool:
         """
         Backup files for specific channel.
@@ -570,8 +674,8 @@ class FileManager:
                 playable_dir = self.get_channel_directory(channel, 'playable')
                 bin_dir = self.get_channel_directory(channel, 'bin')
                 
-                playable_count = len(glob.glob(os.path.join(playable_dir, "*.wav")))
-                bin_count = len(glob.glob(os.path.join(bin_dir, "*.wav")))
+                playable_count = self._count_wav_files(playable_dir)
+                bin_count = self._count_wav_files(bin_dir)
                 
                 status['channel_file_counts'][f'channel_{channel}'] = {
                     'playable': playable_count,